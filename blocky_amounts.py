@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Spoločné spracovanie súm pre konvertory Blocky
+
+Modul obsahuje predkompilované regulárne výrazy a funkcie na prečítanie
+sumy z textu bunky a na jej formátovanie do výstupu. Text bunky sa
+prechádza iba raz a správne sa rozpoznajú oddeľovače tisícov:
+
+    "12,50 €"      -> 12.5
+    "-10"          -> -10.0
+    "1 234,56"     -> 1234.56
+    "1.234,56"     -> 1234.56
+    "1,234.56"     -> 1234.56
+    "1.234.567"    -> 1234567.0
+    "12,500"       -> 12.5     (jediný oddeľovač bez ďalšej časti je desatinný)
+
+Celkové sumy sa počítajú v celých centoch (int), nie sčítaním float
+hodnôt. Suma každej položky sa zaokrúhli na centy presne tak, ako je
+zapísaná vo výstupe, takže celková suma sa vždy rovná súčtu zapísaných
+položiek a pri desaťtisícoch riadkov nevzniká chyba zaokrúhľovania.
+"""
+
+import re
+
+
+# Prvé číslo v texte: voliteľné znamienko, celá časť (s oddeľovačmi tisícov
+# po trojiciach číslic alebo bez nich) a voliteľná desatinná časť
+AMOUNT_PATTERN = re.compile(
+    r"""
+    (?P<sign>[-\u2212])?[ \u00a0]*
+    (?P<integer>
+        \d{1,3}(?P<group>[ \u00a0\u202f.,'])\d{3}(?!\d)(?:(?P=group)\d{3}(?!\d))*
+        |\d+
+    )
+    (?:(?P<decimal>[.,])(?P<fraction>\d+))?
+    """,
+    re.VERBOSE,
+)
+
+# Položka v texte odseku vo formáte "popis: suma" alebo "popis: suma €"
+PARAGRAPH_ITEM_PATTERN = re.compile(r'([^:]+):\s*([\-]?\d+[.,]?\d*)\s*€?')
+
+# Suma za dvojbodkou položky v texte odseku (časť PARAGRAPH_ITEM_PATTERN
+# za "popis:"), porovnáva sa ukotvene na zadanej pozícii
+PARAGRAPH_AMOUNT_PATTERN = re.compile(r'\s*([\-]?\d+[.,]?\d*)\s*€?')
+
+# Ľubovoľná číslica (rovnaká trieda ako \d v PARAGRAPH_ITEM_PATTERN)
+DIGIT_PATTERN = re.compile(r'\d')
+
+# Hodnota sumy pre prázdne bunky (NaN), ktoré nemajú sumu v centoch
+MISSING_CENTS = -2 ** 63
+
+# Hodnoty sumy pre nekonečno (inf, -inf), ktoré tiež nemá sumu v centoch
+INFINITY_CENTS = 2 ** 63 - 1
+NEGATIVE_INFINITY_CENTS = -INFINITY_CENTS
+INFINITE_CENTS = (INFINITY_CENTS, NEGATIVE_INFINITY_CENTS)
+
+
+def parse_amount_parts(text):
+    """
+    Nájde prvé číslo v texte a rozdelí ho na znamienko, celú a desatinnú časť.
+    
+    Args:
+        text (str): Text obsahujúci sumu
+    
+    Returns:
+        tuple: (záporné, číslice celej časti, číslice desatinnej časti)
+               alebo None, ak text neobsahuje číslo
+    """
+    try:
+        match = AMOUNT_PATTERN.search(text)
+    except TypeError:
+        return None
+    if match is None:
+        return None
+    
+    negative = match.group("sign") is not None
+    integer = match.group("integer")
+    group = match.group("group")
+    fraction = match.group("fraction") or ""
+    
+    if group:
+        groups = integer.split(group)
+        if group in ".," and len(groups) == 2 and match.group("decimal") is None:
+            # Jediný oddeľovač bez ďalšej časti považujeme za desatinný ("12,500")
+            return negative, groups[0], groups[1]
+        integer = "".join(groups)
+    
+    return negative, integer, fraction
+
+
+def parse_amount(text):
+    """
+    Prečíta sumu z textu bunky.
+    
+    Args:
+        text (str): Text obsahujúci číselnú hodnotu
+    
+    Returns:
+        float: Suma alebo None, ak text neobsahuje číslo
+    """
+    parts = parse_amount_parts(text)
+    if parts is None:
+        return None
+    
+    negative, integer, fraction = parts
+    value = float(f"{integer}.{fraction}" if fraction else integer)
+    return -value if negative else value
+
+
+def parse_amount_cents(text):
+    """
+    Prečíta sumu z textu bunky priamo v centoch.
+    
+    Suma s najviac dvoma desatinnými miestami sa prevedie na centy bez
+    prevodu cez float. Viac desatinných miest sa zaokrúhli rovnako ako
+    v ostatných konvertoroch, teda formátovaním float hodnoty cez "{:.2f}"
+    ("0.165" -> 17 centov, pretože float 0.165 je o niečo väčší), takže
+    všetky konvertory zapíšu pre rovnaký text rovnakú sumu.
+    
+    Args:
+        text (str): Text obsahujúci číselnú hodnotu
+    
+    Returns:
+        int: Suma v centoch alebo None, ak text neobsahuje číslo
+    """
+    parts = parse_amount_parts(text)
+    if parts is None:
+        return None
+    
+    negative, integer, fraction = parts
+    if len(fraction.rstrip("0")) > 2:
+        cents = amount_to_cents(float(f"{integer}.{fraction}"))
+    else:
+        cents = int(integer) * 100 + int(fraction[:2].ljust(2, "0"))
+    
+    return -cents if negative else cents
+
+
+def has_paragraph_item_marks(text):
+    """
+    Rýchlo overí, či text odseku môže obsahovať položku "popis: suma".
+    
+    Args:
+        text (str): Text odseku
+    
+    Returns:
+        bool: False, ak text neobsahuje dvojbodku alebo číslicu
+    """
+    return ":" in text and DIGIT_PATTERN.search(text) is not None
+
+
+def find_paragraph_items(text):
+    """
+    Nájde položky "popis: suma" v texte odseku.
+    
+    Výsledok je rovnaký ako PARAGRAPH_ITEM_PATTERN.findall(text), text sa
+    však prejde iba raz. Regulárny výraz pri neúspechu skúša každú ďalšiu
+    začiatočnú pozíciu a znova prechádza "[^:]+" až k tej istej dvojbodke,
+    takže dlhý riadok bez dvojbodky za sumou trvá kvadraticky dlho. Popis
+    položky vždy siaha po najbližšiu dvojbodku, preto stačí za každou
+    dvojbodkou ukotvene porovnať PARAGRAPH_AMOUNT_PATTERN a pri neúspechu
+    pokračovať až za ňou. Odseky bez dvojbodky alebo bez číslice sa
+    vylúčia bez porovnávania.
+    
+    Args:
+        text (str): Text odseku
+    
+    Returns:
+        list: Dvojice (popis, text sumy)
+    """
+    if not has_paragraph_item_marks(text):
+        return []
+    
+    items = []
+    match_amount = PARAGRAPH_AMOUNT_PATTERN.match
+    position = 0
+    while True:
+        colon = text.find(":", position)
+        if colon < 0:
+            return items
+        if colon > position:
+            match = match_amount(text, colon + 1)
+            if match is not None:
+                items.append((text[position:colon], match.group(1)))
+                position = match.end()
+                continue
+        position = colon + 1
+
+
+def format_amount(amount):
+    """
+    Naformátuje sumu pre výstup Blocky (dve desatinné miesta, desatinná čiarka).
+    
+    Args:
+        amount (float): Suma
+    
+    Returns:
+        str: Naformátovaná suma, napr. "-12,50"
+    """
+    return f"{amount:.2f}".replace('.', ',')
+
+
+def format_amount_cents(amount):
+    """
+    Naformátuje sumu pre výstup Blocky a zároveň ju prevedie na centy.
+    
+    Centy sa získajú z naformátovaného textu, takže presne zodpovedajú
+    sume zapísanej vo výstupe.
+    
+    Args:
+        amount (float): Suma
+    
+    Returns:
+        tuple: (naformátovaná suma, suma v centoch, MISSING_CENTS pre NaN
+               alebo INFINITY_CENTS a NEGATIVE_INFINITY_CENTS pre nekonečno)
+    """
+    text = f"{amount:.2f}"
+    if text[-3:-2] != ".":
+        if text == "inf":
+            return text, INFINITY_CENTS
+        if text == "-inf":
+            return text, NEGATIVE_INFINITY_CENTS
+        return text, MISSING_CENTS
+    return text.replace('.', ','), int(text.replace('.', ''))
+
+
+def amount_to_cents(amount):
+    """
+    Prevedie sumu na celé centy rovnako, ako je zaokrúhlená v textovom výstupe.
+    
+    Args:
+        amount (float): Suma
+    
+    Returns:
+        int: Suma v centoch, MISSING_CENTS pre NaN alebo hodnota z INFINITE_CENTS
+    """
+    return format_amount_cents(amount)[1]
+
+
+def add_cents(total_cents, cents):
+    """
+    Pripočíta sumu v centoch k celkovej sume.
+    
+    Prázdna suma (MISSING_CENTS) spôsobí prázdnu celkovú sumu a nekonečno
+    nekonečnú celkovú sumu, rovnako ako pri float súčte (inf + -inf = NaN).
+    
+    Args:
+        total_cents (int): Doterajšia celková suma v centoch
+        cents (int): Pripočítaná suma v centoch
+    
+    Returns:
+        int: Nová celková suma v centoch
+    """
+    if cents == MISSING_CENTS or total_cents == MISSING_CENTS:
+        return MISSING_CENTS
+    if cents in INFINITE_CENTS or total_cents in INFINITE_CENTS:
+        infinities = {value for value in (total_cents, cents) if value in INFINITE_CENTS}
+        return infinities.pop() if len(infinities) == 1 else MISSING_CENTS
+    return total_cents + cents
+
+
+def format_cents(cents, separator=","):
+    """
+    Naformátuje sumu v centoch ako v textovom výstupe Blocky ("-12,50").
+    
+    Args:
+        cents (int): Suma v centoch
+        separator (str): Desatinný oddeľovač (súhrny používajú bodku)
+    
+    Returns:
+        str: Naformátovaná suma ("nan" pre MISSING_CENTS, "inf" a "-inf" pre nekonečno)
+    """
+    if cents == MISSING_CENTS:
+        return "nan"
+    if cents == INFINITY_CENTS:
+        return "inf"
+    if cents == NEGATIVE_INFINITY_CENTS:
+        return "-inf"
+    sign = "-" if cents < 0 else ""
+    whole, fraction = divmod(abs(cents), 100)
+    return f"{sign}{whole}{separator}{fraction:02d}"
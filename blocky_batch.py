@@ -0,0 +1,507 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Dávková konverzia dokumentov pre aplikáciu Blocky
+
+Tento skript skonvertuje všetky Excel (.xlsx, .xls) a Word (.docx) súbory
+z adresára alebo podľa vzoru (glob) naraz. Súbory sa spracujú paralelne
+v skupine procesov, pričom každý proces načíta pandas a python-docx iba raz.
+Pre každý vstupný súbor sa vytvorí jeden výstupný súbor a do výstupného
+adresára sa zapíše súhrnný manifest vo formáte JSON. Chyba v jednom súbore
+nepreruší spracovanie ostatných.
+
+Použitie:
+    python blocky_batch.py vstup výstupný_adresár [prepínače]
+
+Prepínače:
+    --converter=auto       - Konvertor podľa prípony súboru (predvolené)
+    --converter=excel      - excel_to_blocky.py
+    --converter=word       - word_to_blocky.py
+    --converter=formatter  - word_to_blocky_formatter.py
+    --workers=N            - Počet paralelných procesov (predvolene počet jadier)
+    --excel-engine=stream  - Spôsob načítania Excel súborov (pozri excel_to_blocky.py)
+    --word-engine=xml      - Spôsob načítania Word dokumentov (pozri word_to_blocky.py)
+    --all-tables           - Konvertor formatter spracuje všetky tabuľky dokumentu
+    --sheets=all           - Konvertor excel spracuje všetky (alebo vybrané) hárky
+    --description-column=Popis, --amount-column=Suma
+                           - Stĺpce Excel súborov podľa názvu v hlavičke
+    --binary               - Ku každému výstupu zapíše aj binárny súbor .blkb
+    --manifest=cesta       - Cesta k manifestu (predvolene výstupný_adresár/manifest.json)
+    --metrics              - Do manifestu zapíše čas a pamäť fáz každej konverzie
+                             (pozri blocky_metrics.py)
+    --async                - Prekrýva čítanie vstupov, konverziu a zápis výstupov
+                             (pre súbory na sieťovom disku, pozri blocky_pipeline.py)
+    --prefetch=N           - Počet vopred načítaných súborov v režime --async
+    --cache                - Nezmenené súbory sa vytvoria z vyrovnávacej pamäte
+                             (ďalšie prepínače pozri v blocky_cache.py)
+    --dedup                - Konvertory excel a word vynechajú položky vytvorené
+                             pri skoršej konverzii (--dedup-index=cesta,
+                             --date-column=Dátum; pozri blocky_dedup.py).
+                             Preskočené položky sú vo výpisoch v manifeste.
+                             Index sa uzamkne iba na uloženie položiek po
+                             konverzii súboru, súbory konvertované súbežne
+                             sa však navzájom nevidia: rovnaká položka v dvoch
+                             takých súboroch zostane v oboch (s upozornením).
+                             Úplnú kontrolu v rámci dávky dáva --workers=1.
+
+Príklady:
+    python blocky_batch.py C:\\Doklady\\2025 C:\\Doklady\\blocky
+    python blocky_batch.py "C:\\Doklady\\2025\\*.docx" C:\\Doklady\\blocky --converter=formatter
+"""
+
+import sys
+import os
+import io
+import glob
+import json
+import time
+from contextlib import redirect_stdout
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+
+from blocky_cli import parse_arguments
+from blocky_cache import cache_from_options, CACHE_ERRORS
+from blocky_dedup import dedup_from_options
+from blocky_metrics import start_metrics, stop_metrics
+
+
+# Podporované prípony a predvolený konvertor pre každú z nich
+CONVERTERS_BY_EXTENSION = {
+    ".xlsx": "excel",
+    ".xls": "excel",
+    ".docx": "word",
+}
+
+CONVERTERS = ("auto", "excel", "word", "formatter")
+
+
+def collect_input_files(source):
+    """
+    Nájde vstupné súbory v adresári alebo podľa vzoru.
+    
+    Args:
+        source (str): Adresár alebo vzor (napr. "doklady/*.xlsx")
+    
+    Returns:
+        list: Zoradený zoznam ciest k podporovaným súborom
+    """
+    if os.path.isdir(source):
+        paths = [os.path.join(source, name) for name in os.listdir(source)]
+    else:
+        paths = glob.glob(source, recursive=True)
+    
+    files = []
+    for path in paths:
+        name = os.path.basename(path)
+        extension = os.path.splitext(name)[1].lower()
+        # Dočasné súbory Office (~$subor.xlsx) preskočíme
+        if name.startswith("~$") or extension not in CONVERTERS_BY_EXTENSION:
+            continue
+        if os.path.isfile(path):
+            files.append(path)
+    
+    return sorted(files)
+
+
+def detect_converter(input_file, converter="auto"):
+    """
+    Určí konvertor pre vstupný súbor.
+    
+    Args:
+        input_file (str): Cesta k vstupnému súboru
+        converter (str): Požadovaný konvertor alebo "auto"
+    
+    Returns:
+        str: Názov konvertora ("excel", "word" alebo "formatter")
+    """
+    if converter != "auto":
+        return converter
+    extension = os.path.splitext(input_file)[1].lower()
+    return CONVERTERS_BY_EXTENSION.get(extension, "excel")
+
+
+def build_output_paths(input_files, output_dir):
+    """
+    Priradí každému vstupnému súboru jedinečný výstupný súbor.
+    
+    Args:
+        input_files (list): Zoznam vstupných súborov
+        output_dir (str): Výstupný adresár
+    
+    Returns:
+        list: Cesty k výstupným súborom v rovnakom poradí ako vstupy
+    """
+    used_names = set()
+    return [os.path.join(output_dir, unique_output_name(input_file, used_names)) for input_file in input_files]
+
+
+def unique_output_name(input_file, used_names):
+    """
+    Vráti názov výstupného súboru, ktorý sa ešte nepoužil.
+    
+    Args:
+        input_file (str): Cesta k vstupnému súboru
+        used_names (set): Použité názvy (malými písmenami), nový názov sa doň pridá
+    
+    Returns:
+        str: Názov výstupného súboru bez adresára
+    """
+    stem, extension = os.path.splitext(os.path.basename(input_file))
+    name = f"{stem}.txt"
+    # Súbory s rovnakým názvom a inou príponou (faktura.xlsx, faktura.docx)
+    if name.lower() in used_names:
+        name = f"{stem}_{extension.lstrip('.')}.txt"
+    counter = 2
+    while name.lower() in used_names:
+        name = f"{stem}_{extension.lstrip('.')}_{counter}.txt"
+        counter += 1
+    
+    used_names.add(name.lower())
+    return name
+
+
+def run_converter(converter, input_file, output_file, options):
+    """
+    Spustí jeden konvertor pre jeden súbor.
+    
+    Args:
+        converter (str): Názov konvertora
+        input_file (str): Cesta k vstupnému súboru
+        output_file (str): Cesta k výstupnému súboru
+        options (dict): Prepínače konvertora
+    
+    Returns:
+        tuple: (úspech, chybová správa alebo None)
+    """
+    # Kontrola duplicít sa týka iba položiek, nie formátovaných tabuliek;
+    # zoznam preskočených položiek by si súbory navzájom prepisovali
+    dedup = None
+    if converter in ("excel", "word"):
+        dedup = dedup_from_options(dict(options, **{"dedup-report": None}), input_file)
+    
+    success = False
+    try:
+        success, error = run_document_converter(converter, input_file, output_file, options, dedup)
+    finally:
+        # Položky sa do indexu uložia iba po úspešnej konverzii
+        if dedup is not None:
+            dedup.close(commit=success)
+    if dedup is not None:
+        dedup.print_report()
+    return success, error
+
+
+def run_document_converter(converter, input_file, output_file, options, dedup=None):
+    """
+    Spustí konvertor pre jeden súbor s otvoreným indexom duplicít.
+    
+    Args:
+        converter (str): Názov konvertora
+        input_file (str): Cesta k vstupnému súboru
+        output_file (str): Cesta k výstupnému súboru
+        options (dict): Prepínače konvertora
+        dedup (DedupIndex): Index duplicít alebo None
+    
+    Returns:
+        tuple: (úspech, chybová správa alebo None)
+    """
+    input_file_name = os.path.basename(input_file)
+    cache = cache_from_options(options)
+    binary_file = os.path.splitext(output_file)[0] + ".blkb" if options.get("binary") else None
+    
+    if converter == "excel":
+        from excel_to_blocky import convert_excel_to_blocky
+        
+        # Hárky sa spracujú postupne, paralelne bežia celé súbory
+        if convert_excel_to_blocky(input_file, output_file, engine=options.get("excel-engine", "auto"),
+                                   cache=cache, binary_file=binary_file, sheets=options.get("sheets"),
+                                   description_column=options.get("description-column"),
+                                   amount_column=options.get("amount-column"), workers=1, dedup=dedup):
+            return True, None
+        return False, "Konverzia Excel súboru zlyhala"
+    
+    if converter == "word":
+        from word_to_blocky import convert_word_to_blocky
+        
+        if convert_word_to_blocky(input_file, output_file, cache=cache, engine=options.get("word-engine", "docx"),
+                                  binary_file=binary_file, dedup=dedup):
+            return True, None
+        return False, "Konverzia Word dokumentu zlyhala"
+    
+    if converter == "formatter":
+        from word_to_blocky_formatter import (
+            extract_table_format_from_word, create_formatted_table,
+            extract_all_tables_from_word, create_formatted_tables,
+        )
+        
+        if options.get("all-tables"):
+            # Tabuľky sa spracujú postupne, paralelne bežia celé súbory
+            tables_data = extract_all_tables_from_word(input_file)
+            if not tables_data:
+                return False, "Neboli nájdené žiadne tabuľky."
+            if create_formatted_tables(tables_data, output_file, input_file_name, workers=1):
+                return True, None
+            return False, "Vytvorenie tabuliek zlyhalo"
+        
+        table_data = extract_table_format_from_word(input_file)
+        if not table_data:
+            return False, "Neboli nájdené žiadne údaje v tabuľke."
+        if create_formatted_table(table_data, output_file, input_file_name):
+            return True, None
+        return False, "Vytvorenie tabuľky zlyhalo"
+    
+    return False, f"Neznámy konvertor '{converter}'"
+
+
+def convert_file(task):
+    """
+    Skonvertuje jeden súbor v pracovnom procese.
+    
+    Výpisy konvertora sa zachytia a uložia do výsledku, aby sa výstupy
+    paralelných procesov nepremiešali.
+    
+    Args:
+        task (dict): Vstupný súbor, výstupný súbor, konvertor a prepínače
+    
+    Returns:
+        dict: Výsledok konverzie pre manifest
+    """
+    start = time.perf_counter()
+    messages = io.StringIO()
+    if task["options"].get("metrics"):
+        start_metrics(os.path.basename(task["input"]))
+    
+    try:
+        with redirect_stdout(messages):
+            success, error = run_converter(task["converter"], task["input"], task["output"], task["options"])
+    except Exception as e:
+        success, error = False, str(e)
+    finally:
+        metrics = stop_metrics()
+    
+    result = {
+        "input": task["input"],
+        "output": task["output"] if success else None,
+        "converter": task["converter"],
+        "status": "ok" if success else "error",
+        "error": error,
+        "seconds": round(time.perf_counter() - start, 3),
+        "messages": messages.getvalue().splitlines(),
+    }
+    if metrics is not None:
+        result["metrics"] = metrics.as_dict()
+    return result
+
+
+def build_tasks(input_files, output_dir, converter="auto", options=None):
+    """
+    Pripraví úlohy konverzie a vytvorí výstupný adresár.
+    
+    Args:
+        input_files (list): Zoznam vstupných súborov
+        output_dir (str): Výstupný adresár
+        converter (str): Konvertor alebo "auto"
+        options (dict): Prepínače konvertorov
+    
+    Returns:
+        list: Úlohy pre convert_file v poradí vstupných súborov
+    """
+    options = options or {}
+    os.makedirs(output_dir, exist_ok=True)
+    
+    output_files = build_output_paths(input_files, output_dir)
+    return [
+        {
+            "input": input_file,
+            "output": output_file,
+            "converter": detect_converter(input_file, converter),
+            "options": options,
+        }
+        for input_file, output_file in zip(input_files, output_files)
+    ]
+
+
+def failed_result(task, error):
+    """Vráti výsledok pre súbor, ktorý sa nepodarilo spracovať"""
+    return {
+        "input": task["input"],
+        "output": None,
+        "converter": task["converter"],
+        "status": "error",
+        "error": error,
+        "seconds": None,
+        "messages": [],
+    }
+
+
+def run_batch(input_files, output_dir, converter="auto", workers=None, options=None):
+    """
+    Skonvertuje zoznam súborov paralelne v skupine procesov.
+    
+    Args:
+        input_files (list): Zoznam vstupných súborov
+        output_dir (str): Výstupný adresár
+        converter (str): Konvertor alebo "auto"
+        workers (int): Počet procesov (None = počet jadier, 1 = bez procesov)
+        options (dict): Prepínače konvertorov
+    
+    Returns:
+        list: Výsledky konverzie v poradí vstupných súborov
+    """
+    tasks = build_tasks(input_files, output_dir, converter, options)
+    results = [None] * len(tasks)
+    
+    if workers == 1 or len(tasks) <= 1:
+        for index, task in enumerate(tasks):
+            results[index] = convert_file(task)
+            report_result(results[index], index + 1, len(tasks))
+        return results
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(convert_file, task): index for index, task in enumerate(tasks)}
+        
+        for done, future in enumerate(as_completed(futures), start=1):
+            index = futures[future]
+            try:
+                results[index] = future.result()
+            except Exception as e:
+                # Pád pracovného procesu sa týka iba tohto súboru
+                results[index] = failed_result(tasks[index], str(e))
+            report_result(results[index], done, len(tasks))
+    
+    return results
+
+
+def report_result(result, done, total):
+    """Vypíše priebeh dávkovej konverzie"""
+    name = os.path.basename(result["input"])
+    if result["status"] == "ok":
+        print(f"[{done}/{total}] OK     {name}")
+    else:
+        print(f"[{done}/{total}] CHYBA  {name}: {result['error']}")
+
+
+def write_manifest(manifest_file, source, results, converter, workers):
+    """
+    Zapíše súhrnný manifest dávkovej konverzie.
+    
+    Args:
+        manifest_file (str): Cesta k manifestu
+        source (str): Vstupný adresár alebo vzor
+        results (list): Výsledky konverzie
+        converter (str): Použitý konvertor
+        workers (int): Počet procesov
+    """
+    succeeded = sum(1 for result in results if result["status"] == "ok")
+    manifest = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "source": source,
+        "converter": converter,
+        "workers": workers,
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "files": results,
+    }
+    
+    with open(manifest_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+
+def print_usage():
+    """Zobrazí návod na použitie"""
+    print("Použitie:")
+    print("  python blocky_batch.py vstup výstupný_adresár [prepínače]")
+    print()
+    print("Parametre:")
+    print("  vstup              - Adresár alebo vzor (napr. \"doklady/*.xlsx\")")
+    print("  výstupný_adresár   - Adresár pre výstupné textové súbory a manifest")
+    print()
+    print("Prepínače:")
+    print("  --converter=auto|excel|word|formatter  - Konvertor (predvolene podľa prípony)")
+    print("  --workers=N                            - Počet paralelných procesov")
+    print("  --excel-engine=auto|pandas|stream|native|parallel - Spôsob načítania Excel súborov")
+    print("  --word-engine=docx|xml                 - Spôsob načítania Word dokumentov")
+    print("  --all-tables                           - Všetky tabuľky dokumentu (formatter)")
+    print("  --sheets=all|Jan,Feb                   - Všetky alebo vybrané hárky (excel)")
+    print("  --description-column=, --amount-column= - Stĺpce podľa hlavičky (excel)")
+    print("  --binary                               - Zapísať aj binárne súbory .blkb")
+    print("  --manifest=cesta                       - Cesta k manifestu")
+    print("  --metrics                              - Zapísať do manifestu čas a pamäť fáz")
+    print("  --async, --prefetch=N, --spool-dir=cesta - Prekrývať čítanie, konverziu a zápis")
+    print("  --cache                                - Použiť vyrovnávaciu pamäť pre nezmenené súbory")
+
+
+def main():
+    """Hlavná funkcia"""
+    # Kontrola argumentov
+    arguments, options = parse_arguments(sys.argv[1:])
+    if len(arguments) != 2:
+        print_usage()
+        return 1
+    
+    source = arguments[0]
+    output_dir = arguments[1]
+    
+    converter = options.pop("converter", "auto")
+    if converter not in CONVERTERS:
+        print(f"Chyba: Neznámy konvertor '{converter}'")
+        print_usage()
+        return 1
+    
+    try:
+        workers = int(options.pop("workers", 0)) or None
+    except ValueError:
+        workers = -1
+    if workers is not None and workers < 1:
+        print("Chyba: Počet procesov musí byť kladné celé číslo (--workers=N)")
+        return 1
+    
+    manifest_file = options.pop("manifest", os.path.join(output_dir, "manifest.json"))
+    
+    # Nastavenia vyrovnávacej pamäte sa overia pred spustením pracovných procesov;
+    # vyrovnávacia pamäť sa vymaže iba raz, nie v každom pracovnom procese
+    clear_cache = options.pop("clear-cache", False)
+    if clear_cache:
+        options["cache"] = True
+    try:
+        cache = cache_from_options(options)
+    except CACHE_ERRORS as e:
+        print(f"Chyba: {str(e)}")
+        return 1
+    if clear_cache:
+        cache.clear()
+    
+    input_files = collect_input_files(source)
+    if len(input_files) == 0:
+        print(f"Chyba: Vo vstupe '{source}' neboli nájdené žiadne Excel ani Word súbory")
+        return 1
+    
+    print(f"Nájdených súborov: {len(input_files)}")
+    if (options.get("dedup") or options.get("dedup-index")) and workers != 1 and len(input_files) > 1:
+        print("Upozornenie: Súbežne konvertované súbory sa pri kontrole duplicít navzájom nevidia; "
+              "pre kontrolu aj medzi súbormi dávky použite --workers=1")
+    if options.pop("async", False):
+        from blocky_pipeline import run_pipeline, DEFAULT_PREFETCH
+        
+        try:
+            prefetch = int(options.pop("prefetch", DEFAULT_PREFETCH))
+        except ValueError:
+            print("Chyba: Počet vopred načítaných súborov musí byť celé číslo")
+            return 1
+        results = run_pipeline(input_files, output_dir, converter, workers, options,
+                               prefetch=prefetch, spool_dir=options.pop("spool-dir", None))
+    else:
+        results = run_batch(input_files, output_dir, converter, workers, options)
+    write_manifest(manifest_file, source, results, converter, workers or os.cpu_count())
+    
+    failed = sum(1 for result in results if result["status"] != "ok")
+    print(f"Dávková konverzia dokončená. Úspešne: {len(results) - failed}, s chybou: {failed}")
+    print(f"Manifest: {manifest_file}")
+    
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
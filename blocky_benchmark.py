@@ -0,0 +1,692 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Meranie výkonu konvertorov Blocky na syntetických dokumentoch
+
+Skript vygeneruje Excel (.xlsx) a Word (.docx) súbory zadanej veľkosti
+(iba pomocou štandardnej knižnice), spustí na nich konvertory a pre každú
+fázu zmeria čas a najväčšiu spotrebu pamäte. Výsledky zapíše do JSON
+súboru, takže sa dajú porovnať medzi jednotlivými behmi a spôsobmi
+načítania (engine).
+
+Generované prípady:
+    excel            - Hárok s popisom, sumou a ďalšími stĺpcami
+    word-table       - Dokument s jednou tabuľkou (popis, suma, ...)
+    word-paragraphs  - Dokument bez tabuliek s odsekmi "popis: suma €"
+    totals           - Iba sumy (bez súboru) na porovnanie výpočtu celkovej sumy
+
+Merané fázy:
+    excel      convert                  (pre každý engine z excel_to_blocky.py;
+                                         engine parallel pre každý počet procesov
+                                         z --workers so zrýchlením oproti native)
+    word       extract, write           (pre každý engine z word_to_blocky.py)
+    formatter  extract, render          (word_to_blocky_formatter.py)
+    totals     rows, column             (súčet float hodnôt oproti súčtu v centoch)
+
+Použitie:
+    python blocky_benchmark.py výsledky.json [prepínače]
+
+Prepínače:
+    --rows=1000,10000         - Počty riadkov (predvolene 1000,10000)
+    --columns=N               - Počet stĺpcov vrátane popisu a sumy (predvolene 2)
+    --description-length=N    - Dĺžka popisov v znakoch (predvolene 24)
+    --merged                  - Tabuľky obsahujú zlúčené bunky
+    --cases=excel,word-table  - Iba vybrané prípady
+    --repeat=N                - Počet opakovaní merania času (predvolene 3)
+    --seed=N                  - Počiatočná hodnota generátora (predvolene 1)
+    --workers=1,2,4           - Počty procesov pre engine parallel
+                                (predvolene mocniny 2 do počtu jadier)
+    --work-dir=cesta          - Adresár pre vygenerované súbory (predvolene dočasný)
+"""
+
+import sys
+import os
+import io
+import json
+import time
+import random
+import zipfile
+import platform
+import tempfile
+import tracemalloc
+from contextlib import redirect_stdout
+from datetime import datetime
+from xml.sax.saxutils import escape
+
+from blocky_cli import parse_arguments
+
+
+CASES = ("excel", "word-table", "word-paragraphs", "totals")
+
+DEFAULT_ROWS = (1000, 10000)
+DEFAULT_COLUMNS = 2
+DEFAULT_DESCRIPTION_LENGTH = 24
+DEFAULT_REPEAT = 3
+
+# Slová, z ktorých sa skladajú popisy položiek
+WORDS = (
+    "nájom", "elektrina", "plyn", "voda", "internet", "poistenie", "potraviny",
+    "lekáreň", "doprava", "oprava", "servis", "poplatok", "členstvo", "záloha",
+)
+
+SPREADSHEET_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+WORD_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+PACKAGE_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+OFFICE_DOCUMENT_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"
+
+XLSX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/worksheets/sheet1.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+    '<Override PartName="/xl/sharedStrings.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sharedStrings+xml"/>'
+    '</Types>'
+)
+
+DOCX_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/word/document.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+    '</Types>'
+)
+
+
+def package_relationships(target):
+    """Vráti obsah _rels/.rels s odkazom na hlavnú časť balíka"""
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<Relationships xmlns="{PACKAGE_REL_NS}">'
+        f'<Relationship Id="rId1" Type="{OFFICE_DOCUMENT_REL}" Target="{target}"/>'
+        '</Relationships>'
+    )
+
+
+def column_letter(index):
+    """Vráti označenie stĺpca Excel (0 -> A, 26 -> AA)"""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+def random_description(rng, length):
+    """Vráti náhodný popis položky približne zadanej dĺžky"""
+    words = []
+    size = 0
+    while size < length:
+        word = rng.choice(WORDS)
+        words.append(word)
+        size += len(word) + 1
+    return " ".join(words)[:max(length, 1)].strip()
+
+
+def random_amount(rng):
+    """Vráti náhodnú sumu s dvoma desatinnými miestami (niektoré záporné)"""
+    cents = rng.randint(1, 500000)
+    if rng.random() < 0.1:
+        cents = -cents
+    return cents / 100
+
+
+def generate_rows(rng, rows, columns, description_length):
+    """
+    Vygeneruje riadky tabuľky.
+    
+    Returns:
+        list: Riadky [popis, suma, ďalšie stĺpce...] bez hlavičky
+    """
+    data = []
+    for index in range(rows):
+        row = [random_description(rng, description_length), random_amount(rng)]
+        for column in range(2, columns):
+            row.append(f"Údaj {column + 1}.{index + 1}")
+        data.append(row)
+    return data
+
+
+def header_names(columns):
+    """Vráti názvy stĺpcov hlavičky"""
+    return ["Popis", "Suma"] + [f"Stĺpec {column + 1}" for column in range(2, columns)]
+
+
+def write_xlsx(path, rows, columns, merged=False):
+    """
+    Zapíše jednoduchý .xlsx súbor s jedným hárkom.
+    
+    Texty sú v tabuľke zdieľaných reťazcov ako v súboroch z Excelu.
+    Pri merged sa každých 10 riadkov zlúči bunka posledného stĺpca
+    s bunkou pod ňou.
+    
+    Args:
+        path (str): Cesta k výstupnému súboru
+        rows (list): Riadky bez hlavičky
+        columns (int): Počet stĺpcov
+        merged (bool): Pridať zlúčené bunky
+    """
+    strings = {}
+    
+    def string_index(text):
+        if text not in strings:
+            strings[text] = len(strings)
+        return strings[text]
+    
+    def cell_xml(reference, value):
+        if isinstance(value, str):
+            return f'<c r="{reference}" t="s"><v>{string_index(value)}</v></c>'
+        return f'<c r="{reference}"><v>{value!r}</v></c>'
+    
+    letters = [column_letter(column) for column in range(columns)]
+    sheet_rows = []
+    for row_number, values in enumerate([header_names(columns)] + rows, start=1):
+        cells = "".join(cell_xml(f"{letters[column]}{row_number}", value)
+                        for column, value in enumerate(values))
+        sheet_rows.append(f'<row r="{row_number}">{cells}</row>')
+    
+    merge_xml = ""
+    if merged and columns > 2:
+        last = letters[-1]
+        ranges = [f'<mergeCell ref="{last}{row}:{last}{row + 1}"/>'
+                  for row in range(2, len(rows) + 1, 10)]
+        if ranges:
+            merge_xml = f'<mergeCells count="{len(ranges)}">{"".join(ranges)}</mergeCells>'
+    
+    sheet = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<worksheet xmlns="{SPREADSHEET_NS}" xmlns:r="{REL_NS}">'
+        f'<sheetData>{"".join(sheet_rows)}</sheetData>{merge_xml}</worksheet>'
+    )
+    shared_strings = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<sst xmlns="{SPREADSHEET_NS}" count="{len(strings)}" uniqueCount="{len(strings)}">'
+        + "".join(f"<si><t>{escape(text)}</t></si>" for text in strings)
+        + '</sst>'
+    )
+    workbook = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<workbook xmlns="{SPREADSHEET_NS}" xmlns:r="{REL_NS}">'
+        '<sheets><sheet name="Hárok1" sheetId="1" r:id="rId1"/></sheets></workbook>'
+    )
+    workbook_relationships = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<Relationships xmlns="{PACKAGE_REL_NS}">'
+        '<Relationship Id="rId1" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+        'Target="worksheets/sheet1.xml"/>'
+        '<Relationship Id="rId2" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/sharedStrings" '
+        'Target="sharedStrings.xml"/>'
+        '</Relationships>'
+    )
+    
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", XLSX_CONTENT_TYPES)
+        archive.writestr("_rels/.rels", package_relationships("xl/workbook.xml"))
+        archive.writestr("xl/workbook.xml", workbook)
+        archive.writestr("xl/_rels/workbook.xml.rels", workbook_relationships)
+        archive.writestr("xl/sharedStrings.xml", shared_strings)
+        archive.writestr("xl/worksheets/sheet1.xml", sheet)
+
+
+def word_paragraph(text):
+    """Vráti XML odseku s jedným behom textu"""
+    return f'<w:p><w:r><w:t xml:space="preserve">{escape(text)}</w:t></w:r></w:p>'
+
+
+def word_cell(text, properties=""):
+    """Vráti XML bunky tabuľky"""
+    return f"<w:tc>{properties}{word_paragraph(text)}</w:tc>"
+
+
+def write_docx(path, rows, columns, merged=False, paragraphs=False):
+    """
+    Zapíše jednoduchý .docx dokument.
+    
+    Dokument obsahuje nadpis a buď jednu tabuľku s hlavičkou, alebo
+    (pri paragraphs) iba odseky vo formáte "popis: suma €". Pri merged
+    sa každých 10 riadkov zlúči posledný stĺpec zvislo s riadkom pod ním.
+    
+    Args:
+        path (str): Cesta k výstupnému súboru
+        rows (list): Riadky bez hlavičky
+        columns (int): Počet stĺpcov
+        merged (bool): Pridať zlúčené bunky
+        paragraphs (bool): Položky ako odseky namiesto tabuľky
+    """
+    parts = [word_paragraph("Prehľad výdavkov")]
+    
+    if paragraphs:
+        for row in rows:
+            parts.append(word_paragraph(f"{row[0]}: {row[1]:.2f} €".replace(".", ",")))
+    else:
+        table_rows = ["<w:tr>" + "".join(word_cell(name) for name in header_names(columns)) + "</w:tr>"]
+        for index, row in enumerate(rows):
+            cells = [word_cell(row[0]), word_cell(f"{row[1]:.2f} €".replace(".", ","))]
+            for column in range(2, columns):
+                properties = ""
+                if merged and column == columns - 1:
+                    if index % 10 == 0:
+                        properties = '<w:tcPr><w:vMerge w:val="restart"/></w:tcPr>'
+                    elif index % 10 == 1:
+                        properties = "<w:tcPr><w:vMerge/></w:tcPr>"
+                cells.append(word_cell(row[column], properties))
+            table_rows.append("<w:tr>" + "".join(cells) + "</w:tr>")
+        
+        grid = "".join("<w:gridCol/>" for _ in range(columns))
+        parts.append(f'<w:tbl><w:tblPr><w:tblW w:w="0" w:type="auto"/></w:tblPr>'
+                     f"<w:tblGrid>{grid}</w:tblGrid>{''.join(table_rows)}</w:tbl>")
+    
+    document = (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+        f'<w:document xmlns:w="{WORD_NS}" xmlns:r="{REL_NS}">'
+        f'<w:body>{"".join(parts)}<w:sectPr/></w:body></w:document>'
+    )
+    
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+        archive.writestr("[Content_Types].xml", DOCX_CONTENT_TYPES)
+        archive.writestr("_rels/.rels", package_relationships("word/document.xml"))
+        archive.writestr("word/document.xml", document)
+
+
+def generate_case(case, work_dir, rows, columns, description_length, merged, seed):
+    """
+    Vygeneruje vstupný súbor pre prípad merania.
+    
+    Returns:
+        str: Cesta k vygenerovanému súboru
+    """
+    rng = random.Random(f"{seed}-{case}-{rows}")
+    data = generate_rows(rng, rows, columns, description_length)
+    name = f"{case}-{rows}"
+    
+    if case == "excel":
+        path = os.path.join(work_dir, name + ".xlsx")
+        write_xlsx(path, data, columns, merged)
+    else:
+        path = os.path.join(work_dir, name + ".docx")
+        write_docx(path, data, columns, merged, paragraphs=(case == "word-paragraphs"))
+    return path
+
+
+def measure(function, repeat):
+    """
+    Zmeria čas a najväčšiu spotrebu pamäte volania funkcie.
+    
+    Čas je najkratší z opakovaných behov bez sledovania pamäte, pamäť sa
+    meria v samostatnom behu cez tracemalloc (iba alokácie Pythonu).
+    Výstup funkcie na obrazovku sa potlačí.
+    
+    Args:
+        function (callable): Meraná funkcia bez parametrov
+        repeat (int): Počet meraní času
+    
+    Returns:
+        tuple: (výsledok funkcie, najkratší čas v sekundách, najväčšia pamäť v bajtoch)
+    """
+    best = None
+    result = None
+    for _ in range(max(repeat, 1)):
+        with redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            result = function()
+            elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    
+    tracemalloc.start()
+    try:
+        with redirect_stdout(io.StringIO()):
+            function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    return result, best, peak
+
+
+def stage_result(case, rows, converter, stage, engine, function, repeat):
+    """
+    Zmeria jednu fázu konvertora a vráti výsledok ako slovník.
+    
+    Chyba (napr. chýbajúca knižnica pre daný engine) sa zaznamená
+    do výsledku a meranie pokračuje ďalšou fázou.
+    
+    Returns:
+        tuple: (výsledok funkcie alebo None, slovník s výsledkom merania)
+    """
+    record = {
+        "case": case,
+        "rows": rows,
+        "converter": converter,
+        "stage": stage,
+        "engine": engine,
+        "seconds": None,
+        "rows_per_second": None,
+        "peak_bytes": None,
+        "status": "ok",
+        "error": None,
+    }
+    try:
+        value, seconds, peak = measure(function, repeat)
+    except Exception as e:
+        record["status"] = "error"
+        record["error"] = f"{type(e).__name__}: {e}"
+        return None, record
+    
+    record["seconds"] = round(seconds, 6)
+    record["peak_bytes"] = peak
+    if value is False or value is None:
+        record["status"] = "failed"
+    elif seconds > 0:
+        record["rows_per_second"] = round(rows / seconds, 1)
+    return value, record
+
+
+def default_worker_counts():
+    """Vráti počty procesov pre engine parallel: mocniny 2 do počtu jadier"""
+    counts = [1]
+    while counts[-1] * 2 <= (os.cpu_count() or 1):
+        counts.append(counts[-1] * 2)
+    return counts
+
+
+def benchmark_excel(path, rows, work_dir, repeat, worker_counts=(1,)):
+    """Zmeria excel_to_blocky pre každý engine (parallel pre každý počet procesov)"""
+    from excel_to_blocky import ENGINES, convert_excel_to_blocky
+    
+    results = []
+    native_seconds = None
+    for engine in ENGINES:
+        for workers in (worker_counts if engine == "parallel" else (None,)):
+            suffix = f"-{workers}" if workers is not None else ""
+            output_file = os.path.join(work_dir, f"excel-{rows}-{engine}{suffix}.txt")
+            _, record = stage_result(
+                "excel", rows, "excel", "convert", engine,
+                lambda: convert_excel_to_blocky(path, output_file, engine=engine, workers=workers), repeat)
+            
+            if engine == "native" and record["status"] == "ok":
+                native_seconds = record["seconds"]
+            if workers is not None:
+                record["workers"] = workers
+                if native_seconds and record["seconds"]:
+                    record["speedup"] = round(native_seconds / record["seconds"], 2)
+            results.append(record)
+    return results
+
+
+def benchmark_word(case, path, rows, work_dir, repeat):
+    """Zmeria word_to_blocky (extrakcia a zápis) pre každý engine"""
+    from word_to_blocky import ENGINES, extract_data_from_word, save_to_text_file
+    
+    results = []
+    for engine in ENGINES:
+        items, record = stage_result(
+            case, rows, "word", "extract", engine,
+            lambda: extract_data_from_word(path, engine=engine) or None, repeat)
+        results.append(record)
+        if not items:
+            continue
+        
+        output_file = os.path.join(work_dir, f"{case}-{rows}-{engine}.txt")
+        _, record = stage_result(
+            case, rows, "word", "write", engine,
+            lambda: save_to_text_file(items, output_file, os.path.basename(path)), repeat)
+        results.append(record)
+    return results
+
+
+def benchmark_formatter(case, path, rows, work_dir, repeat):
+    """Zmeria word_to_blocky_formatter (extrakcia tabuľky a vykreslenie)"""
+    from word_to_blocky_formatter import extract_table_format_from_word, create_formatted_table
+    
+    results = []
+    table_data, record = stage_result(
+        case, rows, "formatter", "extract", "docx",
+        lambda: extract_table_format_from_word(path), repeat)
+    results.append(record)
+    if not table_data:
+        return results
+    
+    output_file = os.path.join(work_dir, f"{case}-{rows}-formatted.txt")
+    _, record = stage_result(
+        case, rows, "formatter", "render", "docx",
+        lambda: create_formatted_table(table_data, output_file, os.path.basename(path)), repeat)
+    results.append(record)
+    return results
+
+
+def float_row_total(amounts):
+    """Pôvodný súčet po riadkoch: float hodnoty a formátovanie každej sumy"""
+    from blocky_amounts import format_amount
+    
+    total_amount = 0
+    for amount in amounts:
+        format_amount(amount)
+        total_amount += amount
+    return f"{total_amount:.2f}"
+
+
+def cents_row_total(amounts):
+    """Súčet po riadkoch v centoch rovnako ako excel_to_blocky.write_sheet_rows"""
+    from blocky_amounts import format_amount_cents, format_cents, add_cents
+    
+    total_cents = 0
+    for amount in amounts:
+        _, cents = format_amount_cents(amount)
+        total_cents = add_cents(total_cents, cents)
+    return format_cents(total_cents, ".")
+
+
+def benchmark_totals(rows, repeat, seed):
+    """
+    Porovná súčet float hodnôt so súčtom v celých centoch.
+    
+    Meria sa súčet po riadkoch (engine stream) aj pre celý stĺpec naraz
+    (engine pandas). Ku každému výsledku sa zapíše vypočítaná celková suma,
+    takže je vidieť aj rozdiel spôsobený zaokrúhľovaním float hodnôt.
+    """
+    from excel_to_blocky import amount_column_cents
+    from blocky_amounts import format_cents
+    
+    rng = random.Random(f"{seed}-totals-{rows}")
+    amounts = [random_amount(rng) for _ in range(rows)]
+    
+    def float_column_total():
+        import pandas as pd
+        return f"{sum(pd.Series(amounts).tolist(), 0):.2f}"
+    
+    def cents_column_total():
+        import pandas as pd
+        return format_cents(amount_column_cents(pd.Series(amounts)), ".")
+    
+    measurements = [
+        ("rows", "float", lambda: float_row_total(amounts)),
+        ("rows", "cents", lambda: cents_row_total(amounts)),
+        ("column", "float", float_column_total),
+        ("column", "cents", cents_column_total),
+    ]
+    
+    results = []
+    for stage, engine, function in measurements:
+        total, record = stage_result("totals", rows, "totals", stage, engine, function, repeat)
+        record["total"] = total
+        results.append(record)
+    return results
+
+
+def run_benchmark(work_dir, row_counts, cases=CASES, columns=DEFAULT_COLUMNS,
+                  description_length=DEFAULT_DESCRIPTION_LENGTH, merged=False,
+                  repeat=DEFAULT_REPEAT, seed=1, worker_counts=(1,)):
+    """
+    Vygeneruje vstupné súbory a zmeria všetky konvertory.
+    
+    Args:
+        work_dir (str): Adresár pre vstupné a výstupné súbory
+        row_counts (list): Počty riadkov
+        cases (tuple): Generované prípady z CASES
+        columns (int): Počet stĺpcov tabuliek
+        description_length (int): Dĺžka popisov
+        merged (bool): Tabuľky so zlúčenými bunkami
+        repeat (int): Počet meraní času
+        seed (int): Počiatočná hodnota generátora
+        worker_counts (list): Počty procesov pre engine parallel
+    
+    Returns:
+        list: Výsledky meraní (slovníky)
+    """
+    results = []
+    for rows in row_counts:
+        for case in cases:
+            if case == "totals":
+                case_results = benchmark_totals(rows, repeat, seed)
+                for record in case_results:
+                    report_result(record)
+                results.extend(case_results)
+                continue
+            
+            start = time.perf_counter()
+            path = generate_case(case, work_dir, rows, columns, description_length, merged, seed)
+            print(f"Vygenerovaný súbor: {os.path.basename(path)} ({time.perf_counter() - start:.2f} s)")
+            
+            if case == "excel":
+                case_results = benchmark_excel(path, rows, work_dir, repeat, worker_counts)
+            else:
+                case_results = benchmark_word(case, path, rows, work_dir, repeat)
+                if case == "word-table":
+                    case_results += benchmark_formatter(case, path, rows, work_dir, repeat)
+            
+            for record in case_results:
+                report_result(record)
+            results.extend(case_results)
+    return results
+
+
+def report_result(record):
+    """Vypíše výsledok jedného merania"""
+    engine = record["engine"]
+    if record.get("workers") is not None:
+        engine += f", procesy: {record['workers']}"
+    name = f"{record['case']}/{record['rows']} {record['converter']}.{record['stage']} [{engine}]"
+    if record["status"] == "error":
+        print(f"  {name}: CHYBA – {record['error']}")
+        return
+    status = "" if record["status"] == "ok" else " (neúspešné)"
+    if record.get("total") is not None:
+        status = f", suma {record['total']}" + status
+    if record.get("speedup") is not None:
+        status = f", zrýchlenie {record['speedup']:.2f}x" + status
+    print(f"  {name}: {record['seconds'] * 1000:.1f} ms, "
+          f"{record['peak_bytes'] / (1024 * 1024):.1f} MB{status}")
+
+
+def write_results(output_file, results, config):
+    """
+    Zapíše výsledky meraní do JSON súboru.
+    
+    Args:
+        output_file (str): Cesta k výstupnému súboru
+        results (list): Výsledky meraní
+        config (dict): Nastavenia merania
+    """
+    data = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": config,
+        "results": results,
+    }
+    with open(output_file, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def parse_list(value, default):
+    """Rozdelí hodnotu prepínača oddelenú čiarkami"""
+    if not value or value is True:
+        return list(default)
+    return [part.strip() for part in value.split(",") if part.strip()]
+
+
+def print_usage():
+    """Zobrazí návod na použitie"""
+    print("Použitie:")
+    print("  python blocky_benchmark.py výsledky.json [prepínače]")
+    print()
+    print("Prepínače:")
+    print("  --rows=1000,10000         - Počty riadkov")
+    print("  --columns=N               - Počet stĺpcov (predvolene 2)")
+    print("  --description-length=N    - Dĺžka popisov (predvolene 24)")
+    print("  --merged                  - Tabuľky so zlúčenými bunkami")
+    print("  --cases=" + ",".join(CASES))
+    print("  --repeat=N                - Počet opakovaní merania (predvolene 3)")
+    print("  --seed=N                  - Počiatočná hodnota generátora")
+    print("  --workers=1,2,4           - Počty procesov pre engine parallel")
+    print("  --work-dir=cesta          - Adresár pre vygenerované súbory")
+
+
+def main():
+    """Hlavná funkcia"""
+    # Kontrola argumentov
+    arguments, options = parse_arguments(sys.argv[1:])
+    if len(arguments) != 1:
+        print_usage()
+        return 1
+    
+    output_file = arguments[0]
+    
+    try:
+        row_counts = [int(value) for value in parse_list(options.get("rows"), DEFAULT_ROWS)]
+        columns = max(int(options.get("columns", DEFAULT_COLUMNS)), 2)
+        description_length = int(options.get("description-length", DEFAULT_DESCRIPTION_LENGTH))
+        repeat = int(options.get("repeat", DEFAULT_REPEAT))
+        seed = int(options.get("seed", 1))
+        worker_counts = [int(value) for value in parse_list(options.get("workers"), default_worker_counts())]
+    except ValueError:
+        print("Chyba: Číselné prepínače musia obsahovať celé čísla")
+        return 1
+    
+    cases = parse_list(options.get("cases"), CASES)
+    unknown = [case for case in cases if case not in CASES]
+    if unknown:
+        print(f"Chyba: Neznámy prípad '{unknown[0]}'")
+        print_usage()
+        return 1
+    
+    config = {
+        "rows": row_counts,
+        "columns": columns,
+        "description_length": description_length,
+        "merged": bool(options.get("merged")),
+        "cases": cases,
+        "repeat": repeat,
+        "seed": seed,
+        "workers": worker_counts,
+    }
+    
+    work_dir = options.get("work-dir")
+    if work_dir:
+        os.makedirs(work_dir, exist_ok=True)
+        results = run_benchmark(work_dir, row_counts, cases, columns, description_length,
+                                config["merged"], repeat, seed, worker_counts)
+    else:
+        with tempfile.TemporaryDirectory(prefix="blocky-benchmark-") as temp_dir:
+            results = run_benchmark(temp_dir, row_counts, cases, columns, description_length,
+                                    config["merged"], repeat, seed, worker_counts)
+    
+    write_results(output_file, results, config)
+    print(f"Výsledky: {output_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Binárny stĺpcový formát importu pre aplikáciu Blocky (.blkb)
+
+Popri textovom formáte "Popis | Suma" môžu konvertory zapísať aj kompaktný
+binárny súbor, ktorý sa pri importe nemusí znova rozoberať po riadkoch.
+Údaje sú uložené po stĺpcoch, takže sumy a pôvod riadkov sa dajú čítať
+priamo z pamäťovo mapovaného súboru bez kopírovania.
+
+Štruktúra súboru (všetky čísla little-endian):
+
+    hlavička (32 bajtov)
+        magic          4s   b"BLKB"
+        verzia         H
+        príznaky       H    (zatiaľ 0)
+        počet položiek Q
+        dĺžka popisov  Q    (bajty UTF-8)
+        CRC32          I    (všetkých bajtov za hlavičkou)
+        rezerva        I
+    začiatky popisov   (počet + 1) x Q   (posuny v bloku popisov)
+    sumy v centoch     počet x q         (MISSING_CENTS = prázdna suma, INFINITE_CENTS = nekonečno)
+    pôvod riadkov      počet x q         (číslo riadku v zdroji, 0 = neznámy)
+    popisy             UTF-8 text všetkých popisov za sebou
+
+Použitie:
+    python blocky_binary.py subor.blkb [--dump]
+
+Prepínače:
+    --dump  - Vypíše všetky položky vo formáte "Popis | Suma"
+"""
+
+import sys
+import os
+import mmap
+import zlib
+import struct
+import tempfile
+from array import array
+
+from blocky_cli import parse_arguments
+from blocky_amounts import MISSING_CENTS, INFINITE_CENTS, amount_to_cents, format_cents, add_cents
+
+
+MAGIC = b"BLKB"
+VERSION = 1
+HEADER = struct.Struct("<4sHHQQII")
+
+# Polia array sa zapisujú v poradí bajtov little-endian
+NATIVE_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+def little_endian_bytes(values):
+    """Vráti bajty poľa array v poradí little-endian"""
+    if not NATIVE_LITTLE_ENDIAN:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class BlockyBinaryWriter:
+    """
+    Postupne zbiera položky a zapíše ich do binárneho súboru .blkb.
+    
+    Položky sa dajú pridávať metódami append a extend ako do zoznamu,
+    takže zapisovač môže priamo nahradiť zoznam položiek v konvertoroch.
+    """
+    
+    def __init__(self, output_file):
+        """
+        Args:
+            output_file (str): Cesta k výstupnému binárnemu súboru
+        """
+        self.output_file = output_file
+        self.offsets = array("Q", [0])
+        self.cents = array("q")
+        self.origins = array("q")
+        self.descriptions = bytearray()
+    
+    def __len__(self):
+        return len(self.cents)
+    
+    def add(self, description, amount, origin=0):
+        """
+        Pridá jednu položku.
+        
+        Args:
+            description (str): Popis položky
+            amount (float): Suma
+            origin (int): Číslo riadku v zdrojovom súbore (0 = neznámy)
+        """
+        self.add_cents(description, amount_to_cents(amount), origin)
+    
+    def add_cents(self, description, cents, origin=0):
+        """
+        Pridá jednu položku so sumou v centoch.
+        
+        Args:
+            description (str): Popis položky
+            cents (int): Suma v centoch
+            origin (int): Číslo riadku v zdrojovom súbore (0 = neznámy)
+        """
+        self.descriptions += str(description).encode("utf-8")
+        self.offsets.append(len(self.descriptions))
+        self.cents.append(cents)
+        self.origins.append(int(origin))
+    
+    def append(self, item):
+        """Pridá položku (popis, suma) alebo (popis, suma, pôvod)"""
+        self.add(*item)
+    
+    def extend(self, items):
+        """Pridá všetky položky"""
+        for item in items:
+            self.add(*item)
+    
+    def close(self):
+        """
+        Zapíše súbor. Zápis prebehne cez dočasný súbor, takže čitateľ nikdy
+        neuvidí neúplný súbor.
+        
+        Returns:
+            int: Počet zapísaných položiek
+        """
+        sections = [
+            little_endian_bytes(self.offsets),
+            little_endian_bytes(self.cents),
+            little_endian_bytes(self.origins),
+            bytes(self.descriptions),
+        ]
+        
+        checksum = 0
+        for section in sections:
+            checksum = zlib.crc32(section, checksum)
+        
+        header = HEADER.pack(MAGIC, VERSION, 0, len(self.cents), len(self.descriptions), checksum, 0)
+        
+        directory = os.path.dirname(os.path.abspath(self.output_file))
+        handle, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, 'wb') as f:
+                f.write(header)
+                for section in sections:
+                    f.write(section)
+            os.replace(temp_path, self.output_file)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        
+        return len(self.cents)
+
+
+def write_blocky_binary(output_file, items, cents=False):
+    """
+    Zapíše položky do binárneho súboru .blkb.
+    
+    Args:
+        output_file (str): Cesta k výstupnému binárnemu súboru
+        items (iterable): Položky (popis, suma) alebo (popis, suma, pôvod)
+        cents (bool): Sumy položiek sú už v centoch
+    
+    Returns:
+        int: Počet zapísaných položiek
+    """
+    writer = BlockyBinaryWriter(output_file)
+    if cents:
+        for item in items:
+            writer.add_cents(*item)
+    else:
+        writer.extend(items)
+    return writer.close()
+
+
+class BlockyBinaryReader:
+    """
+    Číta binárny súbor .blkb cez pamäťové mapovanie.
+    
+    Sumy a pôvod riadkov sú dostupné ako memoryview priamo nad súborom,
+    popisy sa dekódujú až pri prístupe k položke.
+    """
+    
+    def __init__(self, input_file):
+        """
+        Args:
+            input_file (str): Cesta k binárnemu súboru
+        """
+        self.file = open(input_file, 'rb')
+        try:
+            self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self.file.close()
+            raise ValueError("Súbor je prázdny, nejde o súbor .blkb")
+        
+        self.view = memoryview(self.map)
+        if len(self.view) < HEADER.size:
+            self.close()
+            raise ValueError("Súbor je príliš krátky, nejde o súbor .blkb")
+        
+        magic, version, _, count, descriptions_size, checksum, _ = HEADER.unpack_from(self.view)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError("Súbor nemá označenie BLKB, nejde o súbor .blkb")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"Nepodporovaná verzia súboru .blkb: {version}")
+        
+        self.count = count
+        self.checksum = checksum
+        
+        offsets_start = HEADER.size
+        cents_start = offsets_start + 8 * (count + 1)
+        origins_start = cents_start + 8 * count
+        descriptions_start = origins_start + 8 * count
+        self.size = descriptions_start + descriptions_size
+        
+        if len(self.view) < self.size:
+            self.close()
+            raise ValueError("Súbor .blkb je neúplný")
+        
+        self.offsets = self.column(offsets_start, cents_start, "Q")
+        self.cents = self.column(cents_start, origins_start, "q")
+        self.origins = self.column(origins_start, descriptions_start, "q")
+        self.descriptions = self.view[descriptions_start:self.size]
+    
+    def column(self, start, end, typecode):
+        """Vráti stĺpec čísel; na little-endian počítačoch bez kopírovania"""
+        data = self.view[start:end]
+        if NATIVE_LITTLE_ENDIAN:
+            return data.cast(typecode)
+        values = array(typecode, data.tobytes())
+        values.byteswap()
+        return values
+    
+    def __len__(self):
+        return self.count
+    
+    def description(self, index):
+        """Vráti popis položky"""
+        return str(self.descriptions[self.offsets[index]:self.offsets[index + 1]], "utf-8")
+    
+    def __getitem__(self, index):
+        """
+        Vráti položku.
+        
+        Returns:
+            tuple: (popis, suma v centoch, pôvod riadku)
+        """
+        if index < 0:
+            index += self.count
+        if not 0 <= index < self.count:
+            raise IndexError("Index položky mimo rozsahu")
+        return self.description(index), self.cents[index], self.origins[index]
+    
+    def __iter__(self):
+        for index in range(self.count):
+            yield self[index]
+    
+    def total_cents(self):
+        """Vráti súčet všetkých súm v centoch (bez prázdnych súm)"""
+        total = sum(cents for cents in self.cents if cents != MISSING_CENTS and cents not in INFINITE_CENTS)
+        for cents in INFINITE_CENTS:
+            if cents in self.cents:
+                total = add_cents(total, cents)
+        return total
+    
+    def verify(self):
+        """
+        Overí kontrolný súčet údajov.
+        
+        Returns:
+            bool: True, ak údaje zodpovedajú kontrolnému súčtu
+        """
+        return zlib.crc32(self.view[HEADER.size:self.size]) == self.checksum
+    
+    def close(self):
+        """Uvoľní pamäťové mapovanie a zatvorí súbor"""
+        for name in ("offsets", "cents", "origins", "descriptions"):
+            value = getattr(self, name, None)
+            if isinstance(value, memoryview):
+                value.release()
+        if getattr(self, "view", None) is not None:
+            self.view.release()
+            self.view = None
+        if getattr(self, "map", None) is not None:
+            self.map.close()
+            self.map = None
+        self.file.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def read_blocky_binary(input_file):
+    """
+    Otvorí binárny súbor .blkb na čítanie.
+    
+    Args:
+        input_file (str): Cesta k binárnemu súboru
+    
+    Returns:
+        BlockyBinaryReader: Čitateľ súboru (je potrebné ho zatvoriť)
+    """
+    return BlockyBinaryReader(input_file)
+
+
+def print_usage():
+    """Zobrazí návod na použitie"""
+    print("Použitie:")
+    print("  python blocky_binary.py subor.blkb [--dump]")
+    print()
+    print("Parametre:")
+    print("  subor.blkb  - Binárny súbor na overenie")
+    print()
+    print("Prepínače:")
+    print("  --dump      - Vypíše všetky položky vo formáte \"Popis | Suma\"")
+
+
+def main():
+    """Hlavná funkcia"""
+    # Kontrola argumentov
+    arguments, options = parse_arguments(sys.argv[1:])
+    if len(arguments) != 1:
+        print_usage()
+        return 1
+    
+    input_file = arguments[0]
+    if not os.path.isfile(input_file):
+        print(f"Chyba: Vstupný súbor '{input_file}' neexistuje")
+        return 1
+    
+    try:
+        with read_blocky_binary(input_file) as reader:
+            if not reader.verify():
+                print("Chyba: Kontrolný súčet nesúhlasí, súbor je poškodený")
+                return 1
+            
+            if options.get("dump"):
+                for description, cents, _ in reader:
+                    print(f"{description} | {format_cents(cents)}")
+            
+            print(f"Počet položiek: {len(reader)}")
+            print(f"Celková suma: {format_cents(reader.total_cents(), '.')}")
+            print("Kontrolný súčet: OK")
+    except ValueError as e:
+        print(f"Chyba: {str(e)}")
+        return 1
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
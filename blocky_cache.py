@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Vyrovnávacia pamäť konverzií pre aplikáciu Blocky
+
+Extrahované položky (popis, suma) sa ukladajú na disk pod kľúčom, ktorý
+sa vypočíta z obsahu vstupného súboru (SHA-256) a z nastavení konvertora.
+Pri opakovanej konverzii nezmeneného súboru sa výstup vytvorí priamo
+z uložených položiek bez načítania Excel alebo Word dokumentu.
+
+Veľkosť vyrovnávacej pamäte je obmedzená; pri prekročení limitu sa mažú
+najdlhšie nepoužité záznamy (LRU).
+
+Prepínače konvertorov:
+    --cache               - Zapne vyrovnávaciu pamäť v predvolenom adresári
+    --cache-dir=cesta     - Zapne vyrovnávaciu pamäť v zadanom adresári
+    --cache-size=MB       - Maximálna veľkosť vyrovnávacej pamäte (predvolene 256 MB)
+    --refresh-cache       - Ignoruje uložené záznamy a nahradí ich novými
+    --clear-cache         - Pred konverziou vymaže celú vyrovnávaciu pamäť
+"""
+
+import os
+import json
+import math
+import hashlib
+import tempfile
+
+
+# Verzia formátu záznamov a spracovania súm; pri zmene sa staré záznamy nepoužijú
+CACHE_FORMAT_VERSION = 4
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "blocky")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Chyby pri vytváraní vyrovnávacej pamäte (neplatné prepínače, nedostupný adresár)
+CACHE_ERRORS = (OSError, ValueError)
+
+# Veľkosť bloku pri výpočte kontrolného súčtu súboru
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def file_content_hash(input_file):
+    """
+    Vypočíta SHA-256 obsahu súboru.
+    
+    Args:
+        input_file (str): Cesta k súboru
+    
+    Returns:
+        str: Kontrolný súčet v šestnástkovom tvare
+    """
+    digest = hashlib.sha256()
+    with open(input_file, 'rb') as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class ConversionCache:
+    """
+    Vyrovnávacia pamäť extrahovaných položiek uložená v adresári na disku.
+    
+    Každý záznam je samostatný JSON súbor. Čas poslednej úpravy súboru
+    slúži ako čas posledného použitia pri odstraňovaní starých záznamov.
+    """
+    
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES, refresh=False):
+        """
+        Args:
+            directory (str): Adresár vyrovnávacej pamäte
+            max_bytes (int): Maximálna veľkosť všetkých záznamov v bajtoch
+            refresh (bool): Ak True, uložené záznamy sa nepoužijú a prepíšu sa
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.refresh = refresh
+        os.makedirs(directory, exist_ok=True)
+    
+    def make_key(self, input_file, converter, options=None):
+        """
+        Vytvorí kľúč záznamu z obsahu súboru a nastavení konvertora.
+        
+        Args:
+            input_file (str): Cesta k vstupnému súboru
+            converter (str): Názov konvertora ("excel", "word", ...)
+            options (dict): Nastavenia, ktoré ovplyvňujú extrahované položky
+        
+        Returns:
+            str: Kľúč záznamu
+        """
+        settings = json.dumps(
+            [CACHE_FORMAT_VERSION, converter, options or {}],
+            sort_keys=True, ensure_ascii=False,
+        )
+        digest = hashlib.sha256()
+        digest.update(file_content_hash(input_file).encode("ascii"))
+        digest.update(settings.encode("utf-8"))
+        return digest.hexdigest()
+    
+    def entry_path(self, key):
+        """Vráti cestu k súboru záznamu"""
+        return os.path.join(self.directory, key + ".json")
+    
+    def get(self, key):
+        """
+        Načíta záznam z vyrovnávacej pamäte.
+        
+        Args:
+            key (str): Kľúč záznamu
+        
+        Returns:
+            dict: Uložené údaje alebo None, ak záznam neexistuje
+        """
+        if self.refresh:
+            return None
+        
+        path = self.entry_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        # Označenie záznamu ako naposledy použitého
+        try:
+            os.utime(path, None)
+        except OSError:
+            pass
+        
+        return data
+    
+    def put(self, key, data):
+        """
+        Uloží záznam do vyrovnávacej pamäte a odstráni staré záznamy nad limit.
+        
+        Args:
+            key (str): Kľúč záznamu
+            data (dict): Údaje na uloženie (musia byť serializovateľné do JSON)
+        """
+        # Zápis do dočasného súboru a premenovanie, aby súbežné procesy
+        # nikdy nečítali neúplný záznam
+        handle, temp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(handle, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(temp_path, self.entry_path(key))
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        
+        self.evict()
+    
+    def entries(self):
+        """
+        Vráti zoznam záznamov zoradený od najdlhšie nepoužitého.
+        
+        Returns:
+            list: Zoznam (čas použitia, veľkosť, cesta)
+        """
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".json"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        
+        entries.sort()
+        return entries
+    
+    def evict(self):
+        """Odstráni najdlhšie nepoužité záznamy, kým veľkosť neklesne pod limit"""
+        entries = self.entries()
+        total_size = sum(size for _, size, _ in entries)
+        
+        for _, size, path in entries:
+            if total_size <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_size -= size
+    
+    def clear(self):
+        """Vymaže všetky záznamy"""
+        for _, _, path in self.entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+def cache_from_options(options):
+    """
+    Vytvorí vyrovnávaciu pamäť podľa prepínačov príkazového riadku.
+    
+    Nesprávne zadaný adresár alebo veľkosť vyvolá ValueError, nedostupný
+    adresár OSError (spolu CACHE_ERRORS).
+    
+    Args:
+        options (dict): Prepínače z parse_arguments
+    
+    Returns:
+        ConversionCache: Vyrovnávacia pamäť alebo None, ak nie je zapnutá
+    """
+    # Veľkosť sa overí, aj keď vyrovnávacia pamäť nie je zapnutá
+    max_bytes = DEFAULT_MAX_BYTES
+    if "cache-size" in options:
+        size = options["cache-size"]
+        try:
+            # Samotný prepínač --cache-size bez hodnoty nie je platná veľkosť
+            megabytes = float(size) if isinstance(size, str) else -1.0
+        except ValueError:
+            megabytes = -1.0
+        if not math.isfinite(megabytes) or megabytes < 0:
+            raise ValueError("Veľkosť vyrovnávacej pamäte musí byť zadaná ako nezáporné číslo v MB "
+                             "(--cache-size=MB)")
+        max_bytes = int(megabytes * 1024 * 1024)
+    
+    if not any(name in options for name in ("cache", "cache-dir", "refresh-cache", "clear-cache")):
+        return None
+    
+    directory = options.get("cache-dir", DEFAULT_CACHE_DIR)
+    if not isinstance(directory, str) or not directory:
+        raise ValueError("Adresár vyrovnávacej pamäte musí byť zadaný ako --cache-dir=cesta")
+    
+    cache = ConversionCache(directory, max_bytes, refresh=bool(options.get("refresh-cache")))
+    if options.get("clear-cache"):
+        cache.clear()
+    return cache
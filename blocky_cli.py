@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Spoločné pomocné funkcie pre príkazový riadok konvertorov Blocky
+
+Skripty akceptujú pozičné parametre (vstupný a výstupný súbor) a voliteľné
+prepínače v tvare --nazov=hodnota alebo --nazov.
+
+Ťažké knižnice (pandas, python-docx, openpyxl) sa v skriptoch načítajú až
+pri samotnej konverzii, takže zobrazenie návodu a kontrola argumentov sú
+rýchle. Dodržanie časového limitu štartu sa dá overiť príkazom:
+
+    python blocky_cli.py [--budget=sekundy] [--runs=N]
+"""
+
+import os
+import sys
+import time
+import subprocess
+
+
+# Maximálny čas štartu skriptu vrátane spustenia interpretera (sekundy)
+STARTUP_BUDGET = 0.25
+
+# Knižnice, ktoré sa nesmú načítať pri štarte skriptu
+HEAVY_MODULES = ("pandas", "numpy", "docx", "lxml", "openpyxl")
+
+# Skripty s príkazovým riadkom, ktorých štart sa meria
+SCRIPTS = (
+    "excel_to_blocky.py",
+    "word_to_blocky.py",
+    "word_to_blocky_formatter.py",
+    "blocky_batch.py",
+    "blocky_watch.py",
+)
+
+# Program spustený v samostatnom interpreteri: načíta modul skriptu
+# a vypíše načítané ťažké knižnice
+IMPORT_CHECK = (
+    "import sys; sys.path.insert(0, sys.argv[1]); __import__(sys.argv[2]); "
+    "print(','.join(name for name in sys.argv[3:] if name in sys.modules))"
+)
+
+
+def parse_arguments(argv):
+    """
+    Rozdelí argumenty príkazového riadku na pozičné parametre a prepínače.
+    
+    Args:
+        argv (list): Argumenty príkazového riadku bez názvu skriptu
+    
+    Returns:
+        tuple: (pozičné parametre, slovník prepínačov)
+    """
+    positional = []
+    options = {}
+    
+    for argument in argv:
+        if argument.startswith("--"):
+            name, separator, value = argument[2:].partition("=")
+            options[name] = value if separator else True
+        else:
+            positional.append(argument)
+    
+    return positional, options
+
+
+def measure_startup(script, runs=3):
+    """
+    Zmeria čas štartu skriptu bez argumentov (zobrazenie návodu).
+    
+    Skript sa spustí v novom interpreteri niekoľkokrát a vráti sa
+    najkratší čas, aby meranie neovplyvnilo náhodné zaťaženie počítača.
+    
+    Args:
+        script (str): Cesta k skriptu
+        runs (int): Počet meraní
+    
+    Returns:
+        float: Najkratší čas štartu v sekundách
+    """
+    best = None
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, script], stdout=subprocess.DEVNULL,
+                       stderr=subprocess.DEVNULL, check=False)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def heavy_imports(script):
+    """
+    Zistí, ktoré ťažké knižnice sa načítajú pri importe skriptu.
+    
+    Args:
+        script (str): Cesta k skriptu
+    
+    Returns:
+        list: Názvy načítaných knižníc z HEAVY_MODULES
+    """
+    directory = os.path.dirname(os.path.abspath(script))
+    module = os.path.splitext(os.path.basename(script))[0]
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_CHECK, directory, module] + list(HEAVY_MODULES),
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=False, text=True,
+    )
+    return [name for name in result.stdout.strip().split(",") if name]
+
+
+def check_startup(script, budget=STARTUP_BUDGET, runs=3):
+    """
+    Overí, že skript štartuje v časovom limite a nenačíta ťažké knižnice.
+    
+    Args:
+        script (str): Cesta k skriptu
+        budget (float): Časový limit v sekundách
+        runs (int): Počet meraní
+    
+    Returns:
+        tuple: (limit dodržaný, čas štartu, zoznam načítaných ťažkých knižníc)
+    """
+    elapsed = measure_startup(script, runs)
+    loaded = heavy_imports(script)
+    return elapsed <= budget and not loaded, elapsed, loaded
+
+
+def main():
+    """Hlavná funkcia – overí štart všetkých skriptov"""
+    _, options = parse_arguments(sys.argv[1:])
+    budget = float(options.get("budget", STARTUP_BUDGET))
+    runs = int(options.get("runs", 3))
+    
+    directory = os.path.dirname(os.path.abspath(__file__))
+    all_ok = True
+    for name in SCRIPTS:
+        ok, elapsed, loaded = check_startup(os.path.join(directory, name), budget, runs)
+        status = "OK" if ok else "PREKROČENÉ"
+        details = f", načítané: {', '.join(loaded)}" if loaded else ""
+        print(f"{name}: {elapsed * 1000:.0f} ms (limit {budget * 1000:.0f} ms){details} – {status}")
+        all_ok = all_ok and ok
+    
+    return 0 if all_ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
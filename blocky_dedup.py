@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Kontrola duplicitných položiek pre aplikáciu Blocky
+
+Ak sa rovnaké doklady nachádzajú vo viacerých Excel a Word súboroch,
+konvertory by rovnakú položku "Popis | Suma" vytvorili viackrát a aplikácia
+by ju importovala dvakrát. Index duplicít si pamätá všetky už vytvorené
+položky a pri ďalších konverziách ich vynechá.
+
+Kľúčom položky je hash z upraveného popisu (bez rozdielu veľkosti písmen
+a medzier), sumy v centoch, prípadne dátumu a poradia výskytu v rámci
+jedného súboru. Dve rovnaké položky v jednom súbore (napr. dve rovnaké
+kávy) sú teda dve rôzne položky, opakovaný import toho istého súboru sa
+však celý preskočí.
+
+Index je SQLite databáza na disku, takže ani milióny uložených položiek
+sa nenačítavajú do pamäte; kontrola jednej položky je jedno vyhľadanie
+v tabuľke s hashom ako kľúčom. Pre každú položku sa uloží aj súbor,
+z ktorého bola vytvorená prvýkrát.
+
+Položky konverzie sa do indexu zapíšu iba vtedy, ak konverzia prebehla
+úspešne. Počas konverzie sa index iba číta a kľúče nových položiek sa
+zbierajú v pamäti; index sa uzamkne pre zápis až na krátky čas ich
+uloženia po konverzii. Súbežné konverzie (napr. blocky_batch.py) preto
+bežia naraz, navzájom však svoje položky nevidia: ak dve súbežné
+konverzie vytvoria rovnakú položku, obe ju ponechajú vo výstupe a druhá
+na to pri uložení upozorní.
+
+Prepínače konvertorov:
+    --dedup                - Zapne kontrolu duplicít s predvoleným indexom
+    --dedup-index=cesta    - Zapne kontrolu duplicít s indexom v zadanom súbore
+    --dedup-report=cesta   - Zapíše zoznam všetkých preskočených položiek
+    --date-column=Dátum    - (excel) Dátum zo zadaného stĺpca je súčasťou kľúča
+
+Použitie:
+    python blocky_dedup.py [index.sqlite]
+"""
+
+import sys
+import os
+import sqlite3
+import hashlib
+import unicodedata
+from datetime import date, datetime
+
+from blocky_cli import parse_arguments
+from blocky_amounts import amount_to_cents, format_cents
+
+
+DEFAULT_INDEX_FILE = os.path.join(os.path.expanduser("~"), ".blocky", "duplicates.sqlite")
+
+# Verzia štruktúry databázy (PRAGMA user_version)
+INDEX_VERSION = 1
+
+# Ako dlho sa čaká na uvoľnenie indexu inou konverziou (v sekundách)
+LOCK_TIMEOUT = 600
+
+# Počet preskočených položiek vypísaných na obrazovku
+REPORT_LIMIT = 20
+
+# Chyby pri otváraní indexu (nedostupný súbor, poškodená databáza, iná verzia)
+DEDUP_ERRORS = (OSError, ValueError, sqlite3.Error)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    source TEXT NOT NULL,
+    created TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS items (
+    key BLOB PRIMARY KEY,
+    run_id INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def normalize_description(description):
+    """
+    Upraví popis pre porovnanie: rovnaký zápis diakritiky, bez rozdielu
+    veľkosti písmen a s jednou medzerou medzi slovami.
+    
+    Args:
+        description (str): Popis položky
+    
+    Returns:
+        str: Upravený popis
+    """
+    return " ".join(unicodedata.normalize("NFC", str(description)).casefold().split())
+
+
+def normalize_date(value):
+    """
+    Prevedie hodnotu bunky s dátumom na text "RRRR-MM-DD".
+    
+    Args:
+        value: Dátum (datetime, date, text) alebo None
+    
+    Returns:
+        str: Upravený dátum alebo prázdny text, ak dátum chýba
+    """
+    if value is None or value != value:
+        # Prázdna bunka (None, NaN alebo NaT z pandas)
+        return ""
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, float) and value.is_integer():
+        # Celé číslo načítané ako float (napr. stĺpec s prázdnymi bunkami v pandas)
+        value = int(value)
+    return str(value).strip()
+
+
+class DedupIndex:
+    """
+    Index už vytvorených položiek uložený v SQLite databáze.
+    """
+    
+    def __init__(self, index_file=DEFAULT_INDEX_FILE, source="", date_column=None, report_file=None):
+        """
+        Args:
+            index_file (str): Cesta k databáze indexu
+            source (str): Názov konvertovaného súboru (uloží sa k novým položkám)
+            date_column (str): Stĺpec dátumu, ktorý je súčasťou kľúča, alebo None
+            report_file (str): Súbor so zoznamom preskočených položiek alebo None
+        """
+        directory = os.path.dirname(os.path.abspath(index_file))
+        os.makedirs(directory, exist_ok=True)
+        
+        self.index_file = index_file
+        self.source = source
+        self.date_column = date_column
+        self.report_file = report_file
+        self.occurrences = {}
+        self.new_keys = []
+        self.conflicts = 0
+        self.skipped = 0
+        self.examples = []
+        self.report = None
+        
+        self.connection = sqlite3.connect(index_file, timeout=LOCK_TIMEOUT, isolation_level=None)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version not in (0, INDEX_VERSION):
+            self.connection.close()
+            raise ValueError(f"Nepodporovaná verzia indexu duplicít: {version}")
+        self.connection.executescript(SCHEMA)
+        self.connection.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+    
+    def is_new(self, description, cents, date_value=None):
+        """
+        Overí, či položka ešte nebola vytvorená, a zapamätá si ju.
+        
+        Rovnaké položky v jednom súbore sa počítajú (vrátane preskočených)
+        a každý výskyt má vlastný kľúč. N-tý výskyt je duplicitný, iba ak
+        niektorá skoršia konverzia vytvorila aspoň N rovnakých položiek.
+        Kľúč novej položky sa do indexu uloží až v close().
+        
+        Args:
+            description (str): Popis položky
+            cents (int): Suma v centoch
+            date_value: Dátum položky alebo None
+        
+        Returns:
+            bool: True pre novú položku, False pre duplicitnú (preskočenú)
+        """
+        base = f"{normalize_description(description)}\x1f{cents}\x1f{normalize_date(date_value)}"
+        occurrence = self.occurrences.get(base, 0) + 1
+        self.occurrences[base] = occurrence
+        
+        key = hashlib.blake2b(f"{base}\x1f{occurrence}".encode("utf-8"), digest_size=16).digest()
+        row = self.connection.execute("SELECT run_id FROM items WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            self.new_keys.append(key)
+            return True
+        
+        # Tento výskyt vytvorila skoršia konverzia
+        self.record_skipped(description, cents, row[0])
+        return False
+    
+    def filter_items(self, items, cents=False):
+        """
+        Vráti iba nové položky (popis, suma).
+        
+        Args:
+            items (iterable): Položky (popis, suma)
+            cents (bool): Sumy položiek sú už v centoch
+        
+        Returns:
+            list: Nové položky v pôvodnom poradí
+        """
+        if cents:
+            return [item for item in items if self.is_new(item[0], item[1])]
+        return [item for item in items if self.is_new(item[0], amount_to_cents(item[1]))]
+    
+    def record_skipped(self, description, cents, run_id):
+        """Zaznamená preskočenú položku do výpisu a do súboru so zoznamom"""
+        self.skipped += 1
+        if len(self.examples) >= REPORT_LIMIT and self.report_file is None:
+            return
+        
+        source, created = self.connection.execute(
+            "SELECT source, created FROM runs WHERE id = ?", (run_id,)).fetchone()
+        line = f"{description} | {format_cents(cents)} (prvýkrát v súbore {source}, {created})"
+        
+        if len(self.examples) < REPORT_LIMIT:
+            self.examples.append(line)
+        if self.report_file is not None:
+            if self.report is None:
+                self.report = open(self.report_file, 'w', encoding='utf-8')
+            self.report.write(line + "\n")
+    
+    def print_report(self):
+        """Vypíše počet a prvé preskočené položky"""
+        if self.conflicts:
+            print(f"Upozornenie: {self.conflicts} položiek vytvorila počas konverzie aj iná súbežná "
+                  f"konverzia; vo výstupe zostali")
+        if self.skipped == 0:
+            return
+        print(f"Preskočené duplicitné položky: {self.skipped}")
+        for line in self.examples:
+            print(f"  {line}")
+        if self.skipped > len(self.examples):
+            print(f"  ... a ďalších {self.skipped - len(self.examples)}")
+        if self.report_file is not None:
+            print(f"Zoznam preskočených položiek: {self.report_file}")
+    
+    def save(self):
+        """
+        Uloží kľúče nových položiek do indexu.
+        
+        Index sa uzamkne pre zápis iba na čas uloženia. Kľúče, ktoré medzitým
+        uložila súbežná konverzia, sa započítajú do self.conflicts.
+        """
+        if not self.new_keys:
+            return
+        
+        self.connection.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (source, created) VALUES (?, ?)",
+                (self.source, datetime.now().strftime("%d.%m.%Y %H:%M:%S")),
+            )
+            run_id = cursor.lastrowid
+            before = self.connection.total_changes
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO items (key, run_id) VALUES (?, ?)",
+                ((key, run_id) for key in self.new_keys))
+            self.conflicts = len(self.new_keys) - (self.connection.total_changes - before)
+            self.connection.execute("COMMIT")
+        except BaseException:
+            self.connection.execute("ROLLBACK")
+            raise
+        self.new_keys = []
+    
+    def close(self, commit=True):
+        """
+        Uloží položky konverzie do indexu a zatvorí ho.
+        
+        Args:
+            commit (bool): False zahodí položky neúspešnej konverzie
+        """
+        if self.report is not None:
+            self.report.close()
+            self.report = None
+        try:
+            if commit:
+                self.save()
+        finally:
+            self.connection.close()
+    
+    def stats(self):
+        """
+        Vráti počty uložených položiek a konverzií.
+        
+        Returns:
+            tuple: (počet položiek, počet konverzií)
+        """
+        items = self.connection.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+        runs = self.connection.execute("SELECT COUNT(*) FROM runs").fetchone()[0]
+        return items, runs
+
+
+def dedup_from_options(options, input_file):
+    """
+    Vytvorí index duplicít podľa prepínačov príkazového riadku.
+    
+    Args:
+        options (dict): Prepínače z parse_arguments
+        input_file (str): Konvertovaný súbor
+    
+    Returns:
+        DedupIndex: Index duplicít alebo None, ak kontrola nie je zapnutá
+    """
+    if not options.get("dedup") and not options.get("dedup-index"):
+        return None
+    
+    index_file = options.get("dedup-index") or DEFAULT_INDEX_FILE
+    if index_file is True:
+        index_file = DEFAULT_INDEX_FILE
+    report_file = options.get("dedup-report")
+    return DedupIndex(index_file, os.path.basename(input_file), options.get("date-column"),
+                      report_file if isinstance(report_file, str) else None)
+
+
+def print_usage():
+    """Zobrazí návod na použitie"""
+    print("Použitie:")
+    print("  python blocky_dedup.py [index.sqlite]")
+    print()
+    print("Vypíše počet položiek a konverzií uložených v indexe duplicít")
+    print(f"(predvolene {DEFAULT_INDEX_FILE}).")
+
+
+def main():
+    """Hlavná funkcia"""
+    arguments, _ = parse_arguments(sys.argv[1:])
+    if len(arguments) > 1:
+        print_usage()
+        return 1
+    
+    index_file = arguments[0] if arguments else DEFAULT_INDEX_FILE
+    if not os.path.isfile(index_file):
+        print(f"Chyba: Index duplicít '{index_file}' neexistuje")
+        return 1
+    
+    try:
+        index = DedupIndex(index_file)
+    except DEDUP_ERRORS as e:
+        print(f"Chyba: {str(e)}")
+        return 1
+    
+    items, runs = index.stats()
+    index.close()
+    print(f"Index duplicít: {index_file}")
+    print(f"Počet položiek: {items}")
+    print(f"Počet konverzií: {runs}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
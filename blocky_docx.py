@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Postupné čítanie Word dokumentu (.docx) bez python-docx
+
+Modul číta časť word/document.xml priamo z .docx archívu postupným XML
+parserom a vracia odseky a riadky tabuliek ako generátor. Nevytvára sa
+celý objektový model dokumentu, preto je čítanie veľkých dokumentov
+s dlhými tabuľkami rýchlejšie a s menšou spotrebou pamäte.
+
+Text odsekov a buniek zodpovedá vlastnostiam Paragraph.text
+a _Cell.text z python-docx, vrátane zlúčených buniek (gridSpan, vMerge).
+
+Archív sa otvára cez pamäťovo mapovaný súbor (blocky_zip.py), rozbalí sa
+iba word/document.xml a _rels/.rels; obrázky a iné časti sa nečítajú.
+"""
+
+import posixpath
+import xml.etree.ElementTree as ET
+
+from blocky_zip import open_zip
+
+
+W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+OFFICE_DOCUMENT_REL = "/officeDocument"
+
+# Druhy blokov, ktoré vracia iter_document_blocks
+PARAGRAPH = "paragraph"
+TABLE_ROW = "row"
+
+
+def w(tag):
+    """Vráti úplný názov značky v mennom priestore WordprocessingML"""
+    return "{%s}%s" % (W_NS, tag)
+
+
+W_BODY = w("body")
+W_P = w("p")
+W_R = w("r")
+W_T = w("t")
+W_TAB = w("tab")
+W_BR = w("br")
+W_CR = w("cr")
+W_PTAB = w("ptab")
+W_NO_BREAK_HYPHEN = w("noBreakHyphen")
+W_HYPERLINK = w("hyperlink")
+W_TBL = w("tbl")
+W_TR = w("tr")
+W_TC = w("tc")
+W_TR_PR = w("trPr")
+W_TC_PR = w("tcPr")
+W_GRID_BEFORE = w("gridBefore")
+W_GRID_SPAN = w("gridSpan")
+W_V_MERGE = w("vMerge")
+W_VAL = w("val")
+W_TYPE = w("type")
+
+
+def find_main_document(archive):
+    """
+    Nájde cestu k hlavnej časti dokumentu v .docx archíve.
+    
+    Args:
+        archive (MappedZip): Otvorený .docx archív (alebo zipfile.ZipFile)
+    
+    Returns:
+        str: Cesta k časti dokumentu (zvyčajne word/document.xml)
+    """
+    try:
+        with archive.open("_rels/.rels") as f:
+            relationships = ET.parse(f).getroot()
+    except KeyError:
+        return "word/document.xml"
+    
+    for relationship in relationships.iter("{%s}Relationship" % REL_NS):
+        if relationship.get("Type", "").endswith(OFFICE_DOCUMENT_REL):
+            return posixpath.normpath(relationship.get("Target", "").lstrip("/"))
+    
+    return "word/document.xml"
+
+
+def run_text(run):
+    """
+    Vráti text behu (w:r) rovnako ako Run.text v python-docx.
+    
+    Args:
+        run (Element): Element w:r
+    
+    Returns:
+        str: Text behu
+    """
+    parts = []
+    for child in run:
+        tag = child.tag
+        if tag == W_T:
+            parts.append(child.text or "")
+        elif tag == W_TAB or tag == W_PTAB:
+            parts.append("\t")
+        elif tag == W_BR:
+            # Zalomenie stránky alebo stĺpca nie je súčasťou textu
+            if child.get(W_TYPE) in (None, "textWrapping"):
+                parts.append("\n")
+        elif tag == W_CR:
+            parts.append("\n")
+        elif tag == W_NO_BREAK_HYPHEN:
+            parts.append("-")
+    return "".join(parts)
+
+
+def paragraph_text(paragraph):
+    """
+    Vráti text odseku (w:p) rovnako ako Paragraph.text v python-docx.
+    
+    Započítajú sa behy priamo v odseku a v hypertextových odkazoch.
+    
+    Args:
+        paragraph (Element): Element w:p
+    
+    Returns:
+        str: Text odseku
+    """
+    parts = []
+    for child in paragraph:
+        if child.tag == W_R:
+            parts.append(run_text(child))
+        elif child.tag == W_HYPERLINK:
+            for run in child:
+                if run.tag == W_R:
+                    parts.append(run_text(run))
+    return "".join(parts)
+
+
+def cell_text(cell):
+    """
+    Vráti text bunky (w:tc) rovnako ako _Cell.text v python-docx.
+    
+    Args:
+        cell (Element): Element w:tc
+    
+    Returns:
+        str: Texty odsekov bunky spojené znakom nového riadku
+    """
+    return "\n".join(paragraph_text(child) for child in cell if child.tag == W_P)
+
+
+def grid_value(properties, tag, default):
+    """Vráti celočíselnú hodnotu vlastnosti (napr. w:gridSpan) alebo predvolenú hodnotu"""
+    if properties is None:
+        return default
+    element = properties.find(tag)
+    if element is None:
+        return default
+    try:
+        return int(element.get(W_VAL))
+    except (TypeError, ValueError):
+        return default
+
+
+def row_cells(row, cells_above):
+    """
+    Vráti texty buniek riadku rovnako ako _Row.cells v python-docx.
+    
+    Bunka zlúčená cez viac stĺpcov (gridSpan) sa opakuje pre každý stĺpec,
+    pokračovanie zvislo zlúčenej bunky (vMerge) preberá text bunky nad ňou.
+    
+    Args:
+        row (Element): Element w:tr
+        cells_above (dict): Texty buniek predchádzajúceho riadku podľa stĺpca mriežky
+    
+    Returns:
+        tuple: (zoznam textov buniek, texty buniek podľa stĺpca mriežky)
+    """
+    cells = []
+    cells_by_offset = {}
+    offset = grid_value(row.find(W_TR_PR), W_GRID_BEFORE, 0)
+    
+    for cell in row:
+        if cell.tag != W_TC:
+            continue
+        
+        properties = cell.find(W_TC_PR)
+        span = max(grid_value(properties, W_GRID_SPAN, 1), 1)
+        merge = properties.find(W_V_MERGE) if properties is not None else None
+        
+        if merge is not None and merge.get(W_VAL, "continue") == "continue":
+            # Pokračovanie zvislého zlúčenia – obsah je v bunke nad touto
+            texts = [cells_above.get(offset + index, "") for index in range(span)]
+        else:
+            texts = [cell_text(cell)] * span
+        
+        for index, text in enumerate(texts):
+            cells_by_offset[offset + index] = text
+        cells.extend(texts)
+        offset += span
+    
+    return cells, cells_by_offset
+
+
+def iter_document_blocks(source):
+    """
+    Postupne prechádza odseky a riadky tabuliek v tele dokumentu.
+    
+    Vracajú sa iba odseky a tabuľky priamo v tele dokumentu (ako
+    Document.paragraphs a Document.tables v python-docx), v poradí,
+    v akom sú v dokumente. Spracované elementy sa priebežne uvoľňujú.
+    
+    Args:
+        source: Cesta k .docx súboru alebo otvorený binárny súbor
+    
+    Yields:
+        tuple: (PARAGRAPH, text) alebo (TABLE_ROW, index tabuľky, index riadku, texty buniek)
+    """
+    with open_zip(source) as archive:
+        with archive.open(find_main_document(archive)) as document:
+            # Zásobník otvorených elementov od koreňa po aktuálny element
+            stack = []
+            table_index = -1
+            row_index = 0
+            cells_above = {}
+            
+            for event, element in ET.iterparse(document, events=("start", "end")):
+                if event == "start":
+                    stack.append(element)
+                    continue
+                
+                stack.pop()
+                parent = stack[-1] if stack else None
+                if parent is None:
+                    continue
+                
+                tag = element.tag
+                if tag == W_P and parent.tag == W_BODY:
+                    yield (PARAGRAPH, paragraph_text(element))
+                    parent.remove(element)
+                
+                elif tag == W_TR and parent.tag == W_TBL and len(stack) >= 2 and stack[-2].tag == W_BODY:
+                    if row_index == 0:
+                        table_index += 1
+                    cells, cells_above = row_cells(element, cells_above)
+                    yield (TABLE_ROW, table_index, row_index, cells)
+                    row_index += 1
+                    parent.remove(element)
+                
+                elif tag == W_TBL and parent.tag == W_BODY:
+                    row_index = 0
+                    cells_above = {}
+                    parent.remove(element)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Kompaktné uloženie položiek a riadkov tabuliek pre konvertory Blocky
+
+Pri veľkých dokumentoch (100 000 a viac riadkov) zaberá najviac pamäte
+réžia objektov Pythonu: n-tica pre každú položku, samostatný float pre
+každú sumu a zoznam pre každý riadok tabuľky. Triedy v tomto module
+ukladajú údaje po stĺpcoch:
+
+    ItemStore   - popisy v jednom zozname, sumy v poli array("d")
+                  (alebo v centoch v poli array("q"); ak sa niektorá
+                  suma do poľa nezmestí, v zozname celých čísel)
+    TableStore  - texty všetkých buniek v jednom zozname a začiatky
+                  riadkov v poli array("L")
+
+Rovnaké texty (opakované popisy, dátumy, sumy) sa uložia iba raz.
+
+Obe triedy sa správajú ako zoznam, z ktorého sa iba číta: majú dĺžku,
+dajú sa indexovať a prechádzať. Prechádzanie vracia položky (popis, suma)
+a riadky (zoznam textov buniek) postupne, bez kópie celého obsahu, takže
+nahrádzajú pôvodné zoznamy bez zmeny kódu, ktorý ich číta.
+"""
+
+from array import array
+
+
+class ItemStore:
+    """
+    Položky (popis, suma) uložené po stĺpcoch.
+    """
+    
+    __slots__ = ("descriptions", "amounts", "cents", "_texts")
+    
+    def __init__(self, items=(), cents=False):
+        """
+        Args:
+            items (iterable): Počiatočné položky (popis, suma)
+            cents (bool): Sumy sú celé centy (int), nie float
+        """
+        self.descriptions = []
+        self.amounts = array("q" if cents else "d")
+        self.cents = cents
+        self._texts = {}
+        self.extend(items)
+    
+    def __len__(self):
+        return len(self.amounts)
+    
+    @property
+    def in_cents(self):
+        """True, ak sú sumy uložené v centoch"""
+        return self.cents
+    
+    def add(self, description, amount):
+        """
+        Pridá jednu položku.
+        
+        Args:
+            description (str): Popis položky
+            amount: Suma (float alebo centy, pozri in_cents)
+        """
+        try:
+            self.amounts.append(amount)
+        except OverflowError:
+            # Suma v centoch mimo rozsahu 64-bitového čísla (napr. číslo účtu
+            # prečítané ako suma); všetky sumy sa ďalej uložia v zozname
+            self.amounts = list(self.amounts)
+            self.amounts.append(amount)
+        self.descriptions.append(self._texts.setdefault(description, description))
+    
+    def append(self, item):
+        """Pridá položku (popis, suma)"""
+        self.add(*item)
+    
+    def extend(self, items):
+        """Pridá všetky položky"""
+        for description, amount in items:
+            self.add(description, amount)
+    
+    def finish(self):
+        """
+        Ukončí pridávanie a uvoľní slovník rovnakých textov.
+        
+        Ďalšie pridávanie je stále možné, rovnaké texty sa však už
+        nezlúčia s textami pridanými pred volaním finish().
+        """
+        self._texts = {}
+    
+    def __getitem__(self, index):
+        """
+        Vráti položku.
+        
+        Returns:
+            tuple: (popis, suma)
+        """
+        return self.descriptions[index], self.amounts[index]
+    
+    def __iter__(self):
+        return zip(self.descriptions, self.amounts)
+    
+    def __getstate__(self):
+        # Slovník rovnakých textov sa neprenáša, pri ďalšom pridávaní sa vytvorí znova
+        return self.descriptions, self.amounts, self.cents
+    
+    def __setstate__(self, state):
+        self.descriptions, self.amounts, self.cents = state
+        self._texts = {}
+
+
+class TableStore:
+    """
+    Riadky tabuľky (zoznamy textov buniek) uložené v jednom zozname.
+    
+    Riadky môžu mať rôzny počet buniek.
+    """
+    
+    __slots__ = ("cells", "row_starts", "_texts")
+    
+    def __init__(self, rows=()):
+        """
+        Args:
+            rows (iterable): Počiatočné riadky
+        """
+        self.cells = []
+        self.row_starts = array("L", [0])
+        self._texts = {}
+        self.extend(rows)
+    
+    def __len__(self):
+        return len(self.row_starts) - 1
+    
+    def append(self, row):
+        """
+        Pridá riadok.
+        
+        Args:
+            row (iterable): Texty buniek riadku
+        """
+        texts = self._texts
+        self.cells.extend([texts.setdefault(cell, cell) for cell in row])
+        self.row_starts.append(len(self.cells))
+    
+    def extend(self, rows):
+        """Pridá všetky riadky"""
+        for row in rows:
+            self.append(row)
+    
+    def finish(self):
+        """
+        Ukončí pridávanie a uvoľní slovník rovnakých textov.
+        
+        Ďalšie pridávanie je stále možné, rovnaké texty sa však už
+        nezlúčia s textami pridanými pred volaním finish().
+        """
+        self._texts = {}
+    
+    def __getitem__(self, index):
+        """
+        Vráti riadok.
+        
+        Returns:
+            list: Texty buniek riadku
+        """
+        count = len(self)
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("Index riadku mimo rozsahu")
+        return self.cells[self.row_starts[index]:self.row_starts[index + 1]]
+    
+    def __iter__(self):
+        cells = self.cells
+        starts = self.row_starts
+        for index in range(len(starts) - 1):
+            yield cells[starts[index]:starts[index + 1]]
+    
+    def __getstate__(self):
+        # Slovník rovnakých textov sa neprenáša, pri ďalšom pridávaní sa vytvorí znova
+        return self.cells, self.row_starts
+    
+    def __setstate__(self, state):
+        self.cells, self.row_starts = state
+        self._texts = {}
@@ -0,0 +1,275 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Meranie fáz konverzie pre konvertory Blocky
+
+Konvertory označujú svoje fázy (načítanie, rozbor, spracovanie súm,
+vytvorenie textu a zápis) cez stage(). Ak meranie nie je zapnuté,
+stage() nerobí nič, takže bežná konverzia nie je spomalená.
+
+Pre každú fázu sa zaznamená čas, počet spracovaných riadkov, riadky za
+sekundu a najväčšia spotreba pamäte procesu (peak RSS) na konci fázy.
+Pamäť je najvyššia hodnota od spustenia procesu, nie iba počas fázy.
+
+Fázy, ktoré v niektorom spôsobe načítania prebiehajú spolu (napr. pri
+postupnom čítaní Excel súboru sa každý riadok rozoberie, spracuje
+a zapíše naraz), sa zaznamenajú ako jedna fáza.
+
+Prepínače konvertorov:
+    --metrics              - Po konverzii vypíše tabuľku fáz
+    --metrics=json         - Po konverzii vypíše výsledky vo formáte JSON
+    --metrics=subor.json   - Zapíše výsledky do JSON súboru
+    --profile=subor.prof   - Zapíše profil cProfile (pozri modul pstats)
+    --profile              - Zapíše profil do súboru <vstupný súbor>.prof
+"""
+
+import os
+import sys
+import json
+import time
+from contextlib import contextmanager, nullcontext
+
+try:
+    import resource
+except ImportError:
+    # Windows modul resource nemá; pamäť sa potom nezaznamená
+    resource = None
+
+
+# Fázy konverzie v poradí, v akom sa vypisujú
+STAGES = ("load", "parse", "amounts", "render", "write")
+
+# Práve prebiehajúce meranie (jedno na proces)
+_active_metrics = None
+
+
+def peak_rss():
+    """
+    Vráti najväčšiu spotrebu pamäte procesu od jeho spustenia.
+    
+    Returns:
+        int: Peak RSS v bajtoch alebo None, ak sa nedá zistiť
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux udáva kilobajty, macOS bajty
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+class ConversionMetrics:
+    """
+    Výsledky merania jednej konverzie rozdelené podľa fáz.
+    """
+    
+    def __init__(self, name):
+        """
+        Args:
+            name (str): Názov konverzie (napr. názov vstupného súboru)
+        """
+        self.name = name
+        self.stages = {}
+        self.started = time.perf_counter()
+        self.wall_seconds = None
+    
+    def stage_entry(self, stage):
+        """Vráti záznam fázy (vytvorí ho pri prvom použití)"""
+        entry = self.stages.get(stage)
+        if entry is None:
+            entry = {"seconds": 0.0, "rows": 0, "calls": 0, "peak_rss_bytes": None}
+            self.stages[stage] = entry
+        return entry
+    
+    def record(self, stage, seconds, rows=0):
+        """
+        Pripočíta čas a riadky k fáze.
+        
+        Args:
+            stage (str): Názov fázy (zvyčajne z STAGES)
+            seconds (float): Trvanie v sekundách
+            rows (int): Počet spracovaných riadkov
+        """
+        entry = self.stage_entry(stage)
+        entry["seconds"] += seconds
+        entry["rows"] += rows
+        entry["calls"] += 1
+        entry["peak_rss_bytes"] = peak_rss()
+    
+    def add_rows(self, stage, rows):
+        """Pripočíta riadky k fáze, ktorých počet je známy až po jej skončení"""
+        self.stage_entry(stage)["rows"] += rows
+    
+    @contextmanager
+    def stage(self, stage, rows=0):
+        """Zmeria blok kódu ako fázu konverzie"""
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            self.record(stage, time.perf_counter() - start, rows)
+    
+    def finish(self):
+        """Ukončí meranie a zaznamená celkový čas"""
+        self.wall_seconds = time.perf_counter() - self.started
+    
+    def as_dict(self):
+        """
+        Vráti výsledky ako slovník vhodný pre JSON.
+        
+        Returns:
+            dict: Názov, celkový čas, peak RSS a zoznam fáz
+        """
+        order = [stage for stage in STAGES if stage in self.stages]
+        order += [stage for stage in self.stages if stage not in STAGES]
+        
+        stages = []
+        for stage in order:
+            entry = self.stages[stage]
+            seconds = entry["seconds"]
+            stages.append({
+                "stage": stage,
+                "seconds": round(seconds, 6),
+                "rows": entry["rows"],
+                "rows_per_second": round(entry["rows"] / seconds, 1) if entry["rows"] and seconds > 0 else None,
+                "calls": entry["calls"],
+                "peak_rss_bytes": entry["peak_rss_bytes"],
+            })
+        
+        wall_seconds = self.wall_seconds
+        if wall_seconds is None:
+            wall_seconds = time.perf_counter() - self.started
+        
+        return {
+            "name": self.name,
+            "wall_seconds": round(wall_seconds, 6),
+            "peak_rss_bytes": peak_rss(),
+            "stages": stages,
+        }
+    
+    def report(self):
+        """Vypíše tabuľku fáz"""
+        data = self.as_dict()
+        print(f"Meranie fáz: {data['name']} (celkom {data['wall_seconds'] * 1000:.1f} ms)")
+        for stage in data["stages"]:
+            line = f"  {stage['stage']:<8} {stage['seconds'] * 1000:10.1f} ms"
+            if stage["rows_per_second"] is not None:
+                line += f"  {stage['rows']:>9} riadkov  {stage['rows_per_second']:>12.0f} riadkov/s"
+            if stage["peak_rss_bytes"] is not None:
+                line += f"  {stage['peak_rss_bytes'] / (1024 * 1024):8.1f} MB"
+            print(line)
+
+
+def start_metrics(name):
+    """
+    Zapne meranie fáz pre aktuálny proces.
+    
+    Args:
+        name (str): Názov konverzie
+    
+    Returns:
+        ConversionMetrics: Nové meranie
+    """
+    global _active_metrics
+    _active_metrics = ConversionMetrics(name)
+    return _active_metrics
+
+
+def stop_metrics():
+    """
+    Vypne meranie fáz.
+    
+    Returns:
+        ConversionMetrics: Ukončené meranie alebo None, ak nebolo zapnuté
+    """
+    global _active_metrics
+    metrics = _active_metrics
+    _active_metrics = None
+    if metrics is not None:
+        metrics.finish()
+    return metrics
+
+
+def stage(name, rows=0):
+    """
+    Označí blok kódu ako fázu konverzie.
+    
+    Ak meranie nie je zapnuté, vráti prázdny kontext bez réžie merania.
+    
+    Args:
+        name (str): Názov fázy (zvyčajne z STAGES)
+        rows (int): Počet riadkov spracovaných vo fáze, ak je vopred známy
+    
+    Returns:
+        Kontext pre príkaz with
+    """
+    if _active_metrics is None:
+        return nullcontext()
+    return _active_metrics.stage(name, rows)
+
+
+def add_rows(name, rows):
+    """Pripočíta riadky k fáze, ak je meranie zapnuté"""
+    if _active_metrics is not None:
+        _active_metrics.add_rows(name, rows)
+
+
+def output_metrics(metrics, target):
+    """
+    Vypíše alebo zapíše výsledky merania podľa hodnoty prepínača --metrics.
+    
+    Args:
+        metrics (ConversionMetrics): Ukončené meranie
+        target: True (tabuľka), "json" (JSON na výstup) alebo cesta k súboru
+    """
+    if target is True:
+        metrics.report()
+    elif target == "json":
+        print(json.dumps(metrics.as_dict(), ensure_ascii=False, indent=2))
+    else:
+        with open(target, 'w', encoding='utf-8') as f:
+            json.dump(metrics.as_dict(), f, ensure_ascii=False, indent=2)
+        print(f"Meranie fáz: {target}")
+
+
+def run_measured(name, options, function, *args, **kwargs):
+    """
+    Spustí konverziu s meraním podľa prepínačov --metrics a --profile.
+    
+    Bez týchto prepínačov sa funkcia iba zavolá. Samotný prepínač --profile
+    zapíše profil do súboru podľa názvu konverzie (napr. vstup.prof)
+    v aktuálnom adresári.
+    
+    Args:
+        name (str): Názov konverzie
+        options (dict): Prepínače z parse_arguments
+        function (callable): Funkcia konverzie
+        *args, **kwargs: Parametre funkcie
+    
+    Returns:
+        Výsledok funkcie
+    """
+    target = options.get("metrics")
+    profile_file = options.get("profile")
+    if not target and not profile_file:
+        return function(*args, **kwargs)
+    
+    profiler = None
+    if profile_file:
+        import cProfile
+        if profile_file is True:
+            profile_file = os.path.splitext(name)[0] + ".prof"
+        profiler = cProfile.Profile()
+    
+    if target:
+        start_metrics(name)
+    try:
+        with profiler if profiler is not None else nullcontext():
+            return function(*args, **kwargs)
+    finally:
+        metrics = stop_metrics()
+        if profiler is not None:
+            profiler.dump_stats(profile_file)
+            print(f"Profil: {profile_file}")
+        if metrics is not None:
+            output_metrics(metrics, target)
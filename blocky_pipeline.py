@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Asynchrónna dávková konverzia pre aplikáciu Blocky
+
+Pri súboroch na sieťovom disku konvertory väčšinu času čakajú na načítanie
+vstupu a na množstvo malých zápisov do výstupu. Tento modul preto rozdelí
+dávkovú konverziu na tri fázy, ktoré bežia súčasne (asyncio):
+
+    1. načítanie  - Vstupné súbory sa vopred skopírujú do lokálneho
+                    dočasného adresára (vo vláknach, jedným súvislým
+                    čítaním), kým sa predchádzajúce súbory ešte konvertujú.
+    2. konverzia  - Konvertory z blocky_batch.py bežia v skupine procesov
+                    nad lokálnymi kópiami; výstup sa zapisuje na lokálny disk.
+    3. zápis      - Hotový výstup sa jedným kopírovaním presunie do
+                    výstupného adresára (cez dočasný súbor a premenovanie).
+
+Fázy sú prepojené frontami s obmedzenou veľkosťou, takže naraz je
+rozpracovaných najviac niekoľko súborov a spotreba pamäte aj miesta
+v dočasnom adresári zostáva obmedzená.
+
+Použitie:
+    python blocky_batch.py vstup výstupný_adresár --async [--prefetch=N] [--spool-dir=cesta]
+"""
+
+import os
+import shutil
+import asyncio
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from blocky_batch import build_tasks, convert_file, failed_result, report_result
+
+
+# Počet súborov načítaných vopred (veľkosť front medzi fázami)
+DEFAULT_PREFETCH = 2
+
+# Počet vlákien pre čítanie a zápis súborov
+IO_THREADS = 4
+
+# Podadresár lokálnej kópie, do ktorého konvertor zapisuje výstup
+LOCAL_OUTPUT_DIR = "vystup"
+
+
+def publish_file(local_file, target_file):
+    """
+    Skopíruje hotový súbor do cieľového adresára.
+    
+    Súbor sa zapíše pod dočasným názvom a potom sa premenuje, takže
+    v cieľovom adresári sa nikdy neobjaví neúplný výstup.
+    
+    Args:
+        local_file (str): Lokálny súbor
+        target_file (str): Cieľová cesta
+    """
+    temp_file = target_file + ".tmp"
+    try:
+        shutil.copyfile(local_file, temp_file)
+        os.replace(temp_file, target_file)
+    except Exception:
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
+        raise
+
+
+def output_files(task):
+    """Vráti výstupné súbory úlohy (textový a prípadne binárny)"""
+    files = [task["output"]]
+    if task["options"].get("binary"):
+        files.append(os.path.splitext(task["output"])[0] + ".blkb")
+    return files
+
+
+class ConversionPipeline:
+    """
+    Trojfázová konverzia: načítanie vstupov, konverzia a zápis výstupov.
+    """
+    
+    def __init__(self, tasks, spool_dir, workers=None, prefetch=DEFAULT_PREFETCH):
+        """
+        Args:
+            tasks (list): Úlohy z build_tasks
+            spool_dir (str): Lokálny adresár pre kópie vstupov a výstupov
+            workers (int): Počet procesov konverzie (None = počet jadier)
+            prefetch (int): Počet súborov načítaných vopred
+        """
+        self.tasks = tasks
+        self.spool_dir = spool_dir
+        self.workers = workers or os.cpu_count() or 1
+        self.prefetch = max(prefetch, 1)
+        self.results = [None] * len(tasks)
+        self.done = 0
+        self.io_executor = None
+        self.process_executor = None
+    
+    async def run_io(self, function, *args):
+        """Spustí blokujúcu operáciu so súborom vo vlákne"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.io_executor, function, *args)
+    
+    async def prefetch_inputs(self, parse_queue, write_queue):
+        """Fáza 1: skopíruje vstupné súbory do lokálneho adresára"""
+        for index, task in enumerate(self.tasks):
+            local_dir = os.path.join(self.spool_dir, str(index))
+            local_input = os.path.join(local_dir, os.path.basename(task["input"]))
+            try:
+                await self.run_io(os.makedirs, local_dir)
+                await self.run_io(shutil.copyfile, task["input"], local_input)
+            except OSError as e:
+                await write_queue.put((index, local_dir, failed_result(task, f"Načítanie zlyhalo: {str(e)}")))
+                continue
+            
+            # Pri plnej fronte sa čaká, kým konverzia neuvoľní miesto
+            local_task = dict(task, input=local_input,
+                              output=os.path.join(local_dir, LOCAL_OUTPUT_DIR, os.path.basename(task["output"])))
+            await parse_queue.put((index, local_dir, local_task))
+        
+        for _ in range(self.workers):
+            await parse_queue.put(None)
+    
+    async def convert_inputs(self, parse_queue, write_queue):
+        """Fáza 2: konvertuje lokálne kópie v skupine procesov"""
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await parse_queue.get()
+            if item is None:
+                await write_queue.put(None)
+                return
+            
+            index, local_dir, local_task = item
+            try:
+                await self.run_io(os.makedirs, os.path.dirname(local_task["output"]))
+                result = await loop.run_in_executor(self.process_executor, convert_file, local_task)
+            except Exception as e:
+                # Pád pracovného procesu sa týka iba tohto súboru
+                result = failed_result(local_task, str(e))
+            await write_queue.put((index, local_dir, result))
+    
+    async def write_outputs(self, write_queue):
+        """Fáza 3: presunie hotové výstupy do výstupného adresára"""
+        finished_workers = 0
+        while finished_workers < self.workers:
+            item = await write_queue.get()
+            if item is None:
+                finished_workers += 1
+                continue
+            
+            index, local_dir, result = item
+            task = self.tasks[index]
+            local_input = os.path.join(local_dir, os.path.basename(task["input"]))
+            local_output = result["output"]
+            
+            # Výpisy konvertora uvádzajú skutočné cesty, nie lokálne kópie
+            local_output_dir = os.path.join(local_dir, LOCAL_OUTPUT_DIR)
+            messages = [
+                message.replace(local_input, task["input"]).replace(local_output_dir, os.path.dirname(task["output"]))
+                for message in result["messages"]
+            ]
+            result = dict(result, input=task["input"], messages=messages)
+            
+            if result["status"] == "ok":
+                try:
+                    for local_file, target_file in zip(output_files(dict(task, output=local_output)),
+                                                       output_files(task)):
+                        if os.path.exists(local_file):
+                            await self.run_io(publish_file, local_file, target_file)
+                    result["output"] = task["output"]
+                except OSError as e:
+                    result.update(output=None, status="error", error=f"Zápis výstupu zlyhal: {str(e)}")
+            
+            await self.run_io(shutil.rmtree, local_dir, True)
+            
+            self.results[index] = result
+            self.done += 1
+            report_result(result, self.done, len(self.tasks))
+    
+    async def run(self):
+        """
+        Spustí všetky fázy a počká na ich dokončenie.
+        
+        Returns:
+            list: Výsledky konverzie v poradí vstupných súborov
+        """
+        parse_queue = asyncio.Queue(maxsize=self.prefetch)
+        write_queue = asyncio.Queue(maxsize=self.prefetch)
+        
+        self.io_executor = ThreadPoolExecutor(max_workers=IO_THREADS)
+        self.process_executor = ProcessPoolExecutor(max_workers=self.workers)
+        try:
+            await asyncio.gather(
+                self.prefetch_inputs(parse_queue, write_queue),
+                *(self.convert_inputs(parse_queue, write_queue) for _ in range(self.workers)),
+                self.write_outputs(write_queue),
+            )
+        finally:
+            self.process_executor.shutdown()
+            self.io_executor.shutdown()
+        
+        return self.results
+
+
+def run_pipeline(input_files, output_dir, converter="auto", workers=None, options=None,
+                 prefetch=DEFAULT_PREFETCH, spool_dir=None):
+    """
+    Skonvertuje zoznam súborov s prekrývaním čítania, konverzie a zápisu.
+    
+    Args:
+        input_files (list): Zoznam vstupných súborov
+        output_dir (str): Výstupný adresár
+        converter (str): Konvertor alebo "auto"
+        workers (int): Počet procesov konverzie (None = počet jadier)
+        options (dict): Prepínače konvertorov
+        prefetch (int): Počet súborov načítaných vopred
+        spool_dir (str): Lokálny adresár pre dočasné kópie (None = systémový)
+    
+    Returns:
+        list: Výsledky konverzie v poradí vstupných súborov
+    """
+    tasks = build_tasks(input_files, output_dir, converter, options)
+    
+    if spool_dir:
+        os.makedirs(spool_dir, exist_ok=True)
+    local_dir = tempfile.mkdtemp(prefix="blocky-pipeline-", dir=spool_dir)
+    try:
+        pipeline = ConversionPipeline(tasks, local_dir, workers, prefetch)
+        return asyncio.run(pipeline.run())
+    finally:
+        shutil.rmtree(local_dir, ignore_errors=True)
@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Sledovanie adresára a priebežná konverzia dokumentov pre aplikáciu Blocky
+
+Skript beží nepretržite a sleduje vstupný adresár. Každý nový alebo zmenený
+Excel (.xlsx, .xls) a Word (.docx) súbor skonvertuje rovnakými konvertormi
+ako blocky_batch.py a výsledok zapíše do výstupného adresára.
+
+    - Adresár sa kontroluje v pravidelných intervaloch (--interval). Súbor sa
+      konvertuje až vtedy, keď sa jeho veľkosť a čas úpravy nezmenili počas
+      doby ustálenia (--settle), takže sa nečíta súbor, ktorý sa ešte kopíruje
+      alebo ukladá.
+    - Konverzie bežia v skupine procesov, ktorá sa vytvorí iba raz pri štarte.
+      Každý proces hneď načíta pandas, openpyxl a python-docx, ďalšie súbory
+      sa teda konvertujú bez času na načítanie knižníc.
+    - Výstup sa zapíše najprv do dočasného podadresára výstupného adresára
+      a potom sa premenuje, takže vo výstupnom adresári sa nikdy neobjaví
+      neúplný súbor.
+    - Priebežný stav (počet čakajúcich, rozpracovaných a hotových súborov,
+      priepustnosť) sa po každej kontrole zapíše do súboru status.json.
+
+Súbor, ktorého výstup je po štarte novší ako samotný súbor, sa znova
+nekonvertuje. Súbor, ktorého konverzia zlyhala, sa skúsi znova až po jeho
+zmene.
+
+Použitie:
+    python blocky_watch.py vstupný_adresár výstupný_adresár [prepínače]
+
+Prepínače:
+    --interval=2           - Interval kontroly vstupného adresára (sekundy)
+    --settle=3             - Ako dlho sa súbor nesmie meniť pred konverziou (sekundy)
+    --workers=N            - Počet paralelných procesov (predvolene počet jadier)
+    --status=cesta         - Súbor so stavom (predvolene výstupný_adresár/status.json)
+    --once                 - Skonvertuje súbory, ktoré sú vo vstupnom adresári, a skončí
+    --converter=auto|excel|word|formatter a ďalšie prepínače konvertorov
+                           - Rovnaké ako pri blocky_batch.py (napr. --binary,
+                             --excel-engine=native, --cache, --dedup)
+
+Príklad:
+    python blocky_watch.py C:\\Doklady\\prichadzajuce C:\\Doklady\\blocky --workers=2
+
+Skript sa ukončí klávesmi Ctrl+C.
+"""
+
+import sys
+import os
+import json
+import time
+import shutil
+import signal
+import tempfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from datetime import datetime
+
+from blocky_cli import parse_arguments
+from blocky_batch import (
+    CONVERTERS, collect_input_files, detect_converter, unique_output_name,
+    convert_file, failed_result, report_result,
+)
+from blocky_pipeline import output_files
+
+
+DEFAULT_INTERVAL = 2.0
+DEFAULT_SETTLE = 3.0
+
+# Podadresár výstupného adresára pre rozpracované výstupy
+STAGING_DIR = ".blocky-watch"
+
+# Počet posledných výsledkov uložených v súbore so stavom
+RECENT_RESULTS = 20
+
+# Knižnice načítané v každom pracovnom procese pri štarte
+WARM_MODULES = (
+    "pandas", "openpyxl", "docx",
+    "excel_to_blocky", "word_to_blocky", "word_to_blocky_formatter",
+)
+
+
+def warm_worker():
+    """
+    Načíta konvertory a ich knižnice v pracovnom procese.
+    
+    Chýbajúca knižnica nie je chybou pri štarte, konvertor ju nahlási
+    až pri konverzii súboru, ktorý ju potrebuje.
+    """
+    # Ctrl+C spracuje hlavný proces, ktorý skupinu procesov ukončí
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    for name in WARM_MODULES:
+        try:
+            __import__(name)
+        except ImportError:
+            pass
+
+
+def file_signature(path):
+    """
+    Vráti veľkosť a čas úpravy súboru.
+    
+    Returns:
+        tuple: (veľkosť, čas úpravy v ns) alebo None, ak súbor neexistuje
+    """
+    try:
+        info = os.stat(path)
+    except OSError:
+        return None
+    return info.st_size, info.st_mtime_ns
+
+
+def write_json_atomic(path, data):
+    """
+    Zapíše JSON súbor cez dočasný súbor a premenovanie.
+    
+    Args:
+        path (str): Cieľový súbor
+        data (dict): Údaje na uloženie
+    """
+    handle, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix=".tmp")
+    try:
+        with os.fdopen(handle, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+class FolderWatcher:
+    """
+    Sledovanie vstupného adresára a konverzia súborov v skupine procesov.
+    """
+    
+    def __init__(self, inbox, outbox, converter="auto", workers=None, options=None,
+                 interval=DEFAULT_INTERVAL, settle=DEFAULT_SETTLE, status_file=None):
+        """
+        Args:
+            inbox (str): Sledovaný vstupný adresár
+            outbox (str): Výstupný adresár
+            converter (str): Konvertor alebo "auto"
+            workers (int): Počet procesov (None = počet jadier)
+            options (dict): Prepínače konvertorov
+            interval (float): Interval kontroly vstupného adresára (sekundy)
+            settle (float): Doba bez zmeny súboru pred konverziou (sekundy)
+            status_file (str): Súbor so stavom (None = výstupný_adresár/status.json)
+        """
+        self.inbox = inbox
+        self.outbox = outbox
+        self.converter = converter
+        self.workers = workers or os.cpu_count() or 1
+        self.options = options or {}
+        self.interval = interval
+        self.settle = settle
+        self.status_file = status_file or os.path.join(outbox, "status.json")
+        self.staging_dir = os.path.join(outbox, STAGING_DIR)
+        
+        # Súbory čakajúce na ustálenie: cesta -> (podpis, čas poslednej zmeny)
+        self.settling = {}
+        # Ustálené súbory pripravené na konverziu
+        self.queue = deque()
+        self.queued = {}
+        # Rozpracované konverzie: future -> (cesta, podpis, úloha, čas začiatku)
+        self.running = {}
+        # Spracované súbory: cesta -> podpis v čase konverzie
+        self.done = {}
+        # Výstupné súbory: cesta -> názov výstupu
+        self.output_names = {}
+        self.used_names = set()
+        
+        self.task_counter = 0
+        self.converted = 0
+        self.failed = 0
+        self.busy_seconds = 0.0
+        self.recent = deque(maxlen=RECENT_RESULTS)
+        self.started = time.time()
+        self.executor = None
+    
+    def output_path(self, path):
+        """Vráti výstupný súbor pre vstupný súbor (názov sa priradí iba raz)"""
+        name = self.output_names.get(path)
+        if name is None:
+            name = unique_output_name(path, self.used_names)
+            self.output_names[path] = name
+        return os.path.join(self.outbox, name)
+    
+    def mark_converted(self):
+        """Označí súbory, ktorých výstup je novší ako samotný súbor, ako spracované"""
+        for path in collect_input_files(self.inbox):
+            signature = file_signature(path)
+            output = file_signature(self.output_path(path))
+            if signature is not None and output is not None and output[1] >= signature[1]:
+                self.done[path] = signature
+    
+    def scan(self, now):
+        """
+        Skontroluje vstupný adresár a ustálené súbory zaradí na konverziu.
+        
+        Args:
+            now (float): Aktuálny čas (time.monotonic)
+        """
+        present = set()
+        for path in collect_input_files(self.inbox):
+            present.add(path)
+            signature = file_signature(path)
+            if signature is None or self.done.get(path) == signature or self.queued.get(path) == signature:
+                continue
+            if any(running[0] == path for running in self.running.values()):
+                # Zmenený súbor sa znova skonvertuje až po dokončení predchádzajúcej konverzie
+                continue
+            
+            previous = self.settling.get(path)
+            if previous is None or previous[0] != signature:
+                # Nový alebo práve zmenený súbor
+                self.settling[path] = (signature, now)
+            elif now - previous[1] >= self.settle:
+                del self.settling[path]
+                if path not in self.queued:
+                    self.queue.append(path)
+                self.queued[path] = signature
+        
+        # Odstránené súbory sa prestanú sledovať
+        for path in list(self.settling):
+            if path not in present:
+                del self.settling[path]
+        for path in list(self.done):
+            if path not in present:
+                del self.done[path]
+    
+    def submit(self):
+        """Odovzdá čakajúce súbory voľným pracovným procesom"""
+        while self.queue and len(self.running) < self.workers:
+            path = self.queue.popleft()
+            signature = self.queued.pop(path)
+            if file_signature(path) != signature:
+                # Súbor sa medzitým zmenil alebo zmizol, znova sa musí ustáliť
+                continue
+            
+            self.task_counter += 1
+            local_dir = os.path.join(self.staging_dir, str(self.task_counter))
+            output = self.output_path(path)
+            os.makedirs(local_dir, exist_ok=True)
+            task = {
+                "input": path,
+                "output": os.path.join(local_dir, os.path.basename(output)),
+                "converter": detect_converter(path, self.converter),
+                "options": self.options,
+            }
+            future = self.executor.submit(convert_file, task)
+            self.running[future] = (path, signature, task, time.monotonic())
+    
+    def publish(self, future):
+        """
+        Spracuje výsledok dokončenej konverzie a zverejní jej výstup.
+        
+        Args:
+            future (Future): Dokončená konverzia
+        
+        Returns:
+            dict: Výsledok konverzie (ako v manifeste blocky_batch.py)
+        """
+        path, signature, task, start = self.running.pop(future)
+        local_dir = os.path.dirname(task["output"])
+        output = self.output_path(path)
+        try:
+            result = future.result()
+        except Exception as e:
+            # Pád pracovného procesu sa týka iba tohto súboru
+            result = failed_result(task, str(e))
+        
+        # Výpisy konvertora uvádzajú výstupný adresár, nie dočasný podadresár
+        messages = [message.replace(local_dir, self.outbox) for message in result["messages"]]
+        result = dict(result, messages=messages)
+        
+        if result["status"] == "ok":
+            try:
+                for local_file, target_file in zip(output_files(task), output_files(dict(task, output=output))):
+                    if os.path.exists(local_file):
+                        os.replace(local_file, target_file)
+                result["output"] = output
+            except OSError as e:
+                result.update(output=None, status="error", error=f"Zápis výstupu zlyhal: {str(e)}")
+        shutil.rmtree(local_dir, ignore_errors=True)
+        
+        self.done[path] = signature
+        self.busy_seconds += time.monotonic() - start
+        if result["status"] == "ok":
+            self.converted += 1
+        else:
+            self.failed += 1
+        self.recent.append({
+            "finished": datetime.now().isoformat(timespec="seconds"),
+            "input": result["input"],
+            "output": result["output"],
+            "status": result["status"],
+            "error": result["error"],
+            "seconds": result["seconds"],
+        })
+        return result
+    
+    def pending(self):
+        """Vráti počet súborov, ktoré ešte čakajú na konverziu alebo sa konvertujú"""
+        return len(self.settling) + len(self.queue) + len(self.running)
+    
+    def status(self):
+        """
+        Vráti počítadlá priebehu sledovania.
+        
+        Returns:
+            dict: Stav pre súbor status.json
+        """
+        processed = self.converted + self.failed
+        elapsed = time.time() - self.started
+        return {
+            "started": datetime.fromtimestamp(self.started).isoformat(timespec="seconds"),
+            "updated": datetime.now().isoformat(timespec="seconds"),
+            "inbox": self.inbox,
+            "outbox": self.outbox,
+            "workers": self.workers,
+            "settling": len(self.settling),
+            "queue_depth": len(self.queue),
+            "in_progress": len(self.running),
+            "converted": self.converted,
+            "failed": self.failed,
+            "files_per_minute": round(processed * 60 / elapsed, 2) if elapsed > 0 else 0.0,
+            "average_seconds": round(self.busy_seconds / processed, 3) if processed else None,
+            "recent": list(self.recent),
+        }
+    
+    def write_status(self):
+        """Zapíše stav do súboru status.json"""
+        try:
+            write_json_atomic(self.status_file, self.status())
+        except OSError as e:
+            print(f"Upozornenie: Stav sa nepodarilo zapísať: {str(e)}")
+    
+    def step(self):
+        """Jedna kontrola vstupného adresára a spracovanie dokončených konverzií"""
+        self.scan(time.monotonic())
+        self.submit()
+        
+        if self.running:
+            finished, _ = wait(list(self.running), timeout=self.interval, return_when=FIRST_COMPLETED)
+        else:
+            finished = ()
+            time.sleep(self.interval)
+        
+        for future in finished:
+            result = self.publish(future)
+            processed = self.converted + self.failed
+            report_result(result, processed, processed + len(self.queue) + len(self.running))
+        self.write_status()
+    
+    def run(self, once=False):
+        """
+        Sleduje vstupný adresár až do prerušenia (Ctrl+C).
+        
+        Args:
+            once (bool): Skončí, keď sú spracované všetky súbory vstupného adresára
+        """
+        os.makedirs(self.outbox, exist_ok=True)
+        shutil.rmtree(self.staging_dir, ignore_errors=True)
+        os.makedirs(self.staging_dir, exist_ok=True)
+        self.mark_converted()
+        
+        self.executor = ProcessPoolExecutor(max_workers=self.workers, initializer=warm_worker)
+        try:
+            # Procesy sa vytvoria a načítajú knižnice ešte pred prvým súborom
+            wait([self.executor.submit(time.sleep, 0) for _ in range(self.workers)])
+            
+            self.scan(time.monotonic())
+            while not once or self.pending():
+                self.step()
+        finally:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.running.clear()
+            shutil.rmtree(self.staging_dir, ignore_errors=True)
+            self.write_status()
+
+
+def print_usage():
+    """Zobrazí návod na použitie"""
+    print("Použitie:")
+    print("  python blocky_watch.py vstupný_adresár výstupný_adresár [prepínače]")
+    print()
+    print("Parametre:")
+    print("  vstupný_adresár    - Adresár, do ktorého prichádzajú Excel a Word súbory")
+    print("  výstupný_adresár   - Adresár pre výstupné textové súbory a status.json")
+    print()
+    print("Prepínače:")
+    print("  --interval=sekundy                     - Interval kontroly vstupného adresára")
+    print("  --settle=sekundy                       - Doba bez zmeny súboru pred konverziou")
+    print("  --workers=N                            - Počet paralelných procesov")
+    print("  --status=cesta                         - Súbor so stavom sledovania")
+    print("  --once                                 - Spracovať existujúce súbory a skončiť")
+    print("  --converter=auto|excel|word|formatter  - Konvertor (predvolene podľa prípony)")
+    print("  ďalšie prepínače                       - Rovnaké ako pri blocky_batch.py")
+
+
+def main():
+    """Hlavná funkcia"""
+    # Kontrola argumentov
+    arguments, options = parse_arguments(sys.argv[1:])
+    if len(arguments) != 2:
+        print_usage()
+        return 1
+    
+    inbox = arguments[0]
+    outbox = arguments[1]
+    if not os.path.isdir(inbox):
+        print(f"Chyba: Vstupný adresár '{inbox}' neexistuje")
+        return 1
+    
+    converter = options.pop("converter", "auto")
+    if converter not in CONVERTERS:
+        print(f"Chyba: Neznámy konvertor '{converter}'")
+        print_usage()
+        return 1
+    
+    try:
+        workers = int(options.pop("workers", 0)) or None
+        interval = float(options.pop("interval", DEFAULT_INTERVAL))
+        settle = float(options.pop("settle", DEFAULT_SETTLE))
+    except ValueError:
+        print("Chyba: Počet procesov, interval a doba ustálenia musia byť čísla")
+        return 1
+    if workers is not None and workers < 1:
+        print("Chyba: Počet procesov musí byť kladné celé číslo (--workers=N)")
+        return 1
+    
+    once = bool(options.pop("once", False))
+    status_file = options.pop("status", None)
+    watcher = FolderWatcher(inbox, outbox, converter, workers, options, interval, settle,
+                            status_file if isinstance(status_file, str) else None)
+    
+    print(f"Sledovaný adresár: {inbox}")
+    print(f"Výstupný adresár: {outbox}")
+    print(f"Stav: {watcher.status_file}")
+    try:
+        watcher.run(once)
+    except KeyboardInterrupt:
+        print("Sledovanie ukončené.")
+    
+    print(f"Skonvertované: {watcher.converted}, s chybou: {watcher.failed}")
+    return 1 if once and watcher.failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,847 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Vlastné čítanie Excel zošitov (.xlsx) bez openpyxl
+
+Modul číta hárky priamo z .xlsx archívu (cez blocky_zip.py) a vracia
+hodnoty riadkov rovnako ako openpyxl v režime iba na čítanie
+(load_workbook(read_only=True, data_only=True) a iter_rows(values_only=True)).
+Načíta sa iba to, čo konvertor potrebuje:
+
+    xl/sharedStrings.xml  - Tabuľka zdieľaných textov sa prečíta raz do
+                            zoznamu; bunka s textom je iba index do neho,
+                            takže opakované popisy sú v pamäti iba raz.
+    xl/styles.xml         - Z formátov sa číta iba to, ktoré štýly buniek
+                            majú formát dátumu alebo času (číslo sa potom
+                            prevedie na datetime ako v openpyxl). Písma,
+                            výplne, okraje a ostatné formáty sa preskočia.
+    xl/worksheets/*.xml   - Hárok sa číta postupne riadok po riadku.
+
+Obrázky, grafy, komentáre, podmienené formátovanie a ostatné časti
+zošita sa nečítajú.
+
+Trieda NativeWorkbook napodobňuje tú časť rozhrania openpyxl, ktorú
+používa excel_to_blocky.py (worksheets, sheetnames, zosit[názov], close,
+hárok.max_column a hárok.iter_rows(min_row, max_row, values_only=True)).
+
+Rozbalené XML hárku sa dá rozdeliť na súvislé rozsahy riadkov
+(split_sheet_rows), ktoré sa čítajú samostatne v rôznych procesoch
+(WorksheetChunk); používa to excel_to_blocky.py --engine=parallel.
+
+Použitie (porovnanie s openpyxl na vlastných súboroch):
+    python blocky_xlsx.py zosit.xlsx [zosit2.xlsx ...]
+"""
+
+import io
+import re
+import sys
+import mmap
+import time
+import shutil
+import posixpath
+import xml.etree.ElementTree as ET
+from datetime import date, datetime, time as day_time, timedelta
+from functools import lru_cache
+
+from blocky_zip import open_zip
+
+
+SHEET_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+DOC_REL_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+OFFICE_DOCUMENT_REL = "/officeDocument"
+WORKSHEET_REL = "/worksheet"
+SHARED_STRINGS_REL = "/sharedStrings"
+STYLES_REL = "/styles"
+
+
+def s(tag):
+    """Vráti úplný názov značky v mennom priestore SpreadsheetML"""
+    return "{%s}%s" % (SHEET_NS, tag)
+
+
+S_ROW = s("row")
+S_C = s("c")
+S_V = s("v")
+S_IS = s("is")
+S_T = s("t")
+S_R = s("r")
+S_SI = s("si")
+S_SHEET = s("sheet")
+S_SHEET_DATA = s("sheetData")
+S_DIMENSION = s("dimension")
+S_WORKBOOK_PR = s("workbookPr")
+S_NUM_FMT = s("numFmt")
+S_CELL_XFS = s("cellXfs")
+S_XF = s("xf")
+R_ID = "{%s}id" % DOC_REL_NS
+RELATIONSHIP = "{%s}Relationship" % REL_NS
+
+# Začiatok počítania dátumov v Exceli (systém 1900 a 1904)
+WINDOWS_EPOCH = datetime(1899, 12, 30)
+MAC_EPOCH = datetime(1904, 1, 1)
+
+SECONDS_PER_DAY = 86400
+
+# Vstavané formáty čísel s dátumom alebo časom a s trvaním ([h]:mm:ss)
+BUILTIN_DATE_FORMATS = frozenset([14, 15, 16, 17, 18, 19, 20, 21, 22, 45, 46, 47])
+BUILTIN_TIMEDELTA_FORMATS = frozenset([46])
+
+# Texty v úvodzovkách a v hranatých zátvorkách (okrem [h], [m], [s])
+# nerozhodujú o tom, či je formát dátum
+FORMAT_STRIP_PATTERN = re.compile(r'".*?"|\[(?!hh?\]|mm?\]|ss?\])[^\]]*\]')
+DATE_FORMAT_PATTERN = re.compile(r"(?<![_\\])[dmhysDMHYS]")
+TIMEDELTA_FORMAT_PATTERN = re.compile(r"\[hh?\](:mm(:ss(\.0*)?)?)?|\[mm?\](:ss(\.0*)?)?|\[ss?\](\.0*)?", re.I)
+
+REFERENCE_PATTERN = re.compile(r"^\$?([A-Za-z]{1,3})\$?(\d+)$")
+
+# Chyba pri dátume mimo rozsahu (rovnako ako openpyxl)
+INVALID_DATE_VALUE = "#VALUE!"
+
+# Začiatočná značka sheetData (s prípadnou predponou menného priestoru)
+SHEET_DATA_PATTERN = re.compile(rb"<((?:[A-Za-z_][\w.-]*:)?)sheetData[\s>/]")
+
+# Číslo riadku v začiatočnej značke row
+ROW_NUMBER_PATTERN = re.compile(rb"""\sr\s*=\s*["'](\d+)["']""")
+
+# Veľkosť bloku pri zápise rozbaleného hárku
+COPY_BUFFER_SIZE = 1024 * 1024
+
+
+def is_date_format(format_code):
+    """
+    Zistí, či formát čísla zobrazuje dátum alebo čas.
+    
+    Args:
+        format_code (str): Formát čísla (napr. "dd.mm.yyyy")
+    
+    Returns:
+        bool: True pre formát dátumu alebo času
+    """
+    if format_code is None:
+        return False
+    format_code = FORMAT_STRIP_PATTERN.sub("", format_code.split(";")[0])
+    return DATE_FORMAT_PATTERN.search(format_code) is not None
+
+
+def is_timedelta_format(format_code):
+    """Zistí, či formát čísla zobrazuje trvanie (napr. [h]:mm:ss)"""
+    if format_code is None:
+        return False
+    return TIMEDELTA_FORMAT_PATTERN.search(format_code.split(";")[0]) is not None
+
+
+@lru_cache(maxsize=None)
+def column_index(letters):
+    """
+    Prevedie označenie stĺpca na číslo od 1.
+    
+    Args:
+        letters (str): Označenie stĺpca (napr. "A", "AB")
+    
+    Returns:
+        int: Číslo stĺpca
+    """
+    index = 0
+    for letter in letters.upper():
+        index = index * 26 + ord(letter) - 64
+    return index
+
+
+def parse_reference(reference):
+    """
+    Rozloží odkaz na bunku.
+    
+    Args:
+        reference (str): Odkaz na bunku (napr. "B12")
+    
+    Returns:
+        tuple: (riadok, stĺpec) alebo None pre neplatný odkaz
+    """
+    match = REFERENCE_PATTERN.match(reference)
+    if match is None:
+        return None
+    return int(match.group(2)), column_index(match.group(1))
+
+
+def excel_to_datetime(value, epoch=WINDOWS_EPOCH, as_timedelta=False):
+    """
+    Prevedie poradové číslo dátumu z Excelu na dátum a čas (ako openpyxl).
+    
+    Args:
+        value (float): Poradové číslo dňa
+        epoch (datetime): Začiatok počítania dátumov zošita
+        as_timedelta (bool): Vrátiť trvanie namiesto dátumu
+    
+    Returns:
+        datetime, time alebo timedelta
+    """
+    if as_timedelta:
+        result = timedelta(days=value)
+        if result.microseconds:
+            # Zaokrúhlenie na milisekundy
+            result = timedelta(seconds=result.total_seconds() // 1,
+                               microseconds=round(result.microseconds, -3))
+        return result
+    
+    day, fraction = divmod(value, 1)
+    difference = timedelta(milliseconds=round(fraction * SECONDS_PER_DAY * 1000))
+    if 0 <= value < 1 and difference.days == 0:
+        minutes, seconds = divmod(difference.seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return day_time(hours, minutes, seconds, difference.microseconds)
+    if 0 < value < 60 and epoch == WINDOWS_EPOCH:
+        # Excel považuje rok 1900 za priestupný
+        day += 1
+    return epoch + timedelta(days=day) + difference
+
+
+def parse_iso_datetime(text):
+    """
+    Prevedie hodnotu bunky typu "d" (dátum v tvare ISO 8601).
+    
+    Args:
+        text (str): Dátum, čas alebo dátum a čas
+    
+    Returns:
+        date, time alebo datetime
+    """
+    text = text.rstrip("Z")
+    if "T" not in text:
+        if ":" in text:
+            return day_time.fromisoformat(text)
+        return date.fromisoformat(text)
+    if text.startswith("T"):
+        return day_time.fromisoformat(text[1:])
+    return datetime.fromisoformat(text)
+
+
+def cast_number(text):
+    """Prevedie číslo z XML na int alebo float (ako openpyxl)"""
+    if "." in text or "E" in text or "e" in text:
+        return float(text)
+    return int(text)
+
+
+def rich_text(element):
+    """
+    Vráti text zdieľaného alebo vloženého textu (si, is).
+    
+    Spojí text prvku t a textov formátovaných úsekov (r/t); fonetické
+    prepisy (rPh) sa vynechajú.
+    
+    Args:
+        element (Element): Element si alebo is
+    
+    Returns:
+        str: Text bez formátovania
+    """
+    parts = []
+    for child in element:
+        if child.tag == S_T:
+            if child.text:
+                parts.append(child.text)
+        elif child.tag == S_R:
+            text = child.findtext(S_T)
+            if text:
+                parts.append(text)
+    return "".join(parts)
+
+
+def read_relationships(archive, part):
+    """
+    Načíta vzťahy časti archívu.
+    
+    Args:
+        archive (MappedZip): Otvorený archív
+        part (str): Cesta k časti (napr. "xl/workbook.xml")
+    
+    Returns:
+        dict: Identifikátor vzťahu -> (typ, cesta k cieľovej časti)
+    """
+    directory, name = posixpath.split(part)
+    rels_path = posixpath.join(directory, "_rels", name + ".rels")
+    try:
+        with archive.open(rels_path) as f:
+            root = ET.parse(f).getroot()
+    except KeyError:
+        return {}
+    
+    relationships = {}
+    for relationship in root.iter(RELATIONSHIP):
+        target = relationship.get("Target", "")
+        if target.startswith("/"):
+            path = target.lstrip("/")
+        else:
+            path = posixpath.normpath(posixpath.join(directory, target))
+        relationships[relationship.get("Id")] = (relationship.get("Type", ""), path)
+    return relationships
+
+
+def find_relationship(relationships, suffix):
+    """Vráti cestu k prvej časti so vzťahom daného typu alebo None"""
+    for rel_type, path in relationships.values():
+        if rel_type.endswith(suffix):
+            return path
+    return None
+
+
+def read_shared_strings(archive, part):
+    """
+    Načíta tabuľku zdieľaných textov.
+    
+    Args:
+        archive (MappedZip): Otvorený archív
+        part (str): Cesta k časti so zdieľanými textami alebo None
+    
+    Returns:
+        list: Texty v poradí indexov
+    """
+    strings = []
+    if part is None:
+        return strings
+    
+    root = None
+    with archive.open(part) as f:
+        for event, element in ET.iterparse(f, events=("start", "end")):
+            if root is None:
+                root = element
+                continue
+            if event == "end" and element.tag == S_SI:
+                # openpyxl odstraňuje iba únikovú postupnosť "x005F_"
+                strings.append(rich_text(element).replace("x005F_", ""))
+                element.clear()
+                root.remove(element)
+    return strings
+
+
+def read_date_styles(archive, part):
+    """
+    Zistí, ktoré štýly buniek majú formát dátumu alebo trvania.
+    
+    Z xl/styles.xml sa čítajú iba vlastné formáty čísel (numFmts)
+    a formáty buniek (cellXfs); ostatné časti sa preskočia.
+    
+    Args:
+        archive (MappedZip): Otvorený archív
+        part (str): Cesta k časti so štýlmi alebo None
+    
+    Returns:
+        tuple: (množina štýlov s dátumom, množina štýlov s trvaním)
+    """
+    date_styles = set()
+    timedelta_styles = set()
+    if part is None:
+        return date_styles, timedelta_styles
+    
+    custom_formats = {}
+    style_index = 0
+    in_cell_xfs = False
+    with archive.open(part) as f:
+        for event, element in ET.iterparse(f, events=("start", "end")):
+            tag = element.tag
+            if event == "start":
+                if tag == S_CELL_XFS:
+                    in_cell_xfs = True
+                continue
+            
+            if tag == S_NUM_FMT:
+                try:
+                    custom_formats[int(element.get("numFmtId"))] = element.get("formatCode")
+                except (TypeError, ValueError):
+                    pass
+            elif tag == S_XF and in_cell_xfs:
+                try:
+                    format_id = int(element.get("numFmtId", 0))
+                except ValueError:
+                    format_id = 0
+                if format_id in custom_formats:
+                    format_code = custom_formats[format_id]
+                    if is_date_format(format_code):
+                        date_styles.add(style_index)
+                    if is_timedelta_format(format_code):
+                        timedelta_styles.add(style_index)
+                else:
+                    if format_id in BUILTIN_DATE_FORMATS:
+                        date_styles.add(style_index)
+                    if format_id in BUILTIN_TIMEDELTA_FORMATS:
+                        timedelta_styles.add(style_index)
+                style_index += 1
+            elif tag == S_CELL_XFS:
+                # Ďalšie časti štýlov netreba čítať
+                break
+            element.clear()
+    
+    return date_styles, timedelta_styles
+
+
+class NativeWorksheet:
+    """
+    Hárok zošita na postupné čítanie riadkov.
+    """
+    
+    def __init__(self, workbook, title, part):
+        """
+        Args:
+            workbook (NativeWorkbook): Zošit
+            title (str): Názov hárku
+            part (str): Cesta k časti hárku v archíve
+        """
+        self.parent = workbook
+        self.title = title
+        self.part = part
+        self.max_row = None
+        self.max_column = None
+        self.read_dimensions()
+    
+    def open_part(self):
+        """Otvorí XML hárku na čítanie"""
+        return self.parent.archive.open(self.part)
+    
+    def save_part(self, path):
+        """
+        Zapíše rozbalené XML hárku do súboru (pre rozdelenie na časti).
+        
+        Args:
+            path (str): Cieľový súbor
+        """
+        with self.open_part() as source, open(path, "wb") as target:
+            shutil.copyfileobj(source, target, COPY_BUFFER_SIZE)
+    
+    def read_dimensions(self):
+        """Prečíta rozmery hárku zo začiatku časti (element dimension)"""
+        with self.open_part() as f:
+            # Stačia začiatočné značky, sheetData sa nemusí celý načítať
+            for _, element in ET.iterparse(f, events=("start",)):
+                if element.tag == S_DIMENSION:
+                    last = element.get("ref", "").split(":")[-1]
+                    reference = parse_reference(last)
+                    if reference is not None:
+                        self.max_row, self.max_column = reference
+                    return
+                if element.tag == S_SHEET_DATA:
+                    return
+    
+    def iter_rows(self, min_row=None, max_row=None, values_only=True):
+        """
+        Postupne vráti hodnoty riadkov od prvého stĺpca.
+        
+        Chýbajúce riadky a bunky sa doplnia hodnotou None, riadky majú
+        dĺžku podľa rozmerov hárku (ako ReadOnlyWorksheet v openpyxl).
+        
+        Args:
+            min_row (int): Prvý vrátený riadok (None = 1)
+            max_row (int): Posledný riadok (None = podľa rozmerov hárku)
+            values_only (bool): Iba hodnoty (iné čítanie nie je podporované)
+        
+        Yields:
+            tuple: Hodnoty riadku
+        """
+        if not values_only:
+            raise ValueError("Podporované je iba čítanie hodnôt (values_only=True)")
+        
+        max_row = max_row or self.max_row
+        max_column = self.max_column
+        empty_row = (None,) * max_column if max_column is not None else ()
+        
+        next_row = min_row or 1
+        row_number = next_row
+        for row_number, cells in self.iter_cells():
+            if max_row is not None and row_number > max_row:
+                break
+            
+            # Chýbajúce riadky
+            while next_row < row_number:
+                next_row += 1
+                yield empty_row
+            
+            if next_row <= row_number:
+                next_row += 1
+                yield self.make_row(cells, max_column)
+        
+        # Chýbajúce riadky pred koncom rozmerov hárku, ak čítanie skončilo za ním
+        if max_row is not None and max_row < row_number:
+            while next_row <= max_row:
+                next_row += 1
+                yield empty_row
+    
+    @staticmethod
+    def make_row(cells, max_column):
+        """
+        Vytvorí n-ticu hodnôt riadku.
+        
+        Args:
+            cells (list): Dvojice (stĺpec, hodnota)
+            max_column (int): Počet stĺpcov hárku alebo None
+        
+        Returns:
+            tuple: Hodnoty riadku
+        """
+        if not cells and not max_column:
+            return ()
+        width = max_column or cells[-1][0]
+        values = [None] * width
+        for column, value in cells:
+            if 1 <= column <= width:
+                values[column - 1] = value
+        return tuple(values)
+    
+    def iter_cells(self):
+        """
+        Postupne číta riadky hárku z XML.
+        
+        Yields:
+            tuple: (číslo riadku, zoznam dvojíc (stĺpec, hodnota))
+        """
+        workbook = self.parent
+        shared_strings = workbook.shared_strings
+        date_styles = workbook.date_styles
+        timedelta_styles = workbook.timedelta_styles
+        epoch = workbook.epoch
+        
+        row_number = 0
+        sheet_data = None
+        with self.open_part() as f:
+            for event, element in ET.iterparse(f, events=("start", "end")):
+                if event == "start":
+                    if element.tag == S_SHEET_DATA:
+                        sheet_data = element
+                    continue
+                if element.tag != S_ROW:
+                    continue
+                
+                number = element.get("r")
+                if number is not None:
+                    try:
+                        row_number = int(number)
+                    except ValueError:
+                        row_number = int(float(number))
+                else:
+                    row_number += 1
+                
+                cells = []
+                column = 0
+                for cell in element:
+                    if cell.tag != S_C:
+                        continue
+                    
+                    reference = cell.get("r")
+                    position = parse_reference(reference) if reference else None
+                    column = position[1] if position is not None else column + 1
+                    
+                    data_type = cell.get("t", "n")
+                    if data_type == "inlineStr":
+                        child = cell.find(S_IS)
+                        value = rich_text(child) if child is not None else None
+                        cells.append((column, value))
+                        continue
+                    
+                    value = cell.findtext(S_V) or None
+                    if value is not None:
+                        if data_type == "n":
+                            value = cast_number(value)
+                            style = int(cell.get("s", 0) or 0)
+                            if style in date_styles:
+                                try:
+                                    value = excel_to_datetime(value, epoch, style in timedelta_styles)
+                                except (OverflowError, ValueError):
+                                    value = INVALID_DATE_VALUE
+                        elif data_type == "s":
+                            value = shared_strings[int(value)]
+                        elif data_type == "b":
+                            value = bool(int(value))
+                        elif data_type == "d":
+                            value = parse_iso_datetime(value)
+                    cells.append((column, value))
+                
+                yield row_number, cells
+                
+                # Spracovaný riadok sa uvoľní z pamäte
+                element.clear()
+                if sheet_data is not None:
+                    sheet_data.remove(element)
+
+
+class WorksheetChunk(NativeWorksheet):
+    """
+    Súvislý rozsah riadkov hárku, ktorý sa číta ako samostatný hárok.
+    
+    Obsahom je začiatok XML hárku (s rozmermi), vybrané riadky a koniec
+    XML, takže rozmery a hodnoty buniek sa čítajú rovnako ako z celého hárku.
+    """
+    
+    def __init__(self, workbook, title, content):
+        """
+        Args:
+            workbook (NativeWorkbook): Zošit so zdieľanými textami a štýlmi
+            title (str): Názov hárku
+            content (bytes): XML časti hárku (pozri read_sheet_chunk)
+        """
+        self.content = content
+        super().__init__(workbook, title, None)
+    
+    def open_part(self):
+        """Otvorí XML časti hárku na čítanie"""
+        return io.BytesIO(self.content)
+
+
+def row_number_at(data, position):
+    """
+    Vráti číslo riadku zo značky row na zadanej pozícii.
+    
+    Returns:
+        int: Číslo riadku alebo None, ak značka nemá atribút r
+    """
+    end = data.find(b">", position)
+    if end < 0:
+        return None
+    match = ROW_NUMBER_PATTERN.search(data, position, end)
+    return int(match.group(1)) if match else None
+
+
+def split_sheet_rows(path, count):
+    """
+    Rozdelí rozbalené XML hárku na súvislé rozsahy riadkov.
+    
+    Hranice sa hľadajú na začiatku značky row v približne rovnakých
+    vzdialenostiach. Každá časť sa dá prečítať samostatne (read_sheet_chunk)
+    a vďaka číslam riadkov (atribút r) na hraniciach sa chýbajúce riadky
+    doplnia rovnako ako pri čítaní celého hárku.
+    
+    Args:
+        path (str): Súbor s rozbaleným XML hárku (NativeWorksheet.save_part)
+        count (int): Požadovaný počet častí
+    
+    Returns:
+        tuple: (koniec začiatku XML, začiatok konca XML, zoznam častí
+               (začiatok, koniec, prvý riadok, posledný riadok)) alebo None,
+               ak sa hárok nedá rozdeliť; prvý riadok prvej časti a posledný
+               riadok poslednej časti sú None
+    """
+    with open(path, "rb") as f:
+        if count < 2 or f.seek(0, io.SEEK_END) == 0:
+            return None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            match = SHEET_DATA_PATTERN.search(data)
+            if match is None:
+                return None
+            prefix_end = data.find(b">", match.start()) + 1
+            if data[prefix_end - 2:prefix_end] == b"/>":
+                # Prázdny hárok <sheetData/>
+                return None
+            namespace = match.group(1)
+            suffix_start = data.rfind(b"</" + namespace + b"sheetData")
+            if suffix_start < prefix_end:
+                return None
+            
+            row_pattern = re.compile(b"<" + re.escape(namespace) + rb"row[\s>/]")
+            boundaries = [prefix_end]
+            for index in range(1, count):
+                target = prefix_end + (suffix_start - prefix_end) * index // count
+                row = row_pattern.search(data, max(target, boundaries[-1] + 1), suffix_start)
+                if row is None:
+                    break
+                boundaries.append(row.start())
+            if len(boundaries) < 2:
+                return None
+            boundaries.append(suffix_start)
+            
+            chunks = []
+            first_row = None
+            for start, end in zip(boundaries, boundaries[1:]):
+                if end == suffix_start:
+                    last_row = None
+                else:
+                    # Čísla riadkov na hranici: posledný riadok pred ňou a prvý za ňou
+                    previous = data.rfind(b"<" + namespace + b"row", start, end)
+                    last_row = row_number_at(data, previous) if previous >= 0 else None
+                    next_row = row_number_at(data, end)
+                    if last_row is None or next_row is None or next_row <= last_row:
+                        return None
+                chunks.append((start, end, first_row, last_row))
+                if last_row is not None:
+                    first_row = last_row + 1
+            return prefix_end, suffix_start, chunks
+
+
+def read_sheet_chunk(path, prefix_end, suffix_start, start, end):
+    """
+    Načíta XML jednej časti hárku: začiatok XML, riadky časti a koniec XML.
+    
+    Args:
+        path (str): Súbor s rozbaleným XML hárku
+        prefix_end (int): Koniec začiatku XML (za značkou sheetData)
+        suffix_start (int): Začiatok konca XML (značka </sheetData>)
+        start (int): Začiatok riadkov časti
+        end (int): Koniec riadkov časti
+    
+    Returns:
+        bytes: Samostatne čitateľné XML časti hárku
+    """
+    with open(path, "rb") as f:
+        prefix = f.read(prefix_end)
+        f.seek(start)
+        rows = f.read(end - start)
+        f.seek(suffix_start)
+        return prefix + rows + f.read()
+
+
+class NativeWorkbook:
+    """
+    Zošit .xlsx otvorený na čítanie hodnôt.
+    """
+    
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Cesta k súboru .xlsx
+        """
+        self.archive = open_zip(path)
+        try:
+            self.load()
+        except Exception:
+            self.archive.close()
+            raise
+    
+    def load(self):
+        """Načíta zoznam hárkov, zdieľané texty a formáty dátumov"""
+        workbook_part = find_relationship(read_relationships(self.archive, ""), OFFICE_DOCUMENT_REL)
+        if workbook_part is None:
+            workbook_part = "xl/workbook.xml"
+        relationships = read_relationships(self.archive, workbook_part)
+        
+        self.epoch = WINDOWS_EPOCH
+        self.sheetnames = []
+        self.sheet_parts = {}
+        with self.archive.open(workbook_part) as f:
+            for _, element in ET.iterparse(f):
+                if element.tag == S_WORKBOOK_PR:
+                    if element.get("date1904", "").lower() in ("1", "true"):
+                        self.epoch = MAC_EPOCH
+                elif element.tag == S_SHEET:
+                    name = element.get("name")
+                    rel_type, part = relationships.get(element.get(R_ID), ("", None))
+                    self.sheetnames.append(name)
+                    if rel_type.endswith(WORKSHEET_REL):
+                        self.sheet_parts[name] = part
+        
+        self.shared_strings = read_shared_strings(
+            self.archive, find_relationship(relationships, SHARED_STRINGS_REL))
+        self.date_styles, self.timedelta_styles = read_date_styles(
+            self.archive, find_relationship(relationships, STYLES_REL))
+    
+    @property
+    def worksheets(self):
+        """Hárky s údajmi (bez hárkov s grafmi) v poradí zošita"""
+        return [self[name] for name in self.sheetnames if name in self.sheet_parts]
+    
+    def __getitem__(self, name):
+        if name not in self.sheet_parts:
+            raise KeyError(f"Worksheet {name} does not exist.")
+        return NativeWorksheet(self, name, self.sheet_parts[name])
+    
+    def close(self):
+        """Zatvorí archív zošita"""
+        self.archive.close()
+
+
+def load_workbook(path):
+    """
+    Otvorí zošit .xlsx na čítanie hodnôt bez openpyxl.
+    
+    Args:
+        path (str): Cesta k súboru .xlsx
+    
+    Returns:
+        NativeWorkbook: Zošit, ktorý je potrebné zatvoriť
+    """
+    return NativeWorkbook(path)
+
+
+def compare_workbook(path):
+    """
+    Porovná hodnoty všetkých hárkov načítané vlastným čítaním a cez openpyxl.
+    
+    Args:
+        path (str): Cesta k súboru .xlsx
+    
+    Returns:
+        bool: True, ak sú hodnoty všetkých hárkov zhodné
+    """
+    from openpyxl import load_workbook as openpyxl_load_workbook
+    
+    start = time.perf_counter()
+    reference = openpyxl_load_workbook(path, read_only=True, data_only=True, keep_links=False)
+    try:
+        expected = {
+            sheet.title: (sheet.max_column, list(sheet.iter_rows(values_only=True)))
+            for sheet in reference.worksheets
+        }
+    finally:
+        reference.close()
+    openpyxl_seconds = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    workbook = load_workbook(path)
+    try:
+        actual = {
+            sheet.title: (sheet.max_column, list(sheet.iter_rows(values_only=True)))
+            for sheet in workbook.worksheets
+        }
+    finally:
+        workbook.close()
+    native_seconds = time.perf_counter() - start
+    
+    same = True
+    if list(expected) != list(actual):
+        print(f"  Rozdielne hárky: {list(expected)} / {list(actual)}")
+        same = False
+    for title in expected:
+        if title not in actual:
+            continue
+        expected_columns, expected_rows = expected[title]
+        actual_columns, actual_rows = actual[title]
+        if expected_columns != actual_columns:
+            print(f"  Hárok '{title}': rozdielny počet stĺpcov {expected_columns} / {actual_columns}")
+            same = False
+        if len(expected_rows) != len(actual_rows):
+            print(f"  Hárok '{title}': rozdielny počet riadkov {len(expected_rows)} / {len(actual_rows)}")
+            same = False
+        for index, (expected_row, actual_row) in enumerate(zip(expected_rows, actual_rows), start=1):
+            if list(expected_row) != list(actual_row):
+                print(f"  Hárok '{title}', riadok {index}: {expected_row!r} / {actual_row!r}")
+                same = False
+                break
+    
+    print(f"  openpyxl: {openpyxl_seconds:.3f} s, vlastné čítanie: {native_seconds:.3f} s")
+    return same
+
+
+def main():
+    """Hlavná funkcia"""
+    if len(sys.argv) < 2:
+        print("Použitie:")
+        print("  python blocky_xlsx.py zosit.xlsx [zosit2.xlsx ...]")
+        print()
+        print("Porovná hodnoty hárkov načítané vlastným čítaním a cez openpyxl.")
+        return 1
+    
+    failed = 0
+    for path in sys.argv[1:]:
+        print(f"{path}:")
+        try:
+            same = compare_workbook(path)
+        except Exception as e:
+            print(f"  Chyba: {str(e)}")
+            same = False
+        print("  Zhodné" if same else "  ROZDIELNE")
+        failed += not same
+    
+    print(f"Porovnaných súborov: {len(sys.argv) - 1}, rozdielnych: {failed}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
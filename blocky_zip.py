@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Čítanie .docx a .xlsx archívov cez pamäťovo mapovaný súbor
+
+Súbory .docx a .xlsx sú ZIP archívy, v ktorých konvertory potrebujú iba
+niekoľko častí (word/document.xml, xl/sharedStrings.xml,
+xl/worksheets/sheetN.xml). Veľké zošity a dokumenty však často obsahujú
+aj obrázky a iné prílohy s desiatkami MB.
+
+MappedZip namapuje celý archív do pamäte (mmap, iba na čítanie) a:
+
+    - z adresára archívu zistí polohu častí bez čítania ich obsahu,
+    - vybranú časť rozbaľuje postupne priamo z mapovanej pamäte
+      (zlib dostáva pohľady memoryview, komprimované údaje sa do pamäte
+      Pythonu nekopírujú),
+    - ostatné časti (obrázky, vložené súbory) sa vôbec nenačítajú;
+      operačný systém načíta z disku iba stránky, ktoré sa skutočne čítajú.
+
+Mapovanie zdieľa vyrovnávaciu pamäť súborov operačného systému, takže
+pri dávkovej konverzii viacerými procesmi sa archív v pamäti nekopíruje.
+
+Podporované sú časti bez kompresie (stored) a s kompresiou deflate, ktoré
+používa Office. Iné časti sa čítajú cez zipfile.
+"""
+
+import io
+import os
+import mmap
+import zlib
+import struct
+import zipfile
+
+
+# Veľkosť komprimovaného bloku odovzdaného naraz do zlib
+CHUNK_SIZE = 16 * 1024
+
+# Veľkosť vyrovnávacej pamäte pre čítanie rozbalenej časti
+BUFFER_SIZE = 64 * 1024
+
+# Lokálna hlavička súboru v ZIP archíve (pevná časť má 30 bajtov)
+LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+
+
+class MappedFile(io.RawIOBase):
+    """
+    Súbor iba na čítanie nad mapovanou pamäťou.
+    
+    Slúži ako vstup pre zipfile pri čítaní adresára archívu.
+    """
+    
+    def __init__(self, mapping):
+        """
+        Args:
+            mapping (mmap.mmap): Mapovaný súbor
+        """
+        super().__init__()
+        self.mapping = mapping
+        self.position = 0
+    
+    def readable(self):
+        return True
+    
+    def seekable(self):
+        return True
+    
+    def tell(self):
+        return self.position
+    
+    def seek(self, offset, whence=io.SEEK_SET):
+        if whence == io.SEEK_CUR:
+            offset += self.position
+        elif whence == io.SEEK_END:
+            offset += len(self.mapping)
+        if offset < 0:
+            raise ValueError("Záporná pozícia v súbore")
+        self.position = offset
+        return offset
+    
+    def read(self, size=-1):
+        end = len(self.mapping) if size is None or size < 0 else min(self.position + size, len(self.mapping))
+        data = self.mapping[self.position:end]
+        self.position = max(end, self.position)
+        return data
+    
+    def readinto(self, buffer):
+        data = self.read(len(buffer))
+        buffer[:len(data)] = data
+        return len(data)
+
+
+class MappedPartReader(io.RawIOBase):
+    """
+    Postupné rozbaľovanie jednej časti archívu priamo z mapovanej pamäte.
+    """
+    
+    def __init__(self, mapping, info, data_offset):
+        """
+        Args:
+            mapping (mmap.mmap): Mapovaný archív
+            info (zipfile.ZipInfo): Údaje o časti z adresára archívu
+            data_offset (int): Poloha komprimovaných údajov v archíve
+        """
+        super().__init__()
+        self.mapping = mapping
+        self.info = info
+        self.position = data_offset
+        self.end = data_offset + info.compress_size
+        self.decompressor = zlib.decompressobj(-zlib.MAX_WBITS) if info.compress_type == zipfile.ZIP_DEFLATED else None
+        self.pending = b""
+        self.pending_offset = 0
+        self.crc = 0
+        self.size = 0
+    
+    def readable(self):
+        return True
+    
+    def next_chunk(self):
+        """Rozbalí ďalší blok komprimovaných údajov"""
+        if self.position >= self.end:
+            if self.decompressor is not None:
+                self.pending = self.decompressor.flush()
+                self.decompressor = None
+                if self.pending:
+                    return
+            self.check()
+            return
+        
+        stop = min(self.position + CHUNK_SIZE, self.end)
+        with memoryview(self.mapping) as view:
+            chunk = view[self.position:stop]
+            if self.decompressor is not None:
+                self.pending = self.decompressor.decompress(chunk)
+            else:
+                self.pending = bytes(chunk)
+            chunk.release()
+        self.position = stop
+    
+    def check(self):
+        """Overí veľkosť a kontrolný súčet rozbalenej časti"""
+        if self.size != self.info.file_size or self.crc != self.info.CRC:
+            raise zipfile.BadZipFile(f"Poškodená časť archívu: {self.info.filename}")
+        self.size = -1
+    
+    def readinto(self, buffer):
+        while self.pending_offset >= len(self.pending):
+            if self.size < 0:
+                return 0
+            self.pending = b""
+            self.pending_offset = 0
+            self.next_chunk()
+            if self.pending:
+                self.crc = zlib.crc32(self.pending, self.crc)
+                self.size += len(self.pending)
+        
+        count = min(len(buffer), len(self.pending) - self.pending_offset)
+        with memoryview(self.pending) as pending:
+            buffer[:count] = pending[self.pending_offset:self.pending_offset + count]
+        self.pending_offset += count
+        return count
+
+
+class MappedZip:
+    """
+    ZIP archív (.docx, .xlsx) otvorený cez pamäťovo mapovaný súbor.
+    
+    Rozhranie zodpovedá podmnožine zipfile.ZipFile, ktorú používajú
+    konvertory: namelist, getinfo, open, read a close.
+    """
+    
+    def __init__(self, path):
+        """
+        Args:
+            path (str): Cesta k archívu
+        """
+        self.file = open(path, "rb")
+        try:
+            if os.fstat(self.file.fileno()).st_size == 0:
+                raise zipfile.BadZipFile("File is not a zip file")
+            self.mapping = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            self.file.close()
+            raise
+        
+        # zipfile prečíta iba adresár na konci archívu
+        self.archive = zipfile.ZipFile(MappedFile(self.mapping))
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def namelist(self):
+        """Vráti názvy častí archívu"""
+        return self.archive.namelist()
+    
+    def getinfo(self, name):
+        """Vráti údaje o časti archívu (KeyError, ak časť neexistuje)"""
+        return self.archive.getinfo(name)
+    
+    def data_offset(self, info):
+        """
+        Vráti polohu komprimovaných údajov časti v archíve.
+        
+        Args:
+            info (zipfile.ZipInfo): Údaje o časti
+        
+        Returns:
+            int: Poloha prvého bajtu údajov
+        """
+        header = self.mapping[info.header_offset:info.header_offset + LOCAL_HEADER.size]
+        if len(header) != LOCAL_HEADER.size:
+            raise zipfile.BadZipFile(f"Poškodená hlavička časti: {info.filename}")
+        fields = LOCAL_HEADER.unpack(header)
+        if fields[0] != LOCAL_HEADER_SIGNATURE:
+            raise zipfile.BadZipFile(f"Poškodená hlavička časti: {info.filename}")
+        name_length, extra_length = fields[-2:]
+        return info.header_offset + LOCAL_HEADER.size + name_length + extra_length
+    
+    def open(self, name):
+        """
+        Otvorí časť archívu na postupné čítanie.
+        
+        Args:
+            name (str): Názov časti (napr. "word/document.xml")
+        
+        Returns:
+            file: Binárny súbor s rozbaleným obsahom časti
+        """
+        info = self.getinfo(name)
+        encrypted = info.flag_bits & 0x1
+        if encrypted or info.compress_type not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            return self.archive.open(info)
+        return io.BufferedReader(MappedPartReader(self.mapping, info, self.data_offset(info)), BUFFER_SIZE)
+    
+    def read(self, name):
+        """Vráti celý rozbalený obsah časti"""
+        with self.open(name) as part:
+            return part.read()
+    
+    def close(self):
+        """Zatvorí archív a zruší mapovanie súboru"""
+        self.archive.close()
+        self.mapping.close()
+        self.file.close()
+
+
+def open_zip(source):
+    """
+    Otvorí .docx alebo .xlsx archív.
+    
+    Súbor na disku sa otvorí cez MappedZip, otvorený súbor (napr. BytesIO)
+    cez zipfile.ZipFile.
+    
+    Args:
+        source: Cesta k archívu alebo otvorený binárny súbor
+    
+    Returns:
+        MappedZip alebo zipfile.ZipFile: Otvorený archív
+    """
+    if isinstance(source, (str, os.PathLike)):
+        return MappedZip(source)
+    return zipfile.ZipFile(source)
@@ -9,7 +9,49 @@ do aplikácie Blocky. Skript vytvorí textový súbor s položkami vo formáte,
 ktorý je možné manuálne zadať do aplikácie.
 
 Použitie:
-    python excel_to_blocky.py input.xlsx output.txt
+    python excel_to_blocky.py input.xlsx output.txt [--engine=pandas]
+
+Prepínače:
+    --engine=auto    - Súbory .xlsx sa čítajú postupne, .xls cez pandas
+                       (predvolené; pandas sa pri .xlsx vôbec nenačíta)
+    --engine=pandas  - Načítanie celého hárku cez pandas
+    --engine=stream  - Postupné čítanie riadok po riadku cez openpyxl
+                       v režime iba na čítanie; pamäť nerastie s veľkosťou
+                       súboru a výstup je zhodný s režimom pandas
+    --engine=native  - Postupné čítanie vlastným čítaním .xlsx bez openpyxl
+                       (pozri blocky_xlsx.py); zdieľané texty sa načítajú
+                       raz, zo štýlov iba formáty dátumov; výstup je zhodný
+                       s režimom stream
+    --engine=parallel - Ako native, prvý hárok sa však rozdelí na časti
+                       podľa riadkov, ktoré sa spracujú súbežne v --workers
+                       procesoch; výstup je zhodný s režimom native
+    --cache          - Nezmenené súbory sa neskonvertujú znova, výstup sa
+                       vytvorí z vyrovnávacej pamäte (pozri blocky_cache.py)
+    --binary=cesta   - Okrem textového súboru zapíše aj binárny súbor .blkb
+                       s popismi, sumami v centoch a číslami riadkov
+                       (pozri blocky_binary.py)
+    --incremental    - Prírastková konverzia: do existujúceho výstupu sa doplnia
+                       iba nové riadky od posledného spustenia a súhrn sa
+                       aktualizuje; stav sa ukladá do output.txt.state.json
+                       (nedá sa kombinovať s --dedup; s --binary, --sheets
+                       alebo iným --engine ako stream sa vytvorí celý výstup)
+    --sheets=all     - Skonvertuje všetky hárky zošita do jedného výstupu
+                       s medzisúčtom za každý hárok
+    --sheets=Jan,Feb - Iba vybrané hárky (názvy alebo poradové čísla od 1)
+    --workers=N      - Počet procesov pre súbežné spracovanie hárkov
+                       alebo častí hárku (--engine=parallel)
+    --description-column=Popis - Stĺpec popisu podľa názvu v hlavičke
+                       (alebo poradové číslo od 1); predvolene prvý stĺpec
+    --amount-column=Suma       - Stĺpec sumy podľa názvu v hlavičke
+                       (alebo poradové číslo od 1); predvolene druhý stĺpec
+    --dedup          - Vynechá položky, ktoré už boli vytvorené pri skoršej
+                       konverzii (--dedup-index=cesta, --dedup-report=cesta;
+                       pozri blocky_dedup.py)
+    --date-column=Dátum        - Pri kontrole duplicít rozlišuje položky
+                       aj podľa dátumu zo zadaného stĺpca
+    --metrics        - Vypíše čas a pamäť jednotlivých fáz konverzie
+                       (--metrics=json alebo --metrics=subor.json pre JSON)
+    --profile=cesta  - Zapíše profil cProfile (pozri blocky_metrics.py)
 
 Požiadavky:
     - Python 3.6+
@@ -21,84 +63,1504 @@ Inštalácia požiadaviek:
 """
 
 import sys
-import pandas as pd
 import os
+import io
+import json
+import shutil
+import hashlib
+import tempfile
+from contextlib import contextmanager, redirect_stdout
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import islice
+
+from blocky_cli import parse_arguments
+from blocky_cache import cache_from_options, CACHE_ERRORS
+from blocky_dedup import dedup_from_options, DEDUP_ERRORS
+from blocky_amounts import format_amount_cents, format_cents, add_cents, amount_to_cents
+from blocky_binary import BlockyBinaryWriter
+from blocky_metrics import stage, add_rows, run_measured
+
+
+# Dostupné spôsoby načítania Excel súboru; pandas sa načíta iba pri použití
+ENGINES = ("auto", "pandas", "stream", "native", "parallel")
+
+# Najmenšia veľkosť XML jednej časti hárku pri --engine=parallel (v bajtoch);
+# menšie hárky sa spracujú v jednom procese
+MIN_CHUNK_BYTES = 1024 * 1024
+
+# Zošit načítaný v pracovnom procese pri --engine=parallel (pozri init_chunk_worker)
+_chunk_workbook = None
+
+# Verzia súboru so stavom prírastkovej konverzie
+INCREMENTAL_STATE_VERSION = 2
+
+# Hodnoty, ktoré pandas pri načítaní Excel súboru považuje za prázdne (NaN)
+PANDAS_NA_VALUES = frozenset([
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null",
+])
+
+# Chybové hodnoty buniek, ktoré pandas načíta ako prázdne (NaN)
+EXCEL_ERROR_VALUES = frozenset([
+    "#NULL!", "#DIV/0!", "#VALUE!", "#REF!", "#NAME?", "#NUM!", "#N/A",
+])
+
+
+def write_header(f, input_file_name):
+    """
+    Zapíše úvodnú hlavičku výstupného súboru pre aplikáciu Blocky.
+    
+    Args:
+        f (file): Otvorený výstupný súbor
+        input_file_name (str): Názov vstupného súboru
+    """
+    f.write("# Položky pre import do aplikácie Blocky\n")
+    f.write("# Vytvorené: " + datetime.now().strftime("%d.%m.%Y %H:%M:%S") + "\n")
+    f.write("# Zdrojový súbor: " + input_file_name + "\n")
+    f.write("#\n")
+    f.write("# Formát: Popis | Suma\n")
+    f.write("# Záporné sumy sú označené znamienkom mínus (-)\n")
+    f.write("#\n")
+
+
+def write_summary(f, total_cents, valid_items, invalid_items):
+    """
+    Zapíše súhrn na koniec výstupného súboru.
+    
+    Args:
+        f (file): Otvorený výstupný súbor
+        total_cents (int): Celková suma položiek v centoch
+        valid_items (int): Počet platných položiek
+        invalid_items (int): Počet neplatných položiek
+    """
+    f.write("#\n")
+    f.write(f"# Celková suma: {format_cents(total_cents, '.')}\n")
+    f.write(f"# Počet položiek: {valid_items}\n")
+    if invalid_items > 0:
+        f.write(f"# Počet neplatných položiek: {invalid_items}\n")
+
+
+def print_summary(output_file, total_cents, valid_items, invalid_items):
+    """Vypíše výsledok konverzie na obrazovku"""
+    print(f"Konverzia dokončená. Výstupný súbor: {output_file}")
+    print(f"Celkový počet položiek: {valid_items}")
+    print(f"Celková suma: {format_cents(total_cents, '.')}")
+    if invalid_items > 0:
+        print(f"Počet neplatných položiek: {invalid_items}")
+
+
+def coerce_float(value):
+    """
+    Prevedie hodnotu na float rovnako ako float(), pri chybe vráti NaN.
+    
+    Args:
+        value: Hodnota bunky
+    
+    Returns:
+        float: Číselná hodnota alebo NaN
+    """
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return float('nan')
+
+
+def description_column_text(column):
+    """
+    Prevedie celý stĺpec popisov na text naraz.
+    
+    Výsledok je zhodný s postupným čítaním (str(normalize_cell_value(...))):
+    celé čísla, ktoré pandas v stĺpci s prázdnymi bunkami uloží ako float,
+    sú bez desatinnej časti ("5", nie "5.0") a prázdne bunky sú "nan"
+    v každej verzii pandas.
+    
+    Args:
+        column (pandas.Series): Stĺpec popisov z DataFrame
+    
+    Returns:
+        pandas.Series: Texty popisov bez medzier na začiatku a konci
+    """
+    import pandas as pd
+    
+    if pd.api.types.is_float_dtype(column):
+        whole_mask = column % 1 == 0
+        if whole_mask.any():
+            column = column.astype(object)
+            column[whole_mask] = [str(int(value)) for value in column[whole_mask]]
+    
+    # Novšie verzie pandas nechajú prázdne hodnoty aj po prevode na text ako NaN
+    texts = column.astype(str)
+    texts = texts.where(texts.notna(), "nan")
+    return texts.str.strip()
+
+
+def coerce_amount_column(column):
+    """
+    Prevedie celý stĺpec súm na čísla naraz.
+    
+    Hodnoty, ktoré nie je možné previesť na číslo, sú označené ako neplatné.
+    Prázdne bunky (NaN) zostávajú platné, rovnako ako pri float(NaN).
+    
+    Args:
+        column (pandas.Series): Stĺpec súm z DataFrame
+    
+    Returns:
+        tuple: (stĺpec súm ako float, maska neplatných riadkov)
+    """
+    import pandas as pd
+    
+    if pd.api.types.is_bool_dtype(column) or pd.api.types.is_numeric_dtype(column):
+        amounts = column.astype(float)
+    elif pd.api.types.is_object_dtype(column) or pd.api.types.is_string_dtype(column):
+        amounts = pd.to_numeric(column, errors='coerce').astype(float)
+        
+        # Hodnoty, ktoré to_numeric odmietol, ale float() ich prijme (napr. " 12.5 ")
+        retry_mask = amounts.isna() & column.notna()
+        if retry_mask.any():
+            amounts[retry_mask] = [coerce_float(value) for value in column[retry_mask]]
+    else:
+        # Dátumy a iné typy nie sú platné sumy
+        amounts = pd.Series(float('nan'), index=column.index)
+    
+    invalid_mask = amounts.isna() & column.notna()
+    return amounts, invalid_mask
+
+
+def amount_column_cents(amounts):
+    """
+    Vypočíta presný súčet stĺpca súm v celých centoch.
+    
+    Každá suma sa zaokrúhli na centy rovnako ako "{:.2f}" vo výstupe.
+    Zaokrúhlenie prebehne naraz pre celý stĺpec (numpy); iba hodnoty,
+    pri ktorých by násobenie 100 mohlo zmeniť zaokrúhlenie (takmer presná
+    polovica centu alebo veľmi veľké sumy), sa prevedú cez text.
+    
+    Args:
+        amounts (pandas.Series): Platné sumy ako float (NaN = prázdna suma)
+    
+    Returns:
+        int: Celková suma v centoch, MISSING_CENTS, ak niektorá suma chýba,
+             alebo hodnota z INFINITE_CENTS pre nekonečnú sumu
+    """
+    import numpy as np
+    
+    values = amounts.to_numpy(dtype=float)
+    if len(values) == 0:
+        return 0
+    finite = np.isfinite(values)
+    if not finite.all():
+        # Celková suma je prázdna alebo nekonečná ako pri float súčte
+        total_cents = 0
+        for value in values[~finite].tolist():
+            total_cents = add_cents(total_cents, amount_to_cents(value))
+        return total_cents
+    
+    scaled = values * 100
+    cents = np.rint(scaled)
+    
+    # Chyba násobenia je najviac |scaled| * 2^-53; v tejto vzdialenosti
+    # od polovice centu sa zaokrúhlenie overí presne cez text
+    fraction = np.abs(scaled - np.trunc(scaled))
+    uncertain = np.abs(fraction - 0.5) <= np.abs(scaled) * 2.0 ** -50
+    
+    total_cents = int(cents[~uncertain].astype(np.int64).sum())
+    for value in values[uncertain].tolist():
+        total_cents += format_amount_cents(value)[1]
+    return total_cents
+
+
+def find_column(column_names, name, default):
+    """
+    Nájde stĺpec podľa názvu v hlavičke.
+    
+    Názov sa porovná najprv presne, potom bez ohľadu na veľkosť písmen.
+    Ak stĺpec s takým názvom neexistuje, číslo sa použije ako poradie
+    stĺpca od 1.
+    
+    Args:
+        column_names (list): Názvy stĺpcov z hlavičky
+        name (str): Hľadaný názov stĺpca alebo None
+        default (int): Index stĺpca, ak názov nie je zadaný
+    
+    Returns:
+        int: Index stĺpca alebo None, ak sa stĺpec nenašiel
+    """
+    if name is None:
+        return default
+    
+    names = [str(column).strip() for column in column_names]
+    wanted = str(name).strip()
+    if wanted in names:
+        return names.index(wanted)
+    
+    lowered = [column.casefold() for column in names]
+    if wanted.casefold() in lowered:
+        return lowered.index(wanted.casefold())
+    
+    if wanted.isdigit() and 1 <= int(wanted) <= len(names):
+        return int(wanted) - 1
+    
+    return None
 
 
-def convert_excel_to_blocky(input_file, output_file):
+def resolve_columns(column_names, description_column=None, amount_column=None, date_column=None):
+    """
+    Určí stĺpce popisu, sumy a prípadne dátumu.
+    
+    Args:
+        column_names (list): Názvy stĺpcov z hlavičky
+        description_column (str): Názov stĺpca popisu (None = prvý stĺpec)
+        amount_column (str): Názov stĺpca sumy (None = druhý stĺpec)
+        date_column (str): Názov stĺpca dátumu pre kontrolu duplicít alebo None
+    
+    Returns:
+        tuple: (index stĺpca popisu, index stĺpca sumy[, index stĺpca dátumu])
+               alebo None pri chybe
+    """
+    # Kontrola, či Excel obsahuje potrebné stĺpce
+    if len(column_names) < 2:
+        print("Chyba: Excel súbor musí obsahovať aspoň 2 stĺpce (popis a suma)")
+        return None
+    
+    description_index = find_column(column_names, description_column, 0)
+    if description_index is None:
+        print(f"Chyba: Stĺpec popisu '{description_column}' sa v hlavičke nenašiel")
+        return None
+    
+    amount_index = find_column(column_names, amount_column, 1)
+    if amount_index is None:
+        print(f"Chyba: Stĺpec sumy '{amount_column}' sa v hlavičke nenašiel")
+        return None
+    
+    print(f"Používam stĺpce: '{column_names[description_index]}' pre popis "
+          f"a '{column_names[amount_index]}' pre sumu")
+    
+    if date_column is None:
+        return description_index, amount_index
+    
+    date_index = find_column(column_names, date_column, None)
+    if date_index is None:
+        print(f"Chyba: Stĺpec dátumu '{date_column}' sa v hlavičke nenašiel")
+        return None
+    return description_index, amount_index, date_index
+
+
+def convert_excel_to_blocky(input_file, output_file, engine="auto", cache=None, binary_file=None,
+                            sheets=None, description_column=None, amount_column=None, workers=None,
+                            dedup=None):
     """
     Konvertuje Excel súbor na formát pre aplikáciu Blocky.
     
     Args:
         input_file (str): Cesta k vstupnému Excel súboru
         output_file (str): Cesta k výstupnému textovému súboru
+        engine (str): Spôsob načítania súboru (jeden z ENGINES)
+        cache (ConversionCache): Vyrovnávacia pamäť položiek alebo None
+        binary_file (str): Cesta k binárnemu súboru .blkb alebo None
+        sheets (str): "all" alebo zoznam hárkov oddelených čiarkou;
+                      None = iba prvý hárok
+        description_column (str): Názov stĺpca popisu (None = prvý stĺpec)
+        amount_column (str): Názov stĺpca sumy (None = druhý stĺpec)
+        workers (int): Počet procesov pre hárky alebo časti hárku pri engine
+                       "parallel" (None = počet jadier, 1 = postupne)
+        dedup (DedupIndex): Index duplicít alebo None
+    
+    Returns:
+        bool: True, ak konverzia prebehla úspešne, inak False
+    """
+    binary = BlockyBinaryWriter(binary_file) if binary_file else None
+    columns = dedup_columns(description_column, amount_column, dedup)
+    
+    if dedup is not None and cache is not None:
+        # Uložené položky by obišli kontrolu duplicít
+        print("Upozornenie: Vyrovnávacia pamäť sa pri kontrole duplicít nepoužije")
+        cache = None
+    
+    if sheets is not None:
+        if cache is not None:
+            print("Upozornenie: Vyrovnávacia pamäť sa pri viacerých hárkoch nepoužije")
+        success = convert_excel_sheets(input_file, output_file, sheets, columns, workers, binary, dedup)
+    elif cache is not None:
+        success = convert_excel_to_blocky_cached(input_file, output_file, engine, cache, binary, columns, workers)
+    else:
+        # Položky sa zapisujú do binárneho súboru priamo počas konverzie
+        collected = {"items": binary, "warnings": []} if binary is not None else None
+        success = convert_with_engine(input_file, output_file, engine, collected, columns, dedup, workers)
+    
+    if success and binary is not None:
+        try:
+            count = binary.close()
+            print(f"Binárny súbor: {binary_file} ({count} položiek)")
+        except OSError as e:
+            print(f"Chyba pri zápise binárneho súboru: {str(e)}")
+            return False
+    
+    return success
+
+
+def dedup_columns(description_column, amount_column, dedup):
+    """
+    Vráti názvy stĺpcov pre konverziu vrátane stĺpca dátumu z indexu duplicít.
+    
+    Args:
+        description_column (str): Názov stĺpca popisu alebo None
+        amount_column (str): Názov stĺpca sumy alebo None
+        dedup (DedupIndex): Index duplicít alebo None
+    
+    Returns:
+        tuple: (popis, suma) alebo (popis, suma, dátum)
+    """
+    if dedup is None or dedup.date_column is None:
+        return description_column, amount_column
+    return description_column, amount_column, dedup.date_column
+
+
+def convert_with_engine(input_file, output_file, engine, collected=None, columns=(None, None), dedup=None,
+                        workers=None):
+    """
+    Spustí konverziu zvoleným spôsobom načítania.
+    
+    Args:
+        input_file (str): Cesta k vstupnému Excel súboru
+        output_file (str): Cesta k výstupnému textovému súboru
+        engine (str): Spôsob načítania súboru (jeden z ENGINES)
+        collected (dict): Ak je zadaný, doplnia sa doň položky (popis, suma, riadok)
+                          a upozornenia
+        columns (tuple): Názvy stĺpcov (popis, suma[, dátum]); None = predvolený stĺpec
+        dedup (DedupIndex): Index duplicít alebo None
+        workers (int): Počet procesov pre engine "parallel" (None = počet jadier)
+    
+    Returns:
+        bool: True, ak konverzia prebehla úspešne, inak False
+    """
+    if engine == "auto":
+        # Bežný súbor .xlsx s dvoma stĺpcami nepotrebuje pandas
+        engine = "pandas" if input_file.endswith('.xls') else "stream"
+    
+    if engine in ("stream", "native", "parallel"):
+        if input_file.endswith('.xls'):
+            # Starý formát .xls nie je ZIP archív s XML hárkami
+            print("Upozornenie: Súbor .xls nie je možné čítať postupne, používam pandas")
+        elif engine == "parallel":
+            return convert_excel_to_blocky_chunked(input_file, output_file, collected, columns, dedup, workers)
+        else:
+            return convert_excel_to_blocky_streaming(input_file, output_file, collected, columns, dedup, engine)
+    
+    return convert_excel_to_blocky_pandas(input_file, output_file, collected, columns, dedup)
+
+
+def convert_excel_to_blocky_cached(input_file, output_file, engine, cache, binary=None, columns=(None, None),
+                                   workers=None):
+    """
+    Konvertuje Excel súbor s použitím vyrovnávacej pamäte.
+    
+    Ak sa obsah súboru od poslednej konverzie nezmenil, výstup sa vytvorí
+    z uložených položiek bez načítania Excel súboru.
+    
+    Args:
+        input_file (str): Cesta k vstupnému Excel súboru
+        output_file (str): Cesta k výstupnému textovému súboru
+        engine (str): Spôsob načítania súboru pri zmenenom obsahu
+        cache (ConversionCache): Vyrovnávacia pamäť položiek
+        binary (BlockyBinaryWriter): Zapisovač binárneho súboru alebo None
+        columns (tuple): Názvy stĺpcov (popis, suma); None = predvolený stĺpec
+        workers (int): Počet procesov pre engine "parallel" (None = počet jadier)
+    
+    Returns:
+        bool: True, ak konverzia prebehla úspešne, inak False
+    """
+    # Zvolené stĺpce menia položky, preto sú súčasťou kľúča
+    settings = {"columns": list(columns)} if any(column is not None for column in columns) else None
+    
+    try:
+        with stage("load"):
+            key = cache.make_key(input_file, "excel", settings)
+            cached = cache.get(key)
+    except OSError as e:
+        print(f"Chyba pri konverzii: {str(e)}")
+        return False
+    
+    if cached is not None:
+        print(f"Súbor sa nezmenil, používam uložené položky: {input_file}")
+        if binary is not None:
+            binary.extend(cached["items"])
+        return write_cached_items(cached, output_file, os.path.basename(input_file))
+    
+    collected = {"items": [], "warnings": []}
+    if not convert_with_engine(input_file, output_file, engine, collected, columns, workers=workers):
+        return False
+    
+    if binary is not None:
+        binary.extend(collected["items"])
+    
+    try:
+        cache.put(key, collected)
+    except OSError as e:
+        print(f"Upozornenie: Položky sa nepodarilo uložiť do vyrovnávacej pamäte: {str(e)}")
+    return True
+
+
+def write_cached_items(cached, output_file, input_file_name):
+    """
+    Vytvorí výstupný súbor z položiek uložených vo vyrovnávacej pamäti.
+    
+    Args:
+        cached (dict): Uložené položky a upozornenia
+        output_file (str): Cesta k výstupnému textovému súboru
+        input_file_name (str): Názov vstupného súboru
+    
+    Returns:
+        bool: True, ak sa podarilo uložiť súbor, inak False
+    """
+    try:
+        for message in cached["warnings"]:
+            print(message)
+        
+        with stage("write", len(cached["items"])), open(output_file, 'w', encoding='utf-8') as f:
+            write_header(f, input_file_name)
+            
+            total_cents = 0
+            for description, amount, _ in cached["items"]:
+                amount_str, cents = format_amount_cents(amount)
+                total_cents = add_cents(total_cents, cents)
+                f.write(f"{description} | {amount_str}\n")
+            
+            valid_items = len(cached["items"])
+            invalid_items = len(cached["warnings"])
+            write_summary(f, total_cents, valid_items, invalid_items)
+        
+        print_summary(output_file, total_cents, valid_items, invalid_items)
+        
+        return True
+    
+    except Exception as e:
+        print(f"Chyba pri konverzii: {str(e)}")
+        return False
+
+
+def dedup_mask(dedup, descriptions, amounts, valid_mask, dates=None):
+    """
+    Vráti masku riadkov, ktoré ešte neboli vytvorené (pre režim pandas).
+    
+    Args:
+        dedup (DedupIndex): Index duplicít
+        descriptions (Series): Popisy
+        amounts (Series): Sumy
+        valid_mask (Series): Riadky s platnou sumou
+        dates (Series): Dátumy alebo None
+    
+    Returns:
+        Series: Riadky s platnou sumou, ktoré nie sú duplicitné
+    """
+    import pandas as pd
+    
+    date_values = dates.tolist() if dates is not None else [None] * len(valid_mask)
+    keep = [
+        valid and dedup.is_new(description, amount_to_cents(amount), date_value)
+        for description, amount, valid, date_value
+        in zip(descriptions.tolist(), amounts.tolist(), valid_mask.tolist(), date_values)
+    ]
+    return pd.Series(keep, index=valid_mask.index)
+
+
+def convert_excel_to_blocky_pandas(input_file, output_file, collected=None, columns=(None, None), dedup=None):
+    """
+    Konvertuje Excel súbor načítaním celého hárku cez pandas.
+    
+    Args:
+        input_file (str): Cesta k vstupnému Excel súboru
+        output_file (str): Cesta k výstupnému textovému súboru
+        collected (dict): Ak je zadaný, doplnia sa doň položky (popis, suma, riadok)
+                          a upozornenia
+        columns (tuple): Názvy stĺpcov (popis, suma[, dátum]); None = predvolený stĺpec
+        dedup (DedupIndex): Index duplicít alebo None
+    
+    Returns:
+        bool: True, ak konverzia prebehla úspešne, inak False
     """
     try:
         # Načítanie Excel súboru
         print(f"Načítavam Excel súbor: {input_file}")
-        df = pd.read_excel(input_file)
+        with stage("load"):
+            import pandas as pd
+            df = pd.read_excel(input_file)
+        add_rows("load", len(df))
         
-        # Kontrola, či Excel obsahuje potrebné stĺpce
-        if len(df.columns) < 2:
-            print("Chyba: Excel súbor musí obsahovať aspoň 2 stĺpce (popis a suma)")
+        # Predvolene je prvý stĺpec popis a druhý suma
+        column_indexes = resolve_columns(list(df.columns), *columns)
+        if column_indexes is None:
             return False
         
-        # Predpokladáme, že prvý stĺpec je popis a druhý je suma
-        description_col = df.columns[0]
-        amount_col = df.columns[1]
-        
-        print(f"Používam stĺpce: '{description_col}' pre popis a '{amount_col}' pre sumu")
+        description_col = df.columns[column_indexes[0]]
+        amount_col = df.columns[column_indexes[1]]
         
         # Vytvorenie výstupného súboru
         with open(output_file, 'w', encoding='utf-8') as f:
-            f.write("# Položky pre import do aplikácie Blocky\n")
-            f.write("# Vytvorené: " + datetime.now().strftime("%d.%m.%Y %H:%M:%S") + "\n")
-            f.write("# Zdrojový súbor: " + os.path.basename(input_file) + "\n")
-            f.write("#\n")
-            f.write("# Formát: Popis | Suma\n")
-            f.write("# Záporné sumy sú označené znamienkom mínus (-)\n")
-            f.write("#\n")
-            
-            # Zápis položiek
-            total_amount = 0
+            write_header(f, os.path.basename(input_file))
+            
+            # Spracovanie súm naraz pre celý stĺpec
+            with stage("parse", len(df)):
+                descriptions = description_column_text(df[description_col])
+            with stage("amounts", len(df)):
+                amounts, invalid_mask = coerce_amount_column(df[amount_col])
+                valid_mask = ~invalid_mask
+            
+            # Upozornenia na neplatné sumy s číslom riadku v Exceli
+            for index, value in df[amount_col][invalid_mask].items():
+                message = f"Upozornenie: Riadok {index+2} obsahuje neplatnú sumu: {value}"
+                print(message)
+                if collected is not None:
+                    collected["warnings"].append(message)
+            
+            # Vynechanie položiek vytvorených pri skoršej konverzii
+            if dedup is not None:
+                with stage("dedup", len(df)):
+                    dates = df[df.columns[column_indexes[2]]] if len(column_indexes) > 2 else None
+                    valid_mask = dedup_mask(dedup, descriptions, amounts, valid_mask, dates)
+            
+            with stage("amounts"):
+                valid_amounts = amounts[valid_mask]
+                
+                # Presný súčet v celých centoch
+                total_cents = amount_column_cents(valid_amounts)
+                valid_items = int(valid_mask.sum())
+                invalid_items = int(invalid_mask.sum())
+            
+            # Formátovanie a zápis všetkých položiek naraz
+            with stage("render", valid_items):
+                amount_strs = valid_amounts.map('{:.2f}'.format).astype(object).str.replace('.', ',', regex=False)
+                lines = (descriptions[valid_mask] + " | " + amount_strs + "\n").tolist()
+            with stage("write", valid_items):
+                f.writelines(lines)
+            
+            if collected is not None:
+                row_numbers = (valid_amounts.index + 2).tolist()
+                collected["items"].extend(zip(descriptions[valid_mask].tolist(), valid_amounts.tolist(), row_numbers))
+            
+            # Zápis súhrnu
+            write_summary(f, total_cents, valid_items, invalid_items)
+        
+        print_summary(output_file, total_cents, valid_items, invalid_items)
+        
+        return True
+    
+    except Exception as e:
+        print(f"Chyba pri konverzii: {str(e)}")
+        return False
+
+
+def normalize_cell_value(value):
+    """
+    Upraví hodnotu bunky z openpyxl tak, ako by ju načítal pandas.
+    
+    Prázdne bunky, chybové hodnoty a textové značky prázdnej hodnoty
+    (napr. "N/A") sa zmenia na NaN a celé čísla uložené ako float na int.
+    
+    Args:
+        value: Hodnota bunky načítaná cez openpyxl
+    
+    Returns:
+        Hodnota bunky zhodná s hodnotou v DataFrame
+    """
+    if value is None:
+        return float('nan')
+    if isinstance(value, str):
+        if value in PANDAS_NA_VALUES or value in EXCEL_ERROR_VALUES:
+            return float('nan')
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def iter_sheet_rows(rows, trailing=None):
+    """
+    Prechádza riadky hárku a vynecháva prázdne riadky na konci hárku.
+    
+    Prázdne riadky uprostred hárku sa zachovajú, rovnako ako v pandas.
+    Riadky sa čítajú postupne, v pamäti sú iba čakajúce prázdne riadky.
+    
+    Args:
+        rows (iterable): Riadky hárku ako n-tice hodnôt
+        trailing (list): Ak je zadaný, vynechané prázdne riadky na konci
+                         sa doň pridajú (pre časti hárku)
+    
+    Yields:
+        tuple: Hodnoty riadku
+    """
+    pending_empty_rows = []
+    for row in rows:
+        if all(value is None or value == "" for value in row):
+            pending_empty_rows.append(row)
+            continue
+        
+        if pending_empty_rows:
+            yield from pending_empty_rows
+            pending_empty_rows = []
+        yield row
+    
+    if trailing is not None:
+        trailing.extend(pending_empty_rows)
+
+
+def read_header_names(header_row, column_count):
+    """
+    Vráti názvy stĺpcov z prvého riadku hárku.
+    
+    Args:
+        header_row (tuple): Hodnoty prvého riadku
+        column_count (int): Počet stĺpcov hárku
+    
+    Returns:
+        list: Názvy stĺpcov (prázdne hlavičky ako "Unnamed: N")
+    """
+    names = []
+    for index in range(max(column_count, len(header_row))):
+        value = header_row[index] if index < len(header_row) else None
+        if value is None or value == "":
+            names.append(f"Unnamed: {index}")
+        else:
+            names.append(normalize_cell_value(value))
+    return names
+
+
+def open_first_sheet(input_file, engine="stream"):
+    """
+    Otvorí prvý hárok Excel súboru na postupné čítanie.
+    
+    Args:
+        input_file (str): Cesta k vstupnému Excel súboru (.xlsx)
+        engine (str): "stream" pre openpyxl, "native" pre blocky_xlsx.py
+    
+    Returns:
+        tuple: (zošit, hárok) – zošit je potrebné zatvoriť
+    """
+    if engine == "native":
+        from blocky_xlsx import load_workbook as load_native_workbook
+        
+        workbook = load_native_workbook(input_file)
+        return workbook, workbook.worksheets[0]
+    
+    from openpyxl import load_workbook
+    
+    workbook = load_workbook(input_file, read_only=True, data_only=True, keep_links=False)
+    return workbook, workbook.worksheets[0]
+
+
+def write_sheet_rows(f, rows, start_index=0, totals=(0, 0, 0), collected=None, digest=None, columns=(0, 1),
+                     dedup=None):
+    """
+    Zapíše položky z riadkov hárku do výstupného súboru.
+    
+    Args:
+        f (file): Otvorený výstupný súbor
+        rows (iterable): Riadky hárku bez hlavičky
+        start_index (int): Poradie prvého riadku (bez hlavičky)
+        totals (tuple): Počiatočná (celková suma v centoch, počet platných, počet neplatných)
+        collected (dict): Ak je zadaný, doplnia sa doň položky a upozornenia
+        digest: Ak je zadaný, aktualizuje sa kontrolným súčtom riadkov
+        columns (tuple): Indexy stĺpcov (popis, suma[, dátum])
+        dedup (DedupIndex): Ak je zadaný, položky vytvorené pri skoršej
+                            konverzii sa preskočia
+    
+    Returns:
+        tuple: (celková suma v centoch, počet platných, počet neplatných, počet riadkov)
+    """
+    total_cents, valid_items, invalid_items = totals
+    description_index, amount_index = columns[:2]
+    date_index = columns[2] if len(columns) > 2 else None
+    row_count = 0
+    
+    for index, row in enumerate(rows, start=start_index):
+        row_count += 1
+        if digest is not None:
+            digest.update(repr(row).encode('utf-8'))
+        
+        description_value = normalize_cell_value(row[description_index] if len(row) > description_index else None)
+        amount_value = normalize_cell_value(row[amount_index] if len(row) > amount_index else None)
+        
+        try:
+            description = str(description_value).strip()
+            
+            # Kontrola, či je suma číselná hodnota
+            try:
+                amount = float(amount_value)
+                
+                # Formátovanie sumy a pripočítanie v centoch
+                amount_str, cents = format_amount_cents(amount)
+                if dedup is not None:
+                    date_value = row[date_index] if date_index is not None and len(row) > date_index else None
+                    if not dedup.is_new(description, cents, date_value):
+                        continue
+                total_cents = add_cents(total_cents, cents)
+                
+                # Zápis položky
+                f.write(f"{description} | {amount_str}\n")
+                valid_items += 1
+                
+                if collected is not None:
+                    collected["items"].append((description, amount, index + 2))
+            except (ValueError, TypeError):
+                message = f"Upozornenie: Riadok {index+2} obsahuje neplatnú sumu: {amount_value}"
+                print(message)
+                invalid_items += 1
+                
+                if collected is not None:
+                    collected["warnings"].append(message)
+        except Exception as e:
+            message = f"Chyba pri spracovaní riadku {index+2}: {str(e)}"
+            print(message)
+            invalid_items += 1
+            
+            if collected is not None:
+                collected["warnings"].append(message)
+    
+    return total_cents, valid_items, invalid_items, row_count
+
+
+def write_sheet_output(input_file, output_file, rows, columns, collected=None, dedup=None):
+    """
+    Vytvorí výstupný súbor z postupne čítaných riadkov hárku.
+    
+    Args:
+        input_file (str): Cesta k vstupnému Excel súboru (do hlavičky výstupu)
+        output_file (str): Cesta k výstupnému textovému súboru
+        rows (iterable): Riadky hárku bez hlavičky
+        columns (tuple): Indexy stĺpcov (popis, suma[, dátum])
+        collected (dict): Ak je zadaný, doplnia sa doň položky a upozornenia
+        dedup (DedupIndex): Index duplicít alebo None
+    
+    Returns:
+        tuple: (celková suma v centoch, počet platných, počet neplatných)
+    """
+    with open(output_file, 'w', encoding='utf-8') as f:
+        write_header(f, os.path.basename(input_file))
+        
+        # Zápis položiek; riadky sa čítajú, spracujú a zapisujú naraz
+        with stage("parse"):
+            total_cents, valid_items, invalid_items, row_count = write_sheet_rows(
+                f, rows, collected=collected, columns=columns, dedup=dedup)
+        add_rows("parse", row_count)
+        
+        # Zápis súhrnu
+        with stage("write"):
+            write_summary(f, total_cents, valid_items, invalid_items)
+    
+    return total_cents, valid_items, invalid_items
+
+
+def read_sheet_header(sheet):
+    """
+    Začne čítať hárok a vráti hlavičku a zvyšné riadky.
+    
+    Args:
+        sheet: Hárok openpyxl otvorený iba na čítanie
+    
+    Returns:
+        tuple: (hodnoty prvého riadku, názvy stĺpcov, iterátor ďalších riadkov)
+    """
+    rows = iter_sheet_rows(sheet.iter_rows(values_only=True))
+    header_row = next(rows, ())
+    column_names = read_header_names(header_row, sheet.max_column or 0)
+    return header_row, column_names, rows
+
+
+def convert_excel_to_blocky_streaming(input_file, output_file, collected=None, columns=(None, None), dedup=None,
+                                      engine="stream"):
+    """
+    Konvertuje Excel súbor na formát pre aplikáciu Blocky postupným čítaním.
+    
+    Hárok sa číta riadok po riadku cez openpyxl v režime iba na čítanie
+    (alebo vlastným čítaním z blocky_xlsx.py) a každá položka sa zapíše
+    hneď po načítaní, takže spotreba pamäte nezávisí od veľkosti súboru.
+    Výstup je zhodný s režimom pandas.
+    
+    Args:
+        input_file (str): Cesta k vstupnému Excel súboru (.xlsx)
+        output_file (str): Cesta k výstupnému textovému súboru
+        collected (dict): Ak je zadaný, doplnia sa doň položky (popis, suma, riadok)
+                          a upozornenia
+        columns (tuple): Názvy stĺpcov (popis, suma[, dátum]); None = predvolený stĺpec
+        dedup (DedupIndex): Index duplicít alebo None
+        engine (str): "stream" pre openpyxl, "native" pre blocky_xlsx.py
+    
+    Returns:
+        bool: True, ak konverzia prebehla úspešne, inak False
+    """
+    try:
+        # Načítanie Excel súboru
+        print(f"Načítavam Excel súbor: {input_file}")
+        with stage("load"):
+            workbook, sheet = open_first_sheet(input_file, engine)
+        
+        try:
+            with stage("load"):
+                _, column_names, rows = read_sheet_header(sheet)
+            
+            # Predvolene je prvý stĺpec popis a druhý suma
+            column_indexes = resolve_columns(column_names, *columns)
+            if column_indexes is None:
+                return False
+            
+            total_cents, valid_items, invalid_items = write_sheet_output(
+                input_file, output_file, rows, column_indexes, collected, dedup)
+        finally:
+            workbook.close()
+        
+        print_summary(output_file, total_cents, valid_items, invalid_items)
+        
+        return True
+    
+    except Exception as e:
+        print(f"Chyba pri konverzii: {str(e)}")
+        return False
+
+
+def init_chunk_worker(input_file):
+    """
+    Načíta zošit v pracovnom procese pri jeho štarte (--engine=parallel).
+    
+    Zdieľané texty a formáty dátumov sa tak načítajú raz za proces,
+    nie pre každú časť hárku.
+    
+    Args:
+        input_file (str): Cesta k vstupnému Excel súboru (.xlsx)
+    """
+    global _chunk_workbook
+    from blocky_xlsx import load_workbook as load_native_workbook
+    
+    _chunk_workbook = load_native_workbook(input_file)
+
+
+def write_chunk_rows(f, rows, start_index, columns, collect):
+    """
+    Zapíše položky z riadkov časti hárku a zachytí výpisy.
+    
+    Args:
+        f (file): Otvorený výstupný súbor
+        rows (iterable): Riadky časti
+        start_index (int): Poradie prvého riadku (bez hlavičky)
+        columns (tuple): Indexy stĺpcov (popis, suma)
+        collect (bool): Či sa majú vrátiť položky a upozornenia
+    
+    Returns:
+        dict: Súčty, počet riadkov, výpisy a prípadne položky
+    """
+    collected = {"items": [], "warnings": []} if collect else None
+    messages = io.StringIO()
+    with redirect_stdout(messages):
+        total_cents, valid_items, invalid_items, row_count = write_sheet_rows(
+            f, rows, start_index, collected=collected, columns=columns)
+    
+    return {
+        "total_cents": total_cents,
+        "valid_items": valid_items,
+        "invalid_items": invalid_items,
+        "rows": row_count,
+        "collected": collected,
+        "messages": messages.getvalue().splitlines(),
+    }
+
+
+def convert_chunk(task):
+    """
+    Skonvertuje jednu časť hárku do dočasného súboru (v pracovnom procese).
+    
+    Prázdne riadky na konci časti sa spracujú zvlášť ("tail"): ak za nimi
+    v ďalších častiach nie je žiadny riadok s údajmi, sú to prázdne riadky
+    na konci hárku a hlavný proces ich vynechá rovnako ako iter_sheet_rows.
+    
+    Args:
+        task (dict): Rozbalený hárok, rozsah časti a jej riadky, stĺpce,
+                     dočasný súbor a či sa majú vrátiť položky
+    
+    Returns:
+        dict: Výsledok riadkov s údajmi ("main") a prázdnych riadkov na konci
+              časti ("tail" vrátane zapísaného textu)
+    """
+    from blocky_xlsx import WorksheetChunk, read_sheet_chunk
+    
+    content = read_sheet_chunk(task["spool"], task["prefix_end"], task["suffix_start"], task["start"], task["end"])
+    sheet = WorksheetChunk(_chunk_workbook, "", content)
+    rows = sheet.iter_rows(min_row=task["first_row"], max_row=task["last_row"])
+    start_index = task["first_row"] - 2
+    
+    trailing = []
+    with open(task["path"], 'w', encoding='utf-8') as f:
+        main = write_chunk_rows(f, iter_sheet_rows(rows, trailing), start_index, task["columns"], task["collect"])
+    
+    tail_text = io.StringIO()
+    tail = write_chunk_rows(tail_text, trailing, start_index + main["rows"], task["columns"], task["collect"])
+    tail["text"] = tail_text.getvalue()
+    
+    return {"path": task["path"], "main": main, "tail": tail}
+
+
+def append_chunk_part(f, part, totals, collected=None):
+    """
+    Pripojí výsledok časti hárku k výstupu a pripočíta ho k súčtom.
+    
+    Args:
+        f (file): Otvorený výstupný súbor
+        part (dict): Výsledok z write_chunk_rows s textom ("text") alebo
+                     dočasným súborom ("path")
+        totals (tuple): (suma v centoch, počet platných, počet neplatných, počet riadkov)
+        collected (dict): Ak je zadaný, doplnia sa doň položky a upozornenia
+    
+    Returns:
+        tuple: Nové súčty
+    """
+    for message in part["messages"]:
+        print(message)
+    
+    if "path" in part:
+        with open(part["path"], 'r', encoding='utf-8') as chunk_file:
+            shutil.copyfileobj(chunk_file, f)
+    else:
+        f.write(part["text"])
+    
+    if collected is not None:
+        collected["items"].extend(part["collected"]["items"])
+        collected["warnings"].extend(part["collected"]["warnings"])
+    
+    total_cents, valid_items, invalid_items, row_count = totals
+    return (add_cents(total_cents, part["total_cents"]), valid_items + part["valid_items"],
+            invalid_items + part["invalid_items"], row_count + part["rows"])
+
+
+def convert_excel_to_blocky_chunked(input_file, output_file, collected=None, columns=(None, None), dedup=None,
+                                    workers=None):
+    """
+    Konvertuje prvý hárok Excel súboru paralelne po častiach.
+    
+    Rozbalené XML hárku sa rozdelí na súvislé rozsahy riadkov (pozri
+    split_sheet_rows v blocky_xlsx.py) a každý rozsah sa spracuje
+    v samostatnom procese do dočasného súboru. Hlavný proces spojí dočasné
+    súbory v poradí riadkov a postupne sčíta sumy v centoch, takže výstup
+    je zhodný s režimom native vrátane čísel riadkov v upozorneniach.
+    
+    Malý hárok, hárok bez čísel riadkov na hraniciach častí a konverzia
+    s kontrolou duplicít sa spracujú v jednom procese.
+    
+    Args:
+        input_file (str): Cesta k vstupnému Excel súboru (.xlsx)
+        output_file (str): Cesta k výstupnému textovému súboru
+        collected (dict): Ak je zadaný, doplnia sa doň položky (popis, suma, riadok)
+                          a upozornenia
+        columns (tuple): Názvy stĺpcov (popis, suma[, dátum]); None = predvolený stĺpec
+        dedup (DedupIndex): Index duplicít alebo None
+        workers (int): Počet procesov (None = počet jadier, 1 = postupne)
+    
+    Returns:
+        bool: True, ak konverzia prebehla úspešne, inak False
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or dedup is not None:
+        # Index duplicít je jedno spojenie s databázou, riadky sa musia spracovať postupne
+        return convert_excel_to_blocky_streaming(input_file, output_file, collected, columns, dedup, "native")
+    
+    try:
+        from blocky_xlsx import split_sheet_rows
+        
+        # Načítanie Excel súboru
+        print(f"Načítavam Excel súbor: {input_file}")
+        with stage("load"):
+            workbook, sheet = open_first_sheet(input_file, "native")
+        
+        temp_dir = tempfile.mkdtemp(prefix=".blocky-chunks-", dir=os.path.dirname(os.path.abspath(output_file)))
+        executor = None
+        try:
+            with stage("load"):
+                header_row = next(sheet.iter_rows(max_row=1), ())
+                column_names = read_header_names(header_row, sheet.max_column or 0)
+            
+            # Predvolene je prvý stĺpec popis a druhý suma
+            column_indexes = resolve_columns(column_names, *columns)
+            if column_indexes is None:
+                return False
+            
+            with stage("load"):
+                spool = os.path.join(temp_dir, "sheet.xml")
+                sheet.save_part(spool)
+                count = min(workers, os.path.getsize(spool) // MIN_CHUNK_BYTES)
+                split = split_sheet_rows(spool, count)
+            
+            if split is None:
+                # Hárok sa spracuje v jednom procese
+                _, _, rows = read_sheet_header(sheet)
+                total_cents, valid_items, invalid_items = write_sheet_output(
+                    input_file, output_file, rows, column_indexes, collected)
+                print_summary(output_file, total_cents, valid_items, invalid_items)
+                return True
+            
+            prefix_end, suffix_start, chunks = split
+            print(f"Počet častí hárku: {len(chunks)}")
+            tasks = []
+            for index, (start, end, first_row, last_row) in enumerate(chunks):
+                if last_row is not None and sheet.max_row is not None:
+                    last_row = min(last_row, sheet.max_row)
+                tasks.append({
+                    "spool": spool,
+                    "prefix_end": prefix_end,
+                    "suffix_start": suffix_start,
+                    "start": start,
+                    "end": end,
+                    # Prvá časť začína za hlavičkou
+                    "first_row": first_row or 2,
+                    "last_row": last_row,
+                    "columns": column_indexes,
+                    "path": os.path.join(temp_dir, f"{index}.txt"),
+                    "collect": collected is not None,
+                })
+            
+            executor = ProcessPoolExecutor(max_workers=min(workers, len(tasks)), initializer=init_chunk_worker,
+                                           initargs=(input_file,))
+            totals = (0, 0, 0, 0)
+            
+            # Vytvorenie výstupného súboru
+            with open(output_file, 'w', encoding='utf-8') as f:
+                write_header(f, os.path.basename(input_file))
+                
+                # Výsledky prichádzajú v poradí častí
+                with stage("parse"):
+                    pending_tails = []
+                    for result in executor.map(convert_chunk, tasks):
+                        if result["main"]["rows"]:
+                            # Prázdne riadky predchádzajúcich častí nie sú na konci hárku
+                            for tail in pending_tails:
+                                totals = append_chunk_part(f, tail, totals, collected)
+                            pending_tails = []
+                            totals = append_chunk_part(f, dict(result["main"], path=result["path"]), totals,
+                                                       collected)
+                        if result["tail"]["rows"]:
+                            pending_tails.append(result["tail"])
+                add_rows("parse", totals[3])
+                
+                # Zápis súhrnu
+                with stage("write"):
+                    write_summary(f, *totals[:3])
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            workbook.close()
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        
+        print_summary(output_file, *totals[:3])
+        
+        return True
+    
+    except Exception as e:
+        print(f"Chyba pri konverzii: {str(e)}")
+        return False
+
+
+def list_sheet_names(input_file):
+    """
+    Vráti názvy hárkov zošita bez načítania ich obsahu.
+    
+    Args:
+        input_file (str): Cesta k vstupnému Excel súboru
+    
+    Returns:
+        list: Názvy hárkov v poradí ako v zošite
+    """
+    if input_file.endswith('.xls'):
+        import pandas as pd
+        with pd.ExcelFile(input_file) as workbook:
+            return list(workbook.sheet_names)
+    
+    from openpyxl import load_workbook
+    
+    workbook = load_workbook(input_file, read_only=True, data_only=True, keep_links=False)
+    try:
+        return list(workbook.sheetnames)
+    finally:
+        workbook.close()
+
+
+def select_sheets(sheet_names, selection):
+    """
+    Vyberie hárky podľa prepínača --sheets.
+    
+    Args:
+        sheet_names (list): Názvy hárkov zošita
+        selection (str): "all" alebo názvy či poradové čísla (od 1) oddelené čiarkou
+    
+    Returns:
+        list: Vybrané názvy hárkov v zadanom poradí alebo None pri chybe
+    """
+    if selection is True or selection == "all":
+        return list(sheet_names)
+    
+    selected = []
+    for part in str(selection).split(","):
+        name = part.strip()
+        if not name:
+            continue
+        if name in sheet_names:
+            selected.append(name)
+        elif name.isdigit() and 1 <= int(name) <= len(sheet_names):
+            selected.append(sheet_names[int(name) - 1])
+        else:
+            print(f"Chyba: Hárok '{name}' v zošite neexistuje")
+            return None
+    
+    if not selected:
+        print("Chyba: Nebol vybraný žiadny hárok")
+        return None
+    return selected
+
+
+@contextmanager
+def open_sheet_rows(input_file, sheet_name):
+    """
+    Otvorí hárok na postupné čítanie riadkov.
+    
+    Súbory .xlsx sa čítajú cez openpyxl v režime iba na čítanie, staré
+    súbory .xls cez pandas (načíta sa iba zvolený hárok).
+    
+    Args:
+        input_file (str): Cesta k vstupnému Excel súboru
+        sheet_name (str): Názov hárku
+    
+    Yields:
+        tuple: (názvy stĺpcov, iterátor riadkov bez hlavičky)
+    """
+    if input_file.endswith('.xls'):
+        import pandas as pd
+        df = pd.read_excel(input_file, sheet_name=sheet_name)
+        yield list(df.columns), df.itertuples(index=False, name=None)
+        return
+    
+    from openpyxl import load_workbook
+    
+    workbook = load_workbook(input_file, read_only=True, data_only=True, keep_links=False)
+    try:
+        _, column_names, rows = read_sheet_header(workbook[sheet_name])
+        yield column_names, rows
+    finally:
+        workbook.close()
+
+
+def convert_sheet(task):
+    """
+    Skonvertuje jeden hárok do dočasného súboru (v pracovnom procese).
+    
+    Do dočasného súboru sa zapíšu iba riadky položiek; hlavičku, medzisúčty
+    a súhrn doplní hlavný proces pri spájaní hárkov. Výpisy sa zachytia,
+    aby sa výstupy paralelných procesov nepremiešali.
+    
+    Args:
+        task (dict): Vstupný súbor, hárok, dočasný súbor, stĺpce, či sa
+                     majú vrátiť položky a prípadne index duplicít
+    
+    Returns:
+        dict: Výsledok hárku (súčty, výpisy a prípadne položky)
+    """
+    result = {
+        "sheet": task["sheet"],
+        "path": task["path"],
+        "success": False,
+        "total_cents": 0,
+        "valid_items": 0,
+        "invalid_items": 0,
+        "items": None,
+        "messages": [],
+    }
+    collected = {"items": [], "warnings": []} if task["collect"] else None
+    messages = io.StringIO()
+    
+    try:
+        with redirect_stdout(messages):
+            with open_sheet_rows(task["input"], task["sheet"]) as (column_names, rows):
+                column_indexes = resolve_columns(column_names, *task["columns"])
+                if column_indexes is not None:
+                    with open(task["path"], 'w', encoding='utf-8') as f:
+                        total_cents, valid_items, invalid_items, _ = write_sheet_rows(
+                            f, rows, collected=collected, columns=column_indexes, dedup=task.get("dedup"))
+                    
+                    result.update(success=True, total_cents=total_cents,
+                                  valid_items=valid_items, invalid_items=invalid_items)
+                    if collected is not None:
+                        result["items"] = collected["items"]
+    except Exception as e:
+        messages.write(f"Chyba pri spracovaní hárku: {str(e)}\n")
+    
+    result["messages"] = messages.getvalue().splitlines()
+    return result
+
+
+def convert_excel_sheets(input_file, output_file, sheets="all", columns=(None, None), workers=None, binary=None,
+                         dedup=None):
+    """
+    Konvertuje viac hárkov zošita do jedného výstupného súboru.
+    
+    Každý hárok sa spracuje v samostatnom procese do dočasného súboru,
+    takže v pamäti nie sú naraz všetky hárky. Hlavný proces potom spojí
+    dočasné súbory v poradí hárkov a za každý hárok zapíše medzisúčet.
+    Hárok, ktorý nemá požadované stĺpce, sa preskočí.
+    
+    Args:
+        input_file (str): Cesta k vstupnému Excel súboru
+        output_file (str): Cesta k výstupnému textovému súboru
+        sheets (str): "all" alebo názvy či poradové čísla hárkov oddelené čiarkou
+        columns (tuple): Názvy stĺpcov (popis, suma); None = predvolený stĺpec
+        workers (int): Počet procesov (None = počet jadier, 1 = postupne)
+        binary (BlockyBinaryWriter): Zapisovač binárneho súboru alebo None
+        dedup (DedupIndex): Index duplicít alebo None; hárky sa potom
+                            spracujú postupne v hlavnom procese
+    
+    Returns:
+        bool: True, ak sa podarilo skonvertovať aspoň jeden hárok, inak False
+    """
+    try:
+        # Načítanie zoznamu hárkov
+        print(f"Načítavam Excel súbor: {input_file}")
+        with stage("load"):
+            selected = select_sheets(list_sheet_names(input_file), sheets)
+        if selected is None:
+            return False
+        print(f"Spracovávam hárky: {', '.join(selected)}")
+        
+        temp_dir = tempfile.mkdtemp(prefix=".blocky-sheets-", dir=os.path.dirname(os.path.abspath(output_file)))
+        tasks = [
+            {
+                "input": input_file,
+                "sheet": sheet_name,
+                "path": os.path.join(temp_dir, f"{index}.txt"),
+                "columns": tuple(columns),
+                "collect": binary is not None,
+            }
+            for index, sheet_name in enumerate(selected)
+        ]
+        
+        # Index duplicít je jedno spojenie s databázou, hárky ho musia používať postupne
+        if dedup is not None:
+            for task in tasks:
+                task["dedup"] = dedup
+        
+        executor = None
+        try:
+            if workers == 1 or len(tasks) <= 1 or dedup is not None:
+                results = map(convert_sheet, tasks)
+            else:
+                executor = ProcessPoolExecutor(max_workers=workers)
+                results = executor.map(convert_sheet, tasks)
+            
+            total_cents = 0
             valid_items = 0
             invalid_items = 0
+            converted_sheets = 0
             
-            for index, row in df.iterrows():
-                try:
-                    description = str(row[description_col]).strip()
-                    
-                    # Kontrola, či je suma číselná hodnota
-                    try:
-                        amount = float(row[amount_col])
-                        total_amount += amount
+            with open(output_file, 'w', encoding='utf-8') as f:
+                write_header(f, os.path.basename(input_file))
+                
+                # Výsledky prichádzajú v poradí hárkov
+                with stage("parse"):
+                    for result in results:
+                        sheet_name = result["sheet"]
+                        print(f"Hárok '{sheet_name}':")
+                        for message in result["messages"]:
+                            print(f"  {message}")
+                        
+                        if not result["success"]:
+                            print(f"Upozornenie: Hárok '{sheet_name}' bol preskočený")
+                            continue
+                        
+                        if converted_sheets > 0:
+                            f.write("#\n")
+                        f.write(f"# Hárok: {sheet_name}\n")
+                        with open(result["path"], 'r', encoding='utf-8') as part:
+                            shutil.copyfileobj(part, f)
+                        f.write(f"# Medzisúčet hárku {sheet_name}: {format_cents(result['total_cents'], '.')}"
+                                f" (počet položiek: {result['valid_items']})\n")
                         
-                        # Formátovanie sumy
-                        amount_str = f"{amount:.2f}".replace('.', ',')
+                        total_cents = add_cents(total_cents, result["total_cents"])
+                        valid_items += result["valid_items"]
+                        invalid_items += result["invalid_items"]
+                        converted_sheets += 1
                         
-                        # Zápis položky
-                        f.write(f"{description} | {amount_str}\n")
-                        valid_items += 1
-                    except (ValueError, TypeError):
-                        print(f"Upozornenie: Riadok {index+2} obsahuje neplatnú sumu: {row[amount_col]}")
-                        invalid_items += 1
-                except Exception as e:
-                    print(f"Chyba pri spracovaní riadku {index+2}: {str(e)}")
-                    invalid_items += 1
+                        if binary is not None:
+                            binary.extend(result["items"])
+                
+                add_rows("parse", valid_items + invalid_items)
+                write_summary(f, total_cents, valid_items, invalid_items)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            shutil.rmtree(temp_dir, ignore_errors=True)
+        
+        if converted_sheets == 0:
+            print("Chyba: Nepodarilo sa skonvertovať žiadny hárok")
+            return False
+        
+        print(f"Skonvertovaných hárkov: {converted_sheets} z {len(selected)}")
+        print_summary(output_file, total_cents, valid_items, invalid_items)
+        
+        return True
+    
+    except Exception as e:
+        print(f"Chyba pri konverzii: {str(e)}")
+        return False
+
+
+def incremental_state_path(output_file):
+    """Vráti cestu k súboru so stavom prírastkovej konverzie"""
+    return output_file + ".state.json"
+
+
+def load_incremental_state(input_file, output_file):
+    """
+    Načíta stav poslednej prírastkovej konverzie.
+    
+    Stav sa použije, iba ak patrí k rovnakému zdrojovému súboru a výstupný
+    súbor sa od poslednej konverzie nezmenil.
+    
+    Args:
+        input_file (str): Cesta k vstupnému Excel súboru
+        output_file (str): Cesta k výstupnému textovému súboru
+    
+    Returns:
+        dict: Stav konverzie alebo None
+    """
+    try:
+        with open(incremental_state_path(output_file), 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        
+        if not isinstance(state, dict) or state.get("version") != INCREMENTAL_STATE_VERSION:
+            return None
+        if state.get("source") != os.path.basename(input_file):
+            return None
+        if os.path.getsize(output_file) != state["output_size"]:
+            return None
+        
+        # Neúplný stav (napr. upravený ručne) sa nepoužije
+        for name in ("columns", "rows", "prefix_hash", "total_cents", "valid_items", "invalid_items", "items_end"):
+            if name not in state:
+                return None
+        return state
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_incremental_state(output_file, state):
+    """
+    Uloží stav prírastkovej konverzie vedľa výstupného súboru.
+    
+    Args:
+        output_file (str): Cesta k výstupnému textovému súboru
+        state (dict): Stav konverzie
+    """
+    path = incremental_state_path(output_file)
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f)
+    os.replace(temp_path, path)
+
+
+def convert_excel_to_blocky_incremental(input_file, output_file, columns=(None, None)):
+    """
+    Prírastková konverzia Excel súboru, do ktorého sa riadky iba pridávajú.
+    
+    Vedľa výstupného súboru sa ukladá stav (počet spracovaných riadkov,
+    kontrolný súčet ich obsahu a priebežné súčty). Pri ďalšom spustení sa
+    overí, že už spracované riadky sa nezmenili, a do výstupu sa doplnia iba
+    nové riadky na konci hárku; súhrn sa prepíše na mieste. Ak sa niektorý
+    z už spracovaných riadkov zmenil, výstup sa vytvorí celý znova.
+    
+    Args:
+        input_file (str): Cesta k vstupnému Excel súboru (.xlsx)
+        output_file (str): Cesta k výstupnému textovému súboru
+        columns (tuple): Názvy stĺpcov (popis, suma); None = predvolený stĺpec
+    
+    Returns:
+        bool: True, ak konverzia prebehla úspešne, inak False
+    """
+    try:
+        state = load_incremental_state(input_file, output_file)
+        if state is not None and state.get("columns") != list(columns):
+            # Iné stĺpce znamenajú iné položky aj v už spracovaných riadkoch
+            state = None
+        
+        # Načítanie Excel súboru
+        print(f"Načítavam Excel súbor: {input_file}")
+        with stage("load"):
+            workbook, sheet = open_first_sheet(input_file)
+        
+        try:
+            with stage("load"):
+                header_row, column_names, rows = read_sheet_header(sheet)
             
-            # Zápis súhrnu
-            f.write("#\n")
-            f.write(f"# Celková suma: {total_amount:.2f}\n")
-            f.write(f"# Počet položiek: {valid_items}\n")
-            if invalid_items > 0:
-                f.write(f"# Počet neplatných položiek: {invalid_items}\n")
-        
-        print(f"Konverzia dokončená. Výstupný súbor: {output_file}")
-        print(f"Celkový počet položiek: {valid_items}")
-        print(f"Celková suma: {total_amount:.2f}")
-        if invalid_items > 0:
-            print(f"Počet neplatných položiek: {invalid_items}")
+            column_indexes = resolve_columns(column_names, *columns)
+            if column_indexes is None:
+                return False
+            
+            digest = hashlib.sha256(repr(header_row).encode('utf-8'))
+            
+            if state is not None:
+                # Overenie, že už spracované riadky sa nezmenili
+                processed_rows = 0
+                with stage("load"):
+                    for row in islice(rows, state["rows"]):
+                        digest.update(repr(row).encode('utf-8'))
+                        processed_rows += 1
+                add_rows("load", processed_rows)
+                
+                if processed_rows != state["rows"] or digest.hexdigest() != state["prefix_hash"]:
+                    print("Už spracované riadky sa zmenili, vytváram výstup znova")
+                    state = None
+                    header_row, column_names, rows = read_sheet_header(sheet)
+                    digest = hashlib.sha256(repr(header_row).encode('utf-8'))
+            
+            if state is not None:
+                # Doplnenie nových riadkov za posledný spracovaný riadok
+                with open(output_file, 'r+', encoding='utf-8') as f:
+                    f.seek(state["items_end"])
+                    f.truncate()
+                    
+                    totals = (state["total_cents"], state["valid_items"], state["invalid_items"])
+                    with stage("parse"):
+                        total_cents, valid_items, invalid_items, new_rows = write_sheet_rows(
+                            f, rows, state["rows"], totals, digest=digest, columns=column_indexes)
+                    add_rows("parse", new_rows)
+                    
+                    items_end = f.tell()
+                    write_summary(f, total_cents, valid_items, invalid_items)
+                    output_size = f.tell()
+                
+                row_count = state["rows"] + new_rows
+                print(f"Pridaných nových riadkov: {new_rows}")
+            else:
+                with open(output_file, 'w', encoding='utf-8') as f:
+                    write_header(f, os.path.basename(input_file))
+                    
+                    with stage("parse"):
+                        total_cents, valid_items, invalid_items, row_count = write_sheet_rows(
+                            f, rows, digest=digest, columns=column_indexes)
+                    add_rows("parse", row_count)
+                    
+                    items_end = f.tell()
+                    write_summary(f, total_cents, valid_items, invalid_items)
+                    output_size = f.tell()
+        finally:
+            workbook.close()
+        
+        save_incremental_state(output_file, {
+            "version": INCREMENTAL_STATE_VERSION,
+            "source": os.path.basename(input_file),
+            "columns": list(columns),
+            "rows": row_count,
+            "prefix_hash": digest.hexdigest(),
+            "total_cents": total_cents,
+            "valid_items": valid_items,
+            "invalid_items": invalid_items,
+            "items_end": items_end,
+            "output_size": output_size,
+        })
+        
+        print_summary(output_file, total_cents, valid_items, invalid_items)
         
         return True
     
@@ -110,22 +1572,58 @@ def convert_excel_to_blocky(input_file, output_file):
 def print_usage():
     """Zobrazí návod na použitie"""
     print("Použitie:")
-    print("  python excel_to_blocky.py input.xlsx output.txt")
+    print("  python excel_to_blocky.py input.xlsx output.txt [--engine=pandas]")
     print()
     print("Parametre:")
     print("  input.xlsx  - Vstupný Excel súbor")
     print("  output.txt  - Výstupný textový súbor")
+    print()
+    print("Prepínače:")
+    print("  --engine=auto    - .xlsx postupne, .xls cez pandas (predvolené)")
+    print("  --engine=pandas  - Načítanie celého hárku cez pandas")
+    print("  --engine=stream  - Postupné čítanie riadok po riadku (nízka spotreba pamäte)")
+    print("  --engine=native  - Postupné čítanie bez openpyxl (rýchlejšie, rovnaký výstup)")
+    print("  --engine=parallel - Ako native, hárok po častiach vo --workers procesoch")
+    print("  --cache          - Použiť vyrovnávaciu pamäť pre nezmenené súbory")
+    print("  --cache-dir=cesta, --cache-size=MB, --refresh-cache, --clear-cache")
+    print("  --binary=cesta   - Zapísať aj binárny súbor .blkb")
+    print("  --incremental    - Doplniť iba nové riadky od posledného spustenia")
+    print("  --sheets=all|Jan,Feb - Všetky alebo vybrané hárky s medzisúčtami")
+    print("  --workers=N      - Počet procesov pre súbežné spracovanie hárkov alebo častí")
+    print("  --description-column=názov, --amount-column=názov - Stĺpce podľa hlavičky")
+    print("  --dedup[-index=cesta] - Vynechať už vytvorené položky (--dedup-report=cesta)")
+    print("  --date-column=názov - Pri kontrole duplicít rozlišovať aj dátum")
+    print("  --metrics[=json|=subor.json] - Čas a pamäť jednotlivých fáz konverzie")
+    print("  --profile=cesta  - Zapísať profil cProfile")
 
 
 def main():
     """Hlavná funkcia"""
     # Kontrola argumentov
-    if len(sys.argv) != 3:
+    arguments, options = parse_arguments(sys.argv[1:])
+    if len(arguments) != 2:
         print_usage()
         return
     
-    input_file = sys.argv[1]
-    output_file = sys.argv[2]
+    input_file = arguments[0]
+    output_file = arguments[1]
+    
+    engine = options.get("engine", "auto")
+    if engine not in ENGINES:
+        print(f"Chyba: Neznámy spôsob načítania '{engine}'")
+        print_usage()
+        return
+    
+    try:
+        workers = int(options.get("workers", 0)) or None
+    except ValueError:
+        workers = -1
+    if workers is not None and workers < 1:
+        print("Chyba: Počet procesov musí byť kladné celé číslo (--workers=N)")
+        return
+    
+    sheets = options.get("sheets")
+    columns = (options.get("description-column"), options.get("amount-column"))
     
     # Kontrola, či vstupný súbor existuje
     if not os.path.isfile(input_file):
@@ -136,8 +1634,58 @@ def main():
     if not input_file.endswith(('.xlsx', '.xls')):
         print(f"Upozornenie: Vstupný súbor '{input_file}' nemusí byť Excel súbor")
     
+    # Prírastková konverzia je možná iba pri postupnom čítaní .xlsx
+    incremental = False
+    if options.get("incremental"):
+        if input_file.endswith('.xls'):
+            print("Upozornenie: Prírastková konverzia nepodporuje .xls, vytváram celý výstup")
+        elif sheets is not None:
+            print("Upozornenie: Prírastková konverzia podporuje iba prvý hárok, vytváram celý výstup")
+        elif options.get("binary"):
+            print("Upozornenie: Prírastková konverzia nevytvára binárny súbor (--binary), vytváram celý výstup")
+        elif engine not in ("auto", "stream"):
+            print(f"Upozornenie: Prírastková konverzia číta súbor iba postupne (--engine=stream), "
+                  f"vytváram celý výstup spôsobom '{engine}'")
+        else:
+            incremental = True
+    
+    if incremental and any(name in options for name in ("cache", "cache-dir", "refresh-cache", "clear-cache")):
+        # Stav prírastkovej konverzie už nahrádza vyrovnávaciu pamäť
+        print("Upozornenie: Vyrovnávacia pamäť sa pri prírastkovej konverzii nepoužije")
+    
+    if incremental and (options.get("dedup") or options.get("dedup-index")):
+        # Už zapísané riadky tohto súboru sú v indexe a pri ďalšom spustení
+        # by sa vynechali ako duplicitné
+        print("Chyba: Prírastkovú konverziu nie je možné kombinovať s kontrolou duplicít (--dedup)")
+        return
+    
+    try:
+        cache = None if incremental else cache_from_options(options)
+    except CACHE_ERRORS as e:
+        print(f"Chyba: {str(e)}")
+        return
+    
+    try:
+        dedup = dedup_from_options(options, input_file)
+    except DEDUP_ERRORS as e:
+        print(f"Chyba: Index duplicít sa nepodarilo otvoriť: {str(e)}")
+        return
+    
     # Konverzia
-    convert_excel_to_blocky(input_file, output_file)
+    if incremental:
+        success = run_measured(os.path.basename(input_file), options,
+                               convert_excel_to_blocky_incremental, input_file, output_file, columns)
+    else:
+        success = run_measured(os.path.basename(input_file), options,
+                               convert_excel_to_blocky, input_file, output_file, engine=engine, cache=cache,
+                               binary_file=options.get("binary"), sheets=sheets,
+                               description_column=columns[0], amount_column=columns[1], workers=workers,
+                               dedup=dedup)
+    
+    # Položky sa do indexu uložia iba po úspešnej konverzii
+    if dedup is not None:
+        dedup.close(commit=bool(success))
+        dedup.print_report()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+"""Pomocné funkcie testov"""
+
+import os
+
+
+def read_output(path):
+    """Vráti text výstupného súboru bez riadku s časom vytvorenia"""
+    with open(path, encoding="utf-8") as f:
+        return "".join(line for line in f if "Vytvorené:" not in line)
+
+
+def write_mixed_inputs(directory):
+    """
+    Vytvorí v adresári Excel a Word súbory pre dávkovú konverziu.
+    
+    Súbory faktura.xlsx a faktura.docx majú rovnaký názov, poskodeny.xlsx
+    nie je platný Excel súbor a jeho konverzia zlyhá.
+    
+    Returns:
+        list: Cesty k vytvoreným súborom
+    """
+    import openpyxl
+    from docx import Document
+    
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    
+    for name, count in (("vydavky.xlsx", 300), ("faktura.xlsx", 5)):
+        workbook = openpyxl.Workbook()
+        sheet = workbook.active
+        sheet.append(["Popis", "Suma"])
+        for index in range(count):
+            sheet.append([f"Položka {index} č. {name}", (index * 37 % 2000 - 1000) / 100])
+        sheet.append(["Bez sumy", None])
+        path = os.path.join(directory, name)
+        workbook.save(path)
+        paths.append(path)
+    
+    for name, rows in (("faktura.docx", [["Popis", "Suma"], ["Káva", "2,50"], ["Nájom", "-450,00"]]),
+                       ("blocky.docx", [["Položka", "Cena"], ["Čaj", "1 200,00 €"], ["Obed", "abc"]])):
+        doc = Document()
+        doc.add_paragraph(f"Doklad {name}")
+        table = doc.add_table(rows=len(rows), cols=2)
+        for row_index, row in enumerate(rows):
+            for column_index, value in enumerate(row):
+                table.cell(row_index, column_index).text = value
+        doc.add_paragraph("Spolu: 3,70")
+        path = os.path.join(directory, name)
+        doc.save(path)
+        paths.append(path)
+    
+    path = os.path.join(directory, "poskodeny.xlsx")
+    with open(path, "wb") as f:
+        f.write(b"toto nie je Excel subor")
+    paths.append(path)
+    
+    return sorted(paths)
+
+
+def convert_single(input_file, output_file):
+    """Skonvertuje jeden súbor samostatným konvertorom podľa prípony"""
+    if input_file.endswith(".docx"):
+        from word_to_blocky import convert_word_to_blocky
+        return convert_word_to_blocky(input_file, output_file)
+    
+    from excel_to_blocky import convert_excel_to_blocky
+    return convert_excel_to_blocky(input_file, output_file)
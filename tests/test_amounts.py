@@ -0,0 +1,94 @@
+# -*- coding: utf-8 -*-
+
+"""Testy čítania a formátovania súm (blocky_amounts.py)"""
+
+import random
+
+import pytest
+
+from blocky_amounts import (
+    MISSING_CENTS, INFINITY_CENTS, NEGATIVE_INFINITY_CENTS, parse_amount, parse_amount_cents, format_amount_cents, amount_to_cents,
+    add_cents, format_cents, find_paragraph_items, PARAGRAPH_ITEM_PATTERN,
+)
+
+
+@pytest.mark.parametrize("text, amount", [
+    ("12,50 €", 12.5),
+    ("-10", -10.0),
+    ("1 234,56", 1234.56),
+    ("1.234,56", 1234.56),
+    ("1,234.56", 1234.56),
+    ("1.234.567", 1234567.0),
+    ("12,500", 12.5),
+    ("bez sumy", None),
+])
+def test_parse_amount(text, amount):
+    assert parse_amount(text) == amount
+
+
+@pytest.mark.parametrize("text, cents", [
+    ("12,50 €", 1250),
+    ("-0,01", -1),
+    ("1 234,56", 123456),
+    ("0.165", 17),
+    ("0.125", 12),
+    ("2.675", 267),
+    ("12,500", 1250),
+    ("bez sumy", None),
+])
+def test_parse_amount_cents(text, cents):
+    assert parse_amount_cents(text) == cents
+
+
+def test_cents_match_float_output():
+    """Centy z textu sa rovnajú sume zapísanej cez float a "{:.2f}" """
+    generator = random.Random(16)
+    for _ in range(20000):
+        integer = str(generator.randint(0, 10 ** generator.randint(0, 9)))
+        fraction = "".join(generator.choice("0123456789") for _ in range(generator.randint(0, 5)))
+        sign = generator.choice(["", "-"])
+        text = f"{sign}{integer},{fraction}" if fraction else f"{sign}{integer}"
+        assert parse_amount_cents(text) == amount_to_cents(parse_amount(text)), text
+
+
+def test_format_amount_cents():
+    assert format_amount_cents(-12.5) == ("-12,50", -1250)
+    assert format_amount_cents(float("nan"))[1] == MISSING_CENTS
+
+
+def test_cent_totals_are_exact():
+    total = 0
+    for _ in range(10):
+        total = add_cents(total, amount_to_cents(0.1))
+    assert format_cents(total, ".") == "1.00"
+    assert add_cents(total, MISSING_CENTS) == MISSING_CENTS
+    assert format_cents(MISSING_CENTS) == "nan"
+
+
+@pytest.mark.parametrize("amounts", [
+    [2.5, float("inf"), 1.0],
+    [-1.0, float("-inf")],
+    [2.5, float("-inf"), float("inf")],
+    [float("inf"), float("inf"), -3.0],
+    [float("inf"), float("nan")],
+    [float("nan"), float("-inf")],
+])
+def test_infinite_totals_match_float_sum(amounts):
+    total = 0
+    for amount in amounts:
+        total = add_cents(total, amount_to_cents(amount))
+    assert format_cents(total, ".") == f"{sum(amounts):.2f}"
+
+
+def test_format_infinite_amount():
+    assert format_amount_cents(float("inf")) == ("inf", INFINITY_CENTS)
+    assert format_amount_cents(float("-inf")) == ("-inf", NEGATIVE_INFINITY_CENTS)
+    assert format_cents(NEGATIVE_INFINITY_CENTS) == "-inf"
+
+
+def test_paragraph_items_match_pattern():
+    generator = random.Random(23)
+    alphabet = "ab :: -.,5 €\t\n0 ٣"
+    for _ in range(20000):
+        text = "".join(generator.choice(alphabet) for _ in range(generator.randint(0, 30)))
+        assert find_paragraph_items(text) == PARAGRAPH_ITEM_PATTERN.findall(text), repr(text)
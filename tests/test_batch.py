@@ -0,0 +1,78 @@
+# -*- coding: utf-8 -*-
+
+"""Testy dávkovej konverzie (blocky_batch.py)"""
+
+import os
+import sys
+import json
+
+import pytest
+
+pytest.importorskip("openpyxl")
+pytest.importorskip("docx")
+
+import blocky_batch
+from blocky_batch import run_batch, collect_input_files
+
+from helpers import read_output, write_mixed_inputs, convert_single
+
+
+@pytest.fixture(scope="module")
+def inputs(tmp_path_factory):
+    """Adresár so zmiešanými Excel a Word súbormi a výstupy samostatných konvertorov"""
+    directory = tmp_path_factory.mktemp("vstupy")
+    expected_dir = tmp_path_factory.mktemp("ocakavane")
+    expected = {}
+    for path in write_mixed_inputs(str(directory)):
+        output_file = str(expected_dir / (os.path.basename(path) + ".txt"))
+        expected[path] = read_output(output_file) if convert_single(path, output_file) else None
+    return str(directory), expected
+
+
+def check_results(results, expected):
+    """Overí, že výstupy dávky sú zhodné s výstupmi samostatných konvertorov"""
+    assert [result["input"] for result in results] == sorted(expected)
+    for result in results:
+        if expected[result["input"]] is None:
+            assert result["status"] == "error"
+            assert result["output"] is None
+        else:
+            assert result["status"] == "ok", result["error"]
+            assert read_output(result["output"]) == expected[result["input"]]
+
+
+def test_inputs_include_failing_file(inputs):
+    _, expected = inputs
+    assert len(expected) == 5
+    assert sum(1 for text in expected.values() if text is None) == 1
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_matches_single_file_converters(inputs, tmp_path, workers):
+    directory, expected = inputs
+    results = run_batch(collect_input_files(directory), str(tmp_path), workers=workers)
+    
+    check_results(results, expected)
+    # Súbory s rovnakým názvom dostanú rôzne výstupy
+    assert sorted(os.listdir(tmp_path)) == ["blocky.txt", "faktura.txt", "faktura_xlsx.txt", "vydavky.txt"]
+
+
+def test_main_writes_manifest(inputs, tmp_path, monkeypatch):
+    directory, expected = inputs
+    monkeypatch.setattr(sys, "argv", ["blocky_batch.py", directory, str(tmp_path), "--workers=2"])
+    assert blocky_batch.main() == 1
+    
+    with open(tmp_path / "manifest.json", encoding="utf-8") as f:
+        manifest = json.load(f)
+    assert (manifest["total"], manifest["succeeded"], manifest["failed"], manifest["workers"]) == (5, 4, 1, 2)
+    check_results(manifest["files"], expected)
+
+
+@pytest.mark.parametrize("workers", ["-1", "abc"])
+def test_invalid_workers_are_rejected(inputs, tmp_path, monkeypatch, capsys, workers):
+    directory, _ = inputs
+    monkeypatch.setattr(sys, "argv", ["blocky_batch.py", directory, str(tmp_path / "vystup"), f"--workers={workers}"])
+    assert blocky_batch.main() == 1
+    
+    assert "Chyba: Počet procesov musí byť kladné celé číslo" in capsys.readouterr().out
+    assert not (tmp_path / "vystup").exists()
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+
+"""Testy generovania vstupov a behu merania výkonu (blocky_benchmark.py)"""
+
+import sys
+import json
+import random
+
+import pytest
+
+import blocky_benchmark
+from blocky_benchmark import generate_case, generate_rows, header_names, CASES
+
+
+ROWS = 12
+
+
+def expected_rows(case, columns):
+    """Vráti riadky, z ktorých generate_case vytvorí súbor prípadu"""
+    return generate_rows(random.Random(f"1-{case}-{ROWS}"), ROWS, columns, 24)
+
+
+@pytest.mark.parametrize("columns, merged", [(2, False), (4, True)])
+def test_generated_xlsx(tmp_path, columns, merged):
+    openpyxl = pytest.importorskip("openpyxl")
+    path = generate_case("excel", str(tmp_path), ROWS, columns, 24, merged, 1)
+    
+    sheet = openpyxl.load_workbook(path).active
+    values = [list(row) for row in sheet.iter_rows(values_only=True)]
+    assert values[0] == header_names(columns)
+    rows = expected_rows("excel", columns)
+    if merged:
+        # Zlúčená bunka ponecháva hodnotu iba v prvom riadku
+        for index in range(1, ROWS, 10):
+            rows[index][-1] = None
+    assert values[1:] == rows
+    assert bool(sheet.merged_cells.ranges) == merged
+
+
+@pytest.mark.parametrize("columns, merged", [(2, False), (3, True)])
+def test_generated_word_table(tmp_path, columns, merged):
+    docx = pytest.importorskip("docx")
+    path = generate_case("word-table", str(tmp_path), ROWS, columns, 24, merged, 1)
+    
+    doc = docx.Document(path)
+    assert doc.paragraphs[0].text == "Prehľad výdavkov"
+    table = doc.tables[0]
+    assert [cell.text for cell in table.rows[0].cells] == header_names(columns)
+    for table_row, row in zip(table.rows[1:], expected_rows("word-table", columns)):
+        cells = [cell.text for cell in table_row.cells]
+        assert cells[:2] == [row[0], f"{row[1]:.2f} €".replace(".", ",")]
+    assert len(table.rows) == ROWS + 1
+
+
+def test_generated_word_paragraphs(tmp_path):
+    pytest.importorskip("docx")
+    from word_to_blocky import extract_data_from_word
+    
+    path = generate_case("word-paragraphs", str(tmp_path), ROWS, 2, 24, False, 1)
+    
+    # Položky sa čítajú z odsekov "popis: suma €" (suma v centoch)
+    assert list(extract_data_from_word(path)) == \
+        [(row[0], round(row[1] * 100)) for row in expected_rows("word-paragraphs", 2)]
+
+
+def test_tiny_benchmark_run(tmp_path, monkeypatch):
+    pytest.importorskip("openpyxl")
+    pytest.importorskip("docx")
+    output_file = tmp_path / "vysledky.json"
+    monkeypatch.setattr(sys, "argv", ["blocky_benchmark.py", str(output_file), "--rows=5", "--repeat=1",
+                                      "--workers=1", "--columns=3", "--merged", f"--work-dir={tmp_path}"])
+    assert blocky_benchmark.main() == 0
+    
+    with open(output_file, encoding="utf-8") as f:
+        data = json.load(f)
+    assert data["config"]["rows"] == [5]
+    assert {record["case"] for record in data["results"]} == set(CASES)
+    assert all(record["status"] == "ok" for record in data["results"]), data["results"]
+    # Súčet float hodnôt aj súčet v centoch dajú rovnakú sumu
+    assert len({record["total"] for record in data["results"] if record["case"] == "totals"}) == 1
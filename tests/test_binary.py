@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+
+"""Testy binárneho formátu .blkb (blocky_binary.py)"""
+
+import pytest
+
+from blocky_amounts import MISSING_CENTS, INFINITY_CENTS
+from blocky_binary import HEADER, write_blocky_binary, read_blocky_binary
+
+
+ITEMS = [
+    ("Káva", 2.5, 2),
+    ("Nájom – september", -1234.56, 3),
+    ("", 0.0, 0),
+    ("Prázdna suma", float("nan"), 5),
+]
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "out.blkb")
+    assert write_blocky_binary(path, ITEMS) == len(ITEMS)
+    
+    with read_blocky_binary(path) as reader:
+        assert reader.verify()
+        assert list(reader) == [
+            ("Káva", 250, 2),
+            ("Nájom – september", -123456, 3),
+            ("", 0, 0),
+            ("Prázdna suma", MISSING_CENTS, 5),
+        ]
+        assert reader[-1][0] == "Prázdna suma"
+        assert reader.total_cents() == 250 - 123456
+
+
+def test_infinite_amounts(tmp_path):
+    path = str(tmp_path / "out.blkb")
+    write_blocky_binary(path, [("Káva", 2.5), ("Chyba", float("inf")), ("Prázdna suma", float("nan"))])
+    
+    with read_blocky_binary(path) as reader:
+        assert reader.total_cents() == INFINITY_CENTS
+        assert reader[1][1] == INFINITY_CENTS
+
+
+def test_round_trip_in_cents(tmp_path):
+    path = str(tmp_path / "out.blkb")
+    write_blocky_binary(path, [("Káva", 250), ("Čaj", -180)], cents=True)
+    
+    with read_blocky_binary(path) as reader:
+        assert list(reader) == [("Káva", 250, 0), ("Čaj", -180, 0)]
+
+
+def test_empty_file_round_trip(tmp_path):
+    path = str(tmp_path / "out.blkb")
+    write_blocky_binary(path, [])
+    
+    with read_blocky_binary(path) as reader:
+        assert len(reader) == 0
+        assert reader.verify()
+
+
+def test_checksum_detects_corruption(tmp_path):
+    path = tmp_path / "out.blkb"
+    write_blocky_binary(str(path), ITEMS)
+    
+    data = bytearray(path.read_bytes())
+    data[HEADER.size + 10] ^= 0xFF
+    path.write_bytes(bytes(data))
+    
+    with read_blocky_binary(str(path)) as reader:
+        assert not reader.verify()
+
+
+@pytest.mark.parametrize("content", [b"", b"BLKB", b"XXXX" + bytes(HEADER.size)])
+def test_invalid_file_is_rejected(tmp_path, content):
+    path = tmp_path / "bad.blkb"
+    path.write_bytes(content)
+    
+    with pytest.raises(ValueError):
+        read_blocky_binary(str(path))
+
+
+def test_truncated_file_is_rejected(tmp_path):
+    path = tmp_path / "out.blkb"
+    write_blocky_binary(str(path), ITEMS)
+    path.write_bytes(path.read_bytes()[:-3])
+    
+    with pytest.raises(ValueError):
+        read_blocky_binary(str(path))
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+"""Testy nastavenia vyrovnávacej pamäte z prepínačov (blocky_cache.py)"""
+
+import pytest
+
+from blocky_cache import cache_from_options, DEFAULT_MAX_BYTES
+
+
+def test_cache_is_off_without_options():
+    assert cache_from_options({"binary": True}) is None
+
+
+def test_cache_options(tmp_path):
+    directory = str(tmp_path / "cache")
+    cache = cache_from_options({"cache-dir": directory, "cache-size": "1.5"})
+    assert cache.directory == directory
+    assert cache.max_bytes == int(1.5 * 1024 * 1024)
+    
+    cache = cache_from_options({"cache-dir": directory})
+    assert cache.max_bytes == DEFAULT_MAX_BYTES
+
+
+@pytest.mark.parametrize("options", [
+    {"cache-dir": True},
+    {"cache-dir": ""},
+    {"cache-size": "abc"},
+    {"cache": True, "cache-size": "abc"},
+    {"cache": True, "cache-size": True},
+    {"cache": True, "cache-size": "-5"},
+    {"cache": True, "cache-size": "nan"},
+])
+def test_invalid_options_raise_value_error(tmp_path, monkeypatch, options):
+    monkeypatch.chdir(tmp_path)
+    with pytest.raises(ValueError):
+        cache_from_options(options)
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+"""Testy indexu duplicít (blocky_dedup.py)"""
+
+from blocky_dedup import DedupIndex
+
+
+def run_items(index_file, source, items):
+    """Skonvertuje položky v jednej konverzii a vráti výsledky is_new"""
+    index = DedupIndex(str(index_file), source)
+    try:
+        return [index.is_new(description, cents) for description, cents in items]
+    finally:
+        index.close()
+
+
+def test_new_items_are_kept(tmp_path):
+    index_file = tmp_path / "index.sqlite"
+    assert run_items(index_file, "a.xlsx", [("Káva", 250), ("Čaj", 180)]) == [True, True]
+
+
+def test_same_items_in_one_file_are_distinct(tmp_path):
+    index_file = tmp_path / "index.sqlite"
+    assert run_items(index_file, "a.xlsx", [("Káva", 250)] * 3) == [True, True, True]
+
+
+def test_repeated_file_is_skipped(tmp_path):
+    index_file = tmp_path / "index.sqlite"
+    items = [("Káva", 250), ("Káva", 250), ("Čaj", 180)]
+    run_items(index_file, "a.xlsx", items)
+    assert run_items(index_file, "a.xlsx", items) == [False, False, False]
+
+
+def test_description_is_normalized(tmp_path):
+    index_file = tmp_path / "index.sqlite"
+    run_items(index_file, "a.xlsx", [("Káva  espresso", 250)])
+    assert run_items(index_file, "b.xlsx", [("KÁVA espresso", 250)]) == [False]
+
+
+def test_only_earlier_occurrences_are_duplicates(tmp_path):
+    index_file = tmp_path / "index.sqlite"
+    assert run_items(index_file, "a.xlsx", [("Coffee", 300)]) == [True]
+    assert run_items(index_file, "b.xlsx", [("Coffee", 300)] * 3) == [False, True, True]
+
+
+def test_additional_occurrence_is_new(tmp_path):
+    index_file = tmp_path / "index.sqlite"
+    assert run_items(index_file, "c.xlsx", [("Tea", 150)] * 2) == [True, True]
+    assert run_items(index_file, "d.xlsx", [("Tea", 150)] * 3) == [False, False, True]
+
+
+def test_failed_conversion_is_not_recorded(tmp_path):
+    index_file = tmp_path / "index.sqlite"
+    index = DedupIndex(str(index_file), "a.xlsx")
+    assert index.is_new("Káva", 250)
+    index.close(commit=False)
+    assert run_items(index_file, "a.xlsx", [("Káva", 250)]) == [True]
+
+
+def test_index_is_not_locked_during_conversion(tmp_path, monkeypatch):
+    monkeypatch.setattr("blocky_dedup.LOCK_TIMEOUT", 1)
+    index_file = str(tmp_path / "index.sqlite")
+    first = DedupIndex(index_file, "a.xlsx")
+    try:
+        assert first.is_new("Káva", 250)
+        
+        # Iná konverzia môže počas prvej čítať aj zapisovať
+        assert run_items(index_file, "b.xlsx", [("Čaj", 180)]) == [True]
+        assert first.is_new("Čaj", 180) is False
+    finally:
+        first.close()
+    assert run_items(index_file, "c.xlsx", [("Káva", 250), ("Čaj", 180)]) == [False, False]
+
+
+def test_concurrent_conversions_report_conflicts(tmp_path, capsys):
+    index_file = str(tmp_path / "index.sqlite")
+    first = DedupIndex(index_file, "a.xlsx")
+    second = DedupIndex(index_file, "b.xlsx")
+    assert first.is_new("Káva", 250)
+    assert second.is_new("Káva", 250)
+    assert second.is_new("Čaj", 180)
+    
+    first.close()
+    second.close()
+    assert (first.conflicts, second.conflicts) == (0, 1)
+    
+    second.print_report()
+    assert "1 položiek vytvorila počas konverzie aj iná súbežná konverzia" in capsys.readouterr().out
+    assert run_items(index_file, "c.xlsx", [("Čaj", 180)]) == [False]
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+
+"""Testy zhody výstupu spôsobov čítania Excel súborov (excel_to_blocky.py)"""
+
+import random
+
+import pytest
+
+openpyxl = pytest.importorskip("openpyxl")
+
+import excel_to_blocky
+from excel_to_blocky import convert_excel_to_blocky
+
+from helpers import read_output
+
+
+@pytest.fixture(scope="module")
+def workbook_file(tmp_path_factory):
+    """Vytvorí Excel súbor s dvomi hárkami rôznych typov buniek"""
+    rng = random.Random(20)
+    path = str(tmp_path_factory.mktemp("excel") / "vstup.xlsx")
+    workbook = openpyxl.Workbook()
+    
+    sheet = workbook.active
+    sheet.title = "Výdavky"
+    sheet.append(["Popis", "Suma"])
+    for index in range(3000):
+        description = rng.choice(["Káva", "Nájom & energie", "Obed <menu>", "Čaj", None, f"Položka {index}"])
+        amount = rng.choice([rng.randint(-99999, 99999) / 100, rng.randint(-50, 50), None, "abc"])
+        sheet.append([description, amount])
+    
+    other = workbook.create_sheet("Príjmy")
+    other.append(["Popis", "Suma"])
+    for index in range(200):
+        other.append([f"Príjem {index}", rng.randint(0, 10000) / 100])
+    
+    workbook.save(path)
+    return path
+
+
+def convert(workbook_file, tmp_path, engine, **options):
+    """Skonvertuje súbor zadaným spôsobom a vráti text výstupu"""
+    output_file = str(tmp_path / f"{engine}.txt")
+    convert_excel_to_blocky(workbook_file, output_file, engine=engine, **options)
+    return read_output(output_file)
+
+
+@pytest.mark.parametrize("engine", ["pandas", "native"])
+def test_engines_match_stream(workbook_file, tmp_path, engine):
+    if engine == "pandas":
+        pytest.importorskip("pandas")
+    expected = convert(workbook_file, tmp_path, "stream")
+    assert convert(workbook_file, tmp_path, engine) == expected
+
+
+@pytest.mark.parametrize("descriptions", [
+    [5, None, 12, 7],
+    [5, None, 2.5, 1e20],
+    [5, None, "Káva", None],
+])
+def test_number_descriptions_match_stream(tmp_path, descriptions):
+    pytest.importorskip("pandas")
+    path = str(tmp_path / "cisla.xlsx")
+    workbook = openpyxl.Workbook()
+    workbook.active.append(["Popis", "Suma"])
+    for index, description in enumerate(descriptions):
+        workbook.active.append([description, index + 0.5])
+    workbook.save(path)
+    
+    # Stĺpec celých čísel s prázdnymi bunkami načíta pandas ako float
+    expected = convert(path, tmp_path, "stream")
+    assert "\n5 | 0,50\n" in expected
+    assert convert(path, tmp_path, "pandas") == expected
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_parallel_matches_native(workbook_file, tmp_path, monkeypatch, workers):
+    expected = convert(workbook_file, tmp_path, "native")
+    
+    # Malá najmenšia časť hárku, aby sa aj malý hárok rozdelil medzi procesy
+    monkeypatch.setattr(excel_to_blocky, "MIN_CHUNK_BYTES", 1024)
+    assert convert(workbook_file, tmp_path, "parallel", workers=workers) == expected
+
+
+def test_selected_sheets_match(workbook_file, tmp_path):
+    expected = convert(workbook_file, tmp_path, "stream", sheets="Príjmy")
+    assert convert(workbook_file, tmp_path, "native", sheets="Príjmy") == expected
+    assert "Príjem 199" in expected
+    assert "Káva" not in expected
+
+
+@pytest.mark.parametrize("amounts, total", [
+    ([2.5, "inf", 1], "inf"),
+    (["-inf", 2.5], "-inf"),
+    ([2.5, "-inf", "inf"], "nan"),
+])
+@pytest.mark.parametrize("engine", ["pandas", "stream", "native"])
+def test_infinite_amounts_keep_inf(tmp_path, amounts, total, engine):
+    if engine == "pandas":
+        pytest.importorskip("pandas")
+    path = str(tmp_path / "nekonecno.xlsx")
+    workbook = openpyxl.Workbook()
+    workbook.active.append(["Popis", "Suma"])
+    for index, amount in enumerate(amounts):
+        workbook.active.append([f"Položka {index}", amount])
+    workbook.save(path)
+    
+    # Text "inf" v stĺpci súm je nekonečná suma ako v pôvodnej verzii
+    output = convert(path, tmp_path, engine)
+    assert f"# Celková suma: {total}\n" in output
+
+
+@pytest.mark.parametrize("workers", ["-2", "abc"])
+def test_invalid_workers_are_rejected(workbook_file, tmp_path, monkeypatch, capsys, workers):
+    output_file = tmp_path / "vystup.txt"
+    monkeypatch.setattr("sys.argv", ["excel_to_blocky.py", workbook_file, str(output_file),
+                                     "--engine=parallel", f"--workers={workers}"])
+    excel_to_blocky.main()
+    
+    assert "Chyba: Počet procesov musí byť kladné celé číslo" in capsys.readouterr().out
+    assert not output_file.exists()
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+"""Testy prírastkovej konverzie Excel súboru (excel_to_blocky.py)"""
+
+import json
+import os
+
+import pytest
+
+openpyxl = pytest.importorskip("openpyxl")
+
+from excel_to_blocky import (
+    convert_excel_to_blocky,
+    convert_excel_to_blocky_incremental,
+    incremental_state_path,
+)
+
+from helpers import read_output
+
+
+def save_workbook(path, rows, empty_rows=0):
+    """Uloží hárok s hlavičkou, riadkami a prázdnymi formátovanými riadkami na konci"""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["Popis", "Suma", "Kategória"])
+    for row in rows:
+        sheet.append(row)
+    for index in range(empty_rows):
+        sheet.cell(row=len(rows) + 2 + index, column=2).number_format = "0.00"
+    workbook.save(path)
+
+
+def make_rows(start, count):
+    """Vráti riadky položiek s číslami start až start + count - 1"""
+    return [[f"Položka {index}", index * 1.25 - 40, "jedlo" if index % 2 else "byt"]
+            for index in range(start, start + count)]
+
+
+@pytest.fixture
+def files(tmp_path):
+    """Cesty k vstupnému súboru, výstupu a výstupu celej konverzie"""
+    return str(tmp_path / "vstup.xlsx"), str(tmp_path / "vystup.txt"), str(tmp_path / "cely.txt")
+
+
+def convert_and_compare(files, capsys, columns=(None, None)):
+    """Vykoná prírastkovú konverziu, porovná ju s celou konverziou a vráti jej výpis"""
+    input_file, output_file, full_file = files
+    capsys.readouterr()
+    assert convert_excel_to_blocky_incremental(input_file, output_file, columns)
+    printed = capsys.readouterr().out
+    assert convert_excel_to_blocky(input_file, full_file, engine="stream",
+                                   description_column=columns[0], amount_column=columns[1])
+    assert read_output(output_file) == read_output(full_file)
+    return printed
+
+
+def test_new_rows_are_appended(files, capsys):
+    save_workbook(files[0], make_rows(0, 50))
+    assert "Pridaných" not in convert_and_compare(files, capsys)
+    
+    save_workbook(files[0], make_rows(0, 80))
+    assert "Pridaných nových riadkov: 30" in convert_and_compare(files, capsys)
+    
+    # Bez zmeny sa nepridá nič
+    assert "Pridaných nových riadkov: 0" in convert_and_compare(files, capsys)
+
+
+def test_changed_row_rebuilds_output(files, capsys):
+    rows = make_rows(0, 50)
+    save_workbook(files[0], rows)
+    convert_and_compare(files, capsys)
+    
+    rows[10][1] = 999.99
+    save_workbook(files[0], rows + make_rows(50, 5))
+    assert "vytváram výstup znova" in convert_and_compare(files, capsys)
+
+
+def test_trailing_empty_rows_are_filled_later(files, capsys):
+    rows = make_rows(0, 20)
+    save_workbook(files[0], rows, empty_rows=5)
+    convert_and_compare(files, capsys)
+    
+    save_workbook(files[0], rows + make_rows(20, 3), empty_rows=2)
+    assert "Pridaných nových riadkov: 3" in convert_and_compare(files, capsys)
+
+
+@pytest.mark.parametrize("state", [None, "", "{nie je JSON", "[]", '{"version": 1}'])
+def test_missing_or_corrupt_state_rebuilds_output(files, capsys, state):
+    save_workbook(files[0], make_rows(0, 30))
+    convert_and_compare(files, capsys)
+    
+    state_file = incremental_state_path(files[1])
+    if state is None:
+        os.remove(state_file)
+    else:
+        with open(state_file, "w", encoding="utf-8") as f:
+            f.write(state)
+    
+    save_workbook(files[0], make_rows(0, 40))
+    assert "Pridaných" not in convert_and_compare(files, capsys)
+
+
+@pytest.mark.parametrize("change", ["output_size", "prefix_hash"])
+def test_changed_or_incomplete_state_is_not_used(files, capsys, change):
+    save_workbook(files[0], make_rows(0, 30))
+    convert_and_compare(files, capsys)
+    
+    with open(incremental_state_path(files[1]), encoding="utf-8") as f:
+        state = json.load(f)
+    if change == "output_size":
+        state["output_size"] += 1
+    else:
+        del state[change]
+    with open(incremental_state_path(files[1]), "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    
+    save_workbook(files[0], make_rows(0, 40))
+    assert "Pridaných" not in convert_and_compare(files, capsys)
+
+
+def test_changed_columns_rebuild_output(files, capsys):
+    save_workbook(files[0], make_rows(0, 30))
+    convert_and_compare(files, capsys)
+    
+    save_workbook(files[0], make_rows(0, 40))
+    printed = convert_and_compare(files, capsys, columns=("Kategória", "Suma"))
+    assert "Pridaných" not in printed
+    assert "jedlo | " in read_output(files[1])
+
+
+def test_incremental_run_does_not_touch_cache(files, tmp_path, monkeypatch, capsys):
+    import excel_to_blocky
+    
+    cache_dir = tmp_path / "cache"
+    save_workbook(files[0], make_rows(0, 30))
+    monkeypatch.setattr("sys.argv", ["excel_to_blocky.py", files[0], files[2], f"--cache-dir={cache_dir}"])
+    excel_to_blocky.main()
+    entries = sorted(cache_dir.iterdir())
+    assert entries
+    
+    for options in (["--clear-cache", f"--cache-dir={cache_dir}"], ["--cache-dir"]):
+        monkeypatch.setattr("sys.argv", ["excel_to_blocky.py", files[0], files[1], "--incremental"] + options)
+        excel_to_blocky.main()
+        assert "Vyrovnávacia pamäť sa pri prírastkovej konverzii nepoužije" in capsys.readouterr().out
+        assert os.path.exists(incremental_state_path(files[1]))
+        assert sorted(cache_dir.iterdir()) == entries
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+"""Testy prírastkového vytvárania tabuliek (word_to_blocky_formatter.py)"""
+
+import json
+import random
+
+from word_to_blocky_formatter import (
+    new_table_data,
+    render_table_section,
+    render_table_section_incremental,
+    create_formatted_tables,
+    create_formatted_tables_incremental,
+    incremental_state_path,
+)
+
+from helpers import read_output
+
+
+def make_table(rows, title="Výdavky"):
+    """Vytvorí údaje tabuľky s hlavičkou a zadanými riadkami"""
+    table_data = new_table_data(title)
+    table_data["headers"] = ["Popis", "Dátum", "Suma"]
+    for row in rows:
+        table_data["rows"].append(row)
+    table_data["rows"].finish()
+    return table_data
+
+
+def random_row(rng):
+    """Vráti náhodný riadok tabuľky"""
+    description = rng.choice(["Káva", "Nájom", "Obed v reštaurácii", "", "Čaj"])
+    amount = rng.choice(["2,50", "-13.20", "1 200,00 €", "abc", "", f"{rng.randint(-9999, 9999) / 100:.2f}"])
+    return [description, f"{rng.randint(1, 28)}.9.2026", amount]
+
+
+def render_incremental(table_data, state):
+    """Vytvorí text tabuľky so stavom prečítaným cez JSON ako zo súboru"""
+    if state is not None:
+        state = json.loads(json.dumps(state))
+    return render_table_section_incremental(table_data, state)
+
+
+def test_random_edits_match_full_render():
+    rng = random.Random(24)
+    rows = [random_row(rng) for _ in range(30)]
+    state = None
+    
+    for _ in range(300):
+        action = rng.random()
+        if action < 0.3:
+            rows.insert(rng.randint(0, len(rows)), random_row(rng))
+        elif action < 0.5 and rows:
+            del rows[rng.randrange(len(rows))]
+        elif action < 0.8 and rows:
+            rows[rng.randrange(len(rows))] = random_row(rng)
+        elif len(rows) > 1:
+            rows.append(rows.pop(rng.randrange(len(rows))))
+        
+        table_data = make_table(rows)
+        text, state, _ = render_incremental(table_data, state)
+        assert text == render_table_section(table_data)
+
+
+def test_unchanged_table_reuses_all_rows():
+    rng = random.Random(1)
+    table_data = make_table([random_row(rng) for _ in range(50)])
+    
+    _, state, changed_rows = render_incremental(table_data, None)
+    assert changed_rows == 50
+    
+    text, _, changed_rows = render_incremental(table_data, state)
+    assert changed_rows == 0
+    assert text == render_table_section(table_data)
+
+
+def test_single_changed_row_is_rendered_again():
+    rng = random.Random(2)
+    rows = [random_row(rng) for _ in range(50)]
+    _, state, _ = render_incremental(make_table(rows), None)
+    
+    rows[20] = ["Nová položka", "1.9.2026", "1,00"]
+    table_data = make_table(rows)
+    text, _, changed_rows = render_incremental(table_data, state)
+    # Zmenený riadok sa počíta ako odstránený a pridaný
+    assert changed_rows == 2
+    assert text == render_table_section(table_data)
+
+
+def test_empty_rows_are_distinguished():
+    _, state, _ = render_incremental(make_table([[], ["Káva", "", "1,00"]]), None)
+    
+    table_data = make_table([[""], ["Káva", "", "1,00"]])
+    text, _, _ = render_incremental(table_data, state)
+    assert text == render_table_section(table_data)
+
+
+def test_output_matches_full_run(tmp_path):
+    rng = random.Random(3)
+    first = [random_row(rng) for _ in range(40)]
+    second = [random_row(rng) for _ in range(10)]
+    expected_file = str(tmp_path / "expected.txt")
+    output_file = str(tmp_path / "output.txt")
+    
+    for rows in (first, first[5:] + second, first[5:] + second):
+        tables_data = [make_table(rows), make_table(second, "Príjmy")]
+        assert create_formatted_tables(tables_data, expected_file, "vstup.docx", workers=1)
+        assert create_formatted_tables_incremental(tables_data, output_file, "vstup.docx", workers=1)
+        assert read_output(output_file) == read_output(expected_file)
+    
+    with open(incremental_state_path(output_file), encoding="utf-8") as f:
+        assert json.load(f)["source"] == "vstup.docx"
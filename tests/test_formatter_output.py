@@ -0,0 +1,144 @@
+# -*- coding: utf-8 -*-
+
+"""Testy zhody výstupu create_formatted_table s pôvodnou verziou (word_to_blocky_formatter.py)"""
+
+import re
+import random
+
+import pytest
+
+import word_to_blocky_formatter
+from word_to_blocky_formatter import new_table_data, create_formatted_table
+
+
+def original_formatted_table(table_data, output_file, input_file_name):
+    """Pôvodná verzia create_formatted_table (bez výpisu a zachytenia chýb)"""
+    with open(output_file, 'w', encoding='utf-8') as f:
+        f.write(f"# Tabuľka vytvorená z dokumentu: {input_file_name}\n")
+        f.write("# Vytvorené: <čas>\n")
+        f.write("#\n\n")
+        
+        if table_data["title"]:
+            f.write(f"{table_data['title']}\n\n")
+        
+        column_widths = []
+        for i, header in enumerate(table_data["headers"]):
+            max_width = len(header)
+            for row in table_data["rows"]:
+                if i < len(row):
+                    max_width = max(max_width, len(row[i]))
+            column_widths.append(max_width + 2)
+        
+        if table_data["has_borders"]:
+            f.write("+" + "+".join("-" * width for width in column_widths) + "+\n")
+        
+        header_row = "|"
+        for i, header in enumerate(table_data["headers"]):
+            width = column_widths[i]
+            header_row += f" {header.ljust(width - 2)} |"
+        f.write(header_row + "\n")
+        
+        if table_data["has_borders"] or table_data["has_header_formatting"]:
+            f.write("+" + "+".join("-" * width for width in column_widths) + "+\n")
+        
+        for row in table_data["rows"]:
+            row_text = "|"
+            for i, cell in enumerate(row):
+                if i < len(column_widths):
+                    width = column_widths[i]
+                    row_text += f" {cell.ljust(width - 2)} |"
+            f.write(row_text + "\n")
+        
+        if table_data["has_borders"]:
+            f.write("+" + "+".join("-" * width for width in column_widths) + "+\n")
+        
+        total_sum = 0
+        for row in table_data["rows"]:
+            if len(row) > 0:
+                amount_match = re.search(r'([\-]?\d+[.,]?\d*)', row[-1])
+                if amount_match:
+                    total_sum += float(amount_match.group(1).replace(',', '.'))
+        f.write("\n")
+        f.write(f"Celková suma: {total_sum:.2f} €\n")
+        
+        f.write("\n")
+        f.write("# Informácie pre import do aplikácie Blocky:\n")
+        f.write("# Pre každý riadok tabuľky (okrem hlavičky) vytvorte položku v aplikácii:\n")
+        for row in table_data["rows"]:
+            if len(row) >= 2:
+                amount_match = re.search(r'([\-]?\d+[.,]?\d*)', row[-1])
+                if amount_match:
+                    amount = float(amount_match.group(1).replace(',', '.'))
+                    f.write(f"# - Popis: {row[0]}, Suma: {amount:.2f} €\n")
+
+
+# Texty buniek s viacerými riadkami a znakmi rôznej šírky
+CELLS = [
+    "Káva", "Čaj\nso citrónom", "Obed v reštaurácii", "", " ", "日本語", "🍕 pizza", "éspresso",
+    "Nájom\r\nenergie", "Zľava\t5 %", "ﬁnančné", "x" * 40,
+]
+
+# Sumy, ktoré pôvodná verzia aj blocky_amounts prečítajú rovnako. Sumy
+# s oddeľovačmi tisícov ("1 234,56") pôvodná verzia čítala chybne (1.00)
+# a celkovú sumu počítala z float hodnôt, nie zo zapísaných centov ("0,001")
+AMOUNTS = [
+    "2,50", "-13.20", "12,00 €", "abc", "", "-", "12", "3,", "-0,5", "1234,56",
+    "0,01", "99999999999", "Spolu\n10,00", "€ 7,5", "Zľava -5 %",
+]
+
+
+def random_table(rng, rows):
+    """Vráti náhodnú tabuľku; riadky môžu mať menej aj viac buniek ako hlavička"""
+    table_data = new_table_data(rng.choice(["Výdavky", "", "Nákladové\nstredisko"]))
+    table_data["headers"] = rng.choice([["Popis", "Suma"], ["Popis", "Dátum", "Suma"], ["Položka 日本"], []])
+    table_data["has_borders"] = rng.random() < 0.5
+    table_data["has_header_formatting"] = rng.random() < 0.5
+    for _ in range(rows):
+        count = rng.choice([0, 1, 2, 3, 3, 3, 4])
+        row = [rng.choice(CELLS) for _ in range(max(count - 1, 0))]
+        if count:
+            row.append(rng.choice(AMOUNTS))
+        table_data["rows"].append(row)
+    table_data["rows"].finish()
+    return table_data
+
+
+def read_bytes(path):
+    """Vráti obsah súboru bez riadku s časom vytvorenia"""
+    with open(path, "rb") as f:
+        return b"".join(line for line in f.readlines() if "# Vytvorené:".encode("utf-8") not in line)
+
+
+def check_table(table_data, tmp_path):
+    """Porovná výstup create_formatted_table s pôvodnou verziou bajt po bajte"""
+    expected_file = str(tmp_path / "povodny.txt")
+    output_file = str(tmp_path / "novy.txt")
+    original_formatted_table(dict(table_data, rows=list(table_data["rows"])), expected_file, "vstup.docx")
+    assert create_formatted_table(table_data, output_file, "vstup.docx")
+    assert read_bytes(output_file) == read_bytes(expected_file)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_output_matches_original(tmp_path, seed):
+    rng = random.Random(seed)
+    check_table(random_table(rng, rng.choice([0, 1, 5, 50])), tmp_path)
+
+
+@pytest.mark.parametrize("lines_per_write", [1, 7])
+def test_streamed_output_matches_original(tmp_path, monkeypatch, lines_per_write):
+    # Veľké tabuľky sa zapisujú priebežne po blokoch riadkov
+    monkeypatch.setattr(word_to_blocky_formatter, "STREAMING_ROW_THRESHOLD", 10)
+    monkeypatch.setattr(word_to_blocky_formatter, "LINES_PER_WRITE", lines_per_write)
+    rng = random.Random(7)
+    for _ in range(5):
+        check_table(random_table(rng, 100), tmp_path)
+
+
+def test_multiline_and_wide_cells(tmp_path):
+    table_data = new_table_data("Výdavky")
+    table_data["headers"] = ["Popis", "Suma"]
+    table_data["has_borders"] = True
+    for row in (["Čaj\nso citrónom", "1,80"], ["日本語 🍕", "12,00"], ["éspresso", "-2,50"]):
+        table_data["rows"].append(row)
+    table_data["rows"].finish()
+    check_table(table_data, tmp_path)
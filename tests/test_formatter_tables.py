@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+"""Testy spracovania všetkých tabuliek dokumentu (word_to_blocky_formatter.py --all-tables)"""
+
+import sys
+
+import pytest
+from docx import Document
+
+import word_to_blocky_formatter
+from word_to_blocky_formatter import (
+    extract_all_tables_from_word,
+    extract_table_format_from_word,
+    create_formatted_table,
+    render_table_section,
+    format_word_tables,
+)
+
+from helpers import read_output
+
+
+def add_table(doc, rows):
+    """Pridá do dokumentu tabuľku so zadanými riadkami"""
+    table = doc.add_table(rows=len(rows), cols=len(rows[0]))
+    for row_index, row in enumerate(rows):
+        for column_index, value in enumerate(row):
+            table.cell(row_index, column_index).text = value
+    return table
+
+
+@pytest.fixture
+def several_tables(tmp_path):
+    """Dokument s tromi tabuľkami; druhá tabuľka nemá vlastný nadpis"""
+    doc = Document()
+    doc.add_paragraph("Výdavky 2026")
+    doc.add_paragraph("Stredisko Bratislava")
+    add_table(doc, [["Popis", "Suma"], ["Káva", "2,50"], ["Obed v reštaurácii", "8,20"]])
+    add_table(doc, [["Popis", "Dátum", "Suma"], ["Nájom", "1.9.2026", "-450,00"]])
+    doc.add_paragraph("")
+    doc.add_paragraph("Stredisko Košice")
+    add_table(doc, [["Popis", "Suma"], ["Čaj", "1,80"], ["", ""]])
+    doc.add_paragraph("Poznámka pod tabuľkami")
+    
+    path = tmp_path / "tabulky.docx"
+    doc.save(str(path))
+    return str(path)
+
+
+def test_all_tables_are_extracted_in_order(several_tables):
+    tables_data = extract_all_tables_from_word(several_tables)
+    
+    # Prvá tabuľka má nadpis dokumentu ako bez --all-tables
+    assert [table_data["title"] for table_data in tables_data] == ["Výdavky 2026", "Tabuľka 2", "Stredisko Košice"]
+    assert [table_data["headers"] for table_data in tables_data] == [
+        ["Popis", "Suma"], ["Popis", "Dátum", "Suma"], ["Popis", "Suma"]
+    ]
+    assert list(tables_data[1]["rows"]) == [["Nájom", "1.9.2026", "-450,00"]]
+
+
+def test_all_tables_output(several_tables, tmp_path):
+    output_file = str(tmp_path / "output.txt")
+    assert format_word_tables(several_tables, output_file, all_tables=True)
+    
+    output = read_output(output_file)
+    for table_data in extract_all_tables_from_word(several_tables):
+        assert render_table_section(table_data) in output
+    assert output.index("Výdavky 2026") < output.index("Tabuľka 2") < output.index("Stredisko Košice")
+
+
+def test_single_table_document_gives_same_output(tmp_path):
+    doc = Document()
+    doc.add_paragraph("Výdavky 2026")
+    doc.add_paragraph("Stredisko Bratislava")
+    add_table(doc, [["Popis", "Suma"], ["Káva", "2,50"], ["Obed", "8,20"]])
+    input_file = str(tmp_path / "jedna.docx")
+    doc.save(input_file)
+    
+    first_file = str(tmp_path / "prva.txt")
+    all_file = str(tmp_path / "vsetky.txt")
+    assert format_word_tables(input_file, first_file)
+    assert format_word_tables(input_file, all_file, all_tables=True)
+    assert read_output(all_file) == read_output(first_file)
+
+
+def test_first_table_matches_default_mode(several_tables, tmp_path):
+    first_file = str(tmp_path / "prva.txt")
+    assert create_formatted_table(extract_table_format_from_word(several_tables), first_file, "tabulky.docx")
+    
+    tables_data = extract_all_tables_from_word(several_tables)
+    assert render_table_section(tables_data[0]) in read_output(first_file)
+
+
+def test_process_pool_gives_same_output(several_tables, tmp_path, monkeypatch):
+    expected_file = str(tmp_path / "expected.txt")
+    assert format_word_tables(several_tables, expected_file, all_tables=True, workers=1)
+    
+    # Malý dokument sa bez --workers vytvorí bez procesov; prah sa zníži,
+    # aby sa použila skupina procesov
+    monkeypatch.setattr(word_to_blocky_formatter, "PARALLEL_ROW_THRESHOLD", 0)
+    for workers in (None, 2):
+        output_file = str(tmp_path / f"output_{workers}.txt")
+        assert format_word_tables(several_tables, output_file, all_tables=True, workers=workers)
+        assert read_output(output_file) == read_output(expected_file)
+
+
+def test_small_document_does_not_start_processes(several_tables):
+    tables_data = extract_all_tables_from_word(several_tables)
+    assert word_to_blocky_formatter.table_executor(tables_data, None) is None
+    assert word_to_blocky_formatter.table_executor(tables_data, 1) is None
+
+
+@pytest.mark.parametrize("workers", ["-1", "0x", "abc"])
+def test_invalid_workers_are_rejected(several_tables, tmp_path, monkeypatch, capsys, workers):
+    output_file = tmp_path / "output.txt"
+    monkeypatch.setattr(sys, "argv", ["word_to_blocky_formatter.py", several_tables, str(output_file),
+                                      "--all-tables", f"--workers={workers}"])
+    word_to_blocky_formatter.main()
+    
+    assert "Chyba: Počet procesov musí byť kladné celé číslo" in capsys.readouterr().out
+    assert not output_file.exists()
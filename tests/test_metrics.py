@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+
+"""Testy merania konverzie (blocky_metrics.py)"""
+
+import pstats
+
+from blocky_metrics import run_measured
+
+
+def convert(value):
+    """Konverzia, ktorá iba vráti zadanú hodnotu"""
+    return value
+
+
+def test_without_options_function_is_called():
+    assert run_measured("vstup.xlsx", {}, convert, 42) == 42
+
+
+def test_profile_is_written_to_given_file(tmp_path):
+    path = tmp_path / "profil.prof"
+    assert run_measured("vstup.xlsx", {"profile": str(path)}, convert, 1) == 1
+    assert pstats.Stats(str(path)).total_calls > 0
+
+
+def test_bare_profile_uses_input_name(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert run_measured("vstup.xlsx", {"profile": True}, convert, 1) == 1
+    assert pstats.Stats(str(tmp_path / "vstup.prof")).total_calls > 0
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+
+"""Testy asynchrónnej dávkovej konverzie (blocky_pipeline.py)"""
+
+import os
+
+import pytest
+
+pytest.importorskip("openpyxl")
+pytest.importorskip("docx")
+
+from blocky_batch import run_batch, collect_input_files
+from blocky_pipeline import run_pipeline
+
+from helpers import read_output, write_mixed_inputs
+
+
+@pytest.fixture(scope="module")
+def batch(tmp_path_factory):
+    """Vstupné súbory a výsledky ich konverzie cez blocky_batch.py"""
+    directory = tmp_path_factory.mktemp("vstupy")
+    output_dir = str(tmp_path_factory.mktemp("batch"))
+    write_mixed_inputs(str(directory))
+    input_files = collect_input_files(str(directory))
+    return input_files, output_dir, run_batch(input_files, output_dir, workers=1)
+
+
+def comparable(result, output_dir):
+    """Vráti výsledok bez času konverzie a s výstupným adresárom nahradeným značkou"""
+    return {
+        "input": result["input"],
+        "output": result["output"] and os.path.relpath(result["output"], output_dir),
+        "converter": result["converter"],
+        "status": result["status"],
+        "error": result["error"],
+        "messages": [message.replace(output_dir, "<vystup>") for message in result["messages"]],
+        "text": result["output"] and read_output(result["output"]),
+    }
+
+
+@pytest.mark.parametrize("workers, prefetch", [(1, 1), (2, 2), (3, 1)])
+def test_pipeline_matches_batch(batch, tmp_path, workers, prefetch):
+    input_files, batch_dir, expected = batch
+    output_dir = str(tmp_path / "vystup")
+    spool_dir = str(tmp_path / "spool")
+    
+    results = run_pipeline(input_files, output_dir, workers=workers, prefetch=prefetch, spool_dir=spool_dir)
+    
+    assert [comparable(result, output_dir) for result in results] == \
+        [comparable(result, batch_dir) for result in expected]
+    assert sum(1 for result in results if result["status"] == "error") == 1
+    # Dočasné kópie sa odstránia a vo výstupe nezostanú rozpracované súbory
+    assert os.listdir(spool_dir) == []
+    assert sorted(os.listdir(output_dir)) == sorted(os.listdir(batch_dir))
+
+
+def test_missing_input_fails_only_that_file(batch, tmp_path):
+    input_files, _, _ = batch
+    missing = os.path.join(os.path.dirname(input_files[0]), "chyba.xlsx")
+    
+    results = run_pipeline([missing] + input_files, str(tmp_path), workers=2)
+    
+    assert results[0]["status"] == "error"
+    assert results[0]["error"].startswith("Načítanie zlyhalo:")
+    assert [result["status"] for result in results[1:]].count("ok") == len(input_files) - 1
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+
+"""Testy rýchleho štartu skriptov bez načítania ťažkých knižníc (blocky_cli.py)"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from blocky_cli import HEAVY_MODULES, SCRIPTS, heavy_imports
+
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def imported_modules(script, *arguments):
+    """
+    Spustí skript v novom interpreteri s -X importtime.
+    
+    Returns:
+        set: Názvy balíkov najvyššej úrovne všetkých načítaných modulov
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", os.path.join(ROOT, script)] + list(arguments),
+        stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, cwd=ROOT, check=False,
+    )
+    modules = set()
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            name = line.rsplit("|", 1)[1].strip()
+            modules.add(name.split(".")[0])
+    return modules
+
+
+@pytest.mark.parametrize("script", SCRIPTS)
+@pytest.mark.parametrize("arguments", [(), ("--help",)])
+def test_usage_does_not_import_heavy_modules(script, arguments):
+    modules = imported_modules(script, *arguments)
+    assert "blocky_cli" in modules
+    assert modules.isdisjoint(HEAVY_MODULES)
+
+
+@pytest.mark.parametrize("script", SCRIPTS)
+def test_import_does_not_load_heavy_modules(script):
+    assert heavy_imports(os.path.join(ROOT, script)) == []
@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+
+"""Testy sledovania adresára (blocky_watch.py)"""
+
+import os
+import json
+import shutil
+from concurrent.futures import ProcessPoolExecutor, wait
+
+import pytest
+
+pytest.importorskip("openpyxl")
+pytest.importorskip("docx")
+
+from blocky_watch import FolderWatcher
+
+from helpers import read_output, write_mixed_inputs, convert_single
+
+
+@pytest.fixture(scope="module")
+def sources(tmp_path_factory):
+    """Vstupné súbory a výstupy ich samostatnej konverzie podľa názvu súboru"""
+    directory = tmp_path_factory.mktemp("zdroje")
+    expected_dir = tmp_path_factory.mktemp("ocakavane")
+    expected = {}
+    for path in write_mixed_inputs(str(directory)):
+        output_file = str(expected_dir / (os.path.basename(path) + ".txt"))
+        if convert_single(path, output_file):
+            expected[os.path.basename(path)] = read_output(output_file)
+    return str(directory), expected
+
+
+@pytest.fixture
+def watcher(tmp_path):
+    """Sledovanie prázdneho vstupného adresára s jedným pracovným procesom"""
+    inbox = tmp_path / "prichadzajuce"
+    inbox.mkdir()
+    watcher = FolderWatcher(str(inbox), str(tmp_path / "blocky"), workers=1, interval=0.01, settle=3)
+    os.makedirs(watcher.staging_dir)
+    watcher.executor = ProcessPoolExecutor(max_workers=1)
+    yield watcher
+    watcher.executor.shutdown()
+
+
+def convert_pending(watcher):
+    """Odovzdá čakajúce súbory na konverziu a zverejní ich výstupy"""
+    watcher.submit()
+    futures = list(watcher.running)
+    wait(futures)
+    return [watcher.publish(future) for future in futures]
+
+
+def test_one_poll_cycle(watcher, sources):
+    source_dir, expected = sources
+    complete = os.path.join(watcher.inbox, "vydavky.xlsx")
+    partial = os.path.join(watcher.inbox, "faktura.docx")
+    shutil.copyfile(os.path.join(source_dir, "vydavky.xlsx"), complete)
+    with open(os.path.join(source_dir, "faktura.docx"), "rb") as f:
+        data = f.read()
+    with open(partial, "wb") as f:
+        f.write(data[:1000])
+    
+    watcher.scan(0)
+    assert convert_pending(watcher) == []
+    
+    # Súbor, ktorý sa ešte zapisuje, sa po dobe ustálenia nekonvertuje
+    with open(partial, "ab") as f:
+        f.write(data[1000:2000])
+    watcher.scan(3)
+    results = convert_pending(watcher)
+    assert [os.path.basename(result["input"]) for result in results] == ["vydavky.xlsx"]
+    assert results[0]["status"] == "ok"
+    assert read_output(os.path.join(watcher.outbox, "vydavky.txt")) == expected["vydavky.xlsx"]
+    assert not os.path.exists(os.path.join(watcher.outbox, "faktura.txt"))
+    
+    # Dopísaný súbor sa skonvertuje až po ustálení, nezmenený súbor sa znova nekonvertuje
+    with open(partial, "ab") as f:
+        f.write(data[2000:])
+    watcher.scan(4)
+    assert convert_pending(watcher) == []
+    watcher.scan(7)
+    results = convert_pending(watcher)
+    assert [os.path.basename(result["input"]) for result in results] == ["faktura.docx"]
+    assert read_output(os.path.join(watcher.outbox, "faktura.txt")) == expected["faktura.docx"]
+    
+    for now in (10, 20, 30):
+        watcher.scan(now)
+        assert convert_pending(watcher) == []
+    assert (watcher.converted, watcher.failed, watcher.pending()) == (2, 0, 0)
+    assert os.listdir(watcher.staging_dir) == []
+
+
+def test_changed_file_is_converted_again(watcher, sources, tmp_path):
+    source_dir, _ = sources
+    path = os.path.join(watcher.inbox, "doklad.xlsx")
+    shutil.copyfile(os.path.join(source_dir, "faktura.xlsx"), path)
+    watcher.scan(0)
+    watcher.scan(3)
+    assert len(convert_pending(watcher)) == 1
+    
+    shutil.copyfile(os.path.join(source_dir, "vydavky.xlsx"), path)
+    watcher.scan(4)
+    watcher.scan(7)
+    assert len(convert_pending(watcher)) == 1
+    expected_file = str(tmp_path / "doklad.txt")
+    assert convert_single(path, expected_file)
+    assert read_output(os.path.join(watcher.outbox, "doklad.txt")) == read_output(expected_file)
+    assert watcher.converted == 2
+
+
+def test_run_once_skips_converted_files(tmp_path, sources):
+    source_dir, expected = sources
+    inbox = str(tmp_path / "prichadzajuce")
+    outbox = str(tmp_path / "blocky")
+    shutil.copytree(source_dir, inbox)
+    
+    watcher = FolderWatcher(inbox, outbox, workers=2, interval=0.01, settle=0)
+    watcher.run(once=True)
+    assert (watcher.converted, watcher.failed) == (len(expected), 1)
+    assert read_output(os.path.join(outbox, "faktura_xlsx.txt")) == expected["faktura.xlsx"]
+    with open(os.path.join(outbox, "status.json"), encoding="utf-8") as f:
+        assert json.load(f)["converted"] == len(expected)
+    
+    # Po reštarte sa súbory s novším výstupom nekonvertujú; súbor s chybou nemá výstup
+    watcher = FolderWatcher(inbox, outbox, workers=2, interval=0.01, settle=0)
+    watcher.run(once=True)
+    assert (watcher.converted, watcher.failed) == (0, 1)
+
+
+@pytest.mark.parametrize("workers", ["-1", "abc"])
+def test_invalid_workers_are_rejected(tmp_path, monkeypatch, capsys, workers):
+    import blocky_watch
+    
+    outbox = tmp_path / "blocky"
+    monkeypatch.setattr("sys.argv", ["blocky_watch.py", str(tmp_path), str(outbox), f"--workers={workers}"])
+    assert blocky_watch.main() == 1
+    
+    assert "Chyba: Počet procesov" in capsys.readouterr().out
+    assert not outbox.exists()
@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+"""Testy zhody položiek pri načítaní cez python-docx a cez XML (word_to_blocky.py)"""
+
+import pytest
+
+docx = pytest.importorskip("docx")
+
+from word_to_blocky import extract_data_from_word
+
+
+def add_table(document, rows):
+    """Pridá tabuľku s textami buniek (None = prázdna bunka)"""
+    table = document.add_table(rows=len(rows), cols=max(len(row) for row in rows))
+    for row_index, row in enumerate(rows):
+        for column_index, text in enumerate(row):
+            if text is not None:
+                table.cell(row_index, column_index).text = text
+    return table
+
+
+def compare_engines(path):
+    """Vráti položky z oboch spôsobov načítania a overí, že sú rovnaké"""
+    expected = list(extract_data_from_word(path, engine="docx"))
+    assert list(extract_data_from_word(path, engine="xml")) == expected
+    return expected
+
+
+def test_merged_and_empty_cells(tmp_path):
+    path = str(tmp_path / "tabulky.docx")
+    document = docx.Document()
+    document.add_paragraph("Výdavky: 99,00")
+    
+    table = add_table(document, [
+        ["Popis", "Suma", "Poznámka"],
+        ["Káva", "2,50", ""],
+        ["Nájom", "450,00", "september"],
+        ["Spolu za nájom", "1 200,00", None],
+        [None, None, None],
+        ["Obed", "", "zadarmo"],
+        ["Čaj", "-1,80", "x"],
+    ])
+    # Vodorovné zlúčenie (gridSpan) v riadku s položkou aj v hlavičke
+    table.cell(3, 0).merge(table.cell(3, 1))
+    table.cell(0, 1).merge(table.cell(0, 2))
+    # Zvislé zlúčenie (vMerge) v stĺpci súm aj v stĺpci popisov
+    table.cell(1, 1).merge(table.cell(2, 1))
+    table.cell(5, 0).merge(table.cell(6, 0))
+    
+    add_table(document, [["Popis", "Suma"], ["Víno", "12,90"], ["", "3"]])
+    document.save(path)
+    
+    items = compare_engines(path)
+    assert ("Víno", 1290) in items
+
+
+def test_paragraph_items_without_table_items(tmp_path):
+    path = str(tmp_path / "odseky.docx")
+    document = docx.Document()
+    document.add_paragraph("Zoznam výdavkov")
+    add_table(document, [["Popis", "Suma"], ["Bez sumy", "—"]])
+    document.add_paragraph("Káva: 2,50 €")
+    paragraph = document.add_paragraph("Nájom: ")
+    paragraph.add_run("450,00").bold = True
+    paragraph.add_run(" €")
+    document.add_paragraph("Obed: 8,90 Čaj: -1,80")
+    document.add_paragraph("")
+    document.add_paragraph("Poznámka bez sumy: áno")
+    document.save(path)
+    
+    items = compare_engines(path)
+    assert ("Káva", 250) in items
+    assert ("Nájom", 45000) in items
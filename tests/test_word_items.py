@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+
+"""Testy súm položiek Word dokumentu v centoch (word_to_blocky.py)"""
+
+import pytest
+
+from word_to_blocky import extract_amount, extract_items_from_paragraphs, extract_data_from_word
+
+
+ACCOUNT = "3112000000198742637541"
+
+
+def test_large_number_is_read_exactly():
+    assert extract_amount(ACCOUNT) == int(ACCOUNT) * 100
+    assert extract_amount("1 234,56 €") == 123456
+
+
+def test_large_number_does_not_drop_other_paragraph_items():
+    items = extract_items_from_paragraphs([f"Účet: {ACCOUNT}", "Spolu: 12,50"])
+    assert list(items) == [("Účet", int(ACCOUNT) * 100), ("Spolu", 1250)]
+
+
+@pytest.mark.parametrize("engine", ["docx", "xml"])
+def test_large_number_does_not_drop_other_table_rows(tmp_path, engine):
+    docx = pytest.importorskip("docx")
+    path = str(tmp_path / "ucty.docx")
+    document = docx.Document()
+    table = document.add_table(rows=0, cols=2)
+    for description, amount in [("Popis", "Suma"), ("Káva", "2,50"), ("Účet", ACCOUNT), ("Čaj", "-1,80")]:
+        cells = table.add_row().cells
+        cells[0].text = description
+        cells[1].text = amount
+    document.save(path)
+    
+    items = extract_data_from_word(path, engine=engine)
+    assert list(items) == [("Káva", 250), ("Účet", int(ACCOUNT) * 100), ("Čaj", -180)]
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+
+"""Testy zápisu položiek Word dokumentu (word_to_blocky.py)"""
+
+import pytest
+
+import word_to_blocky
+from blocky_items import ItemStore
+from word_to_blocky import save_to_text_file
+
+from helpers import read_output
+
+
+ITEMS = [("Káva", 250), ("Nájom", -123456), ("Čaj", 5), ("Obed", 1000), ("Káva", 250)]
+
+
+@pytest.mark.parametrize("lines_per_write", [1, 2, 5, 1000])
+def test_items_are_written_in_blocks(tmp_path, monkeypatch, lines_per_write):
+    monkeypatch.setattr(word_to_blocky, "LINES_PER_WRITE", lines_per_write)
+    output_file = str(tmp_path / "out.txt")
+    items = ItemStore(ITEMS, cents=True)
+    
+    assert save_to_text_file(items, output_file, "vstup.docx")
+    lines = read_output(output_file).splitlines()
+    assert lines[6:11] == ["Káva | 2,50", "Nájom | -1234,56", "Čaj | 0,05", "Obed | 10,00", "Káva | 2,50"]
+    assert lines[11:] == ["#", "# Celková suma: -1219.51", "# Počet položiek: 5"]
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+"""Testy čítania archívov cez pamäťové mapovanie (blocky_zip.py)"""
+
+import io
+import os
+import zipfile
+
+import pytest
+
+from blocky_zip import MappedZip, open_zip
+
+
+PARTS = {
+    "word/document.xml": "<w:document>" + "<w:p>Odsek</w:p>" * 20000 + "</w:document>",
+    "word/media/image1.png": os.urandom(200000),
+    "[Content_Types].xml": "<Types/>",
+}
+
+
+def make_archive(path, compression):
+    """Vytvorí archív s časťami PARTS"""
+    with zipfile.ZipFile(path, "w", compression) as archive:
+        for name, data in PARTS.items():
+            archive.writestr(name, data)
+
+
+@pytest.mark.parametrize("compression", [zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED])
+def test_parts_match_zipfile(tmp_path, compression):
+    path = str(tmp_path / "a.docx")
+    make_archive(path, compression)
+    
+    with zipfile.ZipFile(path) as expected, MappedZip(path) as archive:
+        assert archive.namelist() == expected.namelist()
+        for name in expected.namelist():
+            assert archive.read(name) == expected.read(name)
+
+
+def test_part_is_read_in_small_blocks(tmp_path):
+    path = str(tmp_path / "a.docx")
+    make_archive(path, zipfile.ZIP_DEFLATED)
+    
+    with MappedZip(path) as archive, archive.open("word/document.xml") as part:
+        data = b"".join(iter(lambda: part.read(1000), b""))
+    assert data == PARTS["word/document.xml"].encode("utf-8")
+
+
+def test_corrupted_part_is_detected(tmp_path):
+    path = tmp_path / "a.docx"
+    make_archive(str(path), zipfile.ZIP_STORED)
+    
+    # Zmena jedného bajtu v nekomprimovanom obsahu časti
+    data = bytearray(path.read_bytes())
+    position = data.index(b"<Types/>")
+    data[position + 1] ^= 0x20
+    path.write_bytes(bytes(data))
+    
+    with MappedZip(str(path)) as archive:
+        with pytest.raises(zipfile.BadZipFile):
+            archive.read("[Content_Types].xml")
+
+
+def test_missing_part_raises_key_error(tmp_path):
+    path = str(tmp_path / "a.docx")
+    make_archive(path, zipfile.ZIP_DEFLATED)
+    
+    with MappedZip(path) as archive:
+        with pytest.raises(KeyError):
+            archive.open("xl/workbook.xml")
+
+
+def test_empty_file_is_not_an_archive(tmp_path):
+    path = tmp_path / "empty.docx"
+    path.write_bytes(b"")
+    
+    with pytest.raises(zipfile.BadZipFile):
+        MappedZip(str(path))
+
+
+def test_open_zip_accepts_file_objects(tmp_path):
+    buffer = io.BytesIO()
+    make_archive(buffer, zipfile.ZIP_DEFLATED)
+    buffer.seek(0)
+    
+    archive = open_zip(buffer)
+    try:
+        assert isinstance(archive, zipfile.ZipFile)
+        assert archive.read("[Content_Types].xml") == b"<Types/>"
+    finally:
+        archive.close()
@@ -9,7 +9,24 @@ na import do aplikácie Blocky. Skript vytvorí textový súbor s položkami
 vo formáte, ktorý je možné manuálne zadať do aplikácie.
 
 Použitie:
-    python word_to_blocky.py input.docx output.txt
+    python word_to_blocky.py input.docx output.txt [--engine=xml] [--cache]
+
+Prepínače:
+    --engine=docx  - Načítanie dokumentu cez python-docx (predvolené)
+    --engine=xml   - Postupné čítanie word/document.xml priamo z .docx
+                     archívu; rýchlejšie pri veľkých tabuľkách, rovnaké položky;
+                     obrázky a iné časti dokumentu sa nenačítajú, python-docx
+                     ich načíta do pamäte všetky (pozri blocky_zip.py)
+    --cache        - Nezmenené dokumenty sa nenačítajú znova, položky sa použijú
+                     z vyrovnávacej pamäte (pozri blocky_cache.py)
+    --binary=cesta - Okrem textového súboru zapíše aj binárny súbor .blkb
+                     (pozri blocky_binary.py)
+    --dedup        - Vynechá položky, ktoré už boli vytvorené pri skoršej
+                     konverzii (--dedup-index=cesta, --dedup-report=cesta;
+                     pozri blocky_dedup.py)
+    --metrics      - Vypíše čas a pamäť jednotlivých fáz konverzie
+                     (--metrics=json alebo --metrics=subor.json pre JSON)
+    --profile=cesta - Zapíše profil cProfile (pozri blocky_metrics.py)
 
 Požiadavky:
     - Python 3.6+
@@ -21,98 +38,293 @@ Inštalácia požiadaviek:
 
 import sys
 import os
-import re
 from datetime import datetime
-from docx import Document
+
+from blocky_cli import parse_arguments
+from blocky_cache import cache_from_options, CACHE_ERRORS
+from blocky_dedup import dedup_from_options, DEDUP_ERRORS
+from blocky_docx import iter_document_blocks, TABLE_ROW
+from blocky_amounts import parse_amount_cents, format_cents, find_paragraph_items, has_paragraph_item_marks
+from blocky_binary import write_blocky_binary
+from blocky_items import ItemStore
+from blocky_metrics import stage, add_rows, run_measured
+
+
+# Dostupné spôsoby načítania Word dokumentu
+ENGINES = ("docx", "xml")
+
+# Počet položiek naformátovaných a zapísaných naraz
+LINES_PER_WRITE = 1000
 
 
-def extract_data_from_word(input_file):
+def extract_data_from_word(input_file, cache=None, engine="docx"):
     """
     Extrahuje údaje z Word dokumentu.
     
     Args:
         input_file (str): Cesta k vstupnému Word dokumentu
+        cache (ConversionCache): Vyrovnávacia pamäť položiek alebo None
+        engine (str): Spôsob načítania dokumentu ("docx" alebo "xml")
     
     Returns:
-        list: Zoznam položiek vo formáte [(popis, suma)]
+        ItemStore: Položky (popis, suma v centoch)
     """
+    if cache is not None:
+        return extract_data_from_word_cached(input_file, cache, engine)
+    
+    if engine == "xml":
+        return extract_data_from_word_xml(input_file)
+    
     try:
         # Načítanie Word dokumentu
         print(f"Načítavam Word dokument: {input_file}")
-        doc = Document(input_file)
+        with stage("load"):
+            from docx import Document
+            doc = Document(input_file)
         
-        items = []
+        items = ItemStore(cents=True)
         
         # Pokus o extrakciu údajov z tabuliek
-        if len(doc.tables) > 0:
-            print(f"Dokument obsahuje {len(doc.tables)} tabuliek.")
-            for table_index, table in enumerate(doc.tables):
+        with stage("parse"):
+            tables = doc.tables
+        
+        if len(tables) > 0:
+            print(f"Dokument obsahuje {len(tables)} tabuliek.")
+            for table_index, table in enumerate(tables):
                 print(f"Spracovávam tabuľku {table_index + 1}...")
                 
                 # Predpokladáme, že prvý stĺpec je popis a druhý je suma
-                for row_index, row in enumerate(table.rows):
+                with stage("parse"):
+                    rows = table.rows
+                    for row_index, row in enumerate(rows):
+                        # Preskočenie hlavičky tabuľky
+                        if row_index == 0:
+                            continue
+                        
+                        # Bunky riadku sa v python-docx počítajú pri každom prístupe
+                        cells = row.cells
+                        item = extract_item_from_cells([cell.text for cell in cells[:2]])
+                        if item is not None:
+                            items.append(item)
+                add_rows("parse", len(rows))
+        
+        # Ak neboli nájdené žiadne tabuľky alebo údaje v tabuľkách, 
+        # pokúsime sa extrahovať údaje z textu
+        if len(items) == 0:
+            print("Neboli nájdené žiadne údaje v tabuľkách, pokúšam sa extrahovať údaje z textu...")
+            paragraph_count = [0]
+            with stage("parse"):
+                items = extract_items_from_paragraphs(iter_paragraph_texts(doc, paragraph_count))
+            add_rows("parse", paragraph_count[0])
+        
+        items.finish()
+        print(f"Celkovo nájdených položiek: {len(items)}")
+        return items
+    
+    except Exception as e:
+        print(f"Chyba pri extrakcii údajov z Word dokumentu: {str(e)}")
+        return ItemStore(cents=True)
+
+
+def extract_data_from_word_xml(input_file):
+    """
+    Extrahuje údaje z Word dokumentu postupným čítaním XML.
+    
+    Dokument sa prechádza jedným prechodom cez iter_document_blocks bez
+    vytvárania objektového modelu python-docx. Položky sú rovnaké ako pri
+    načítaní cez python-docx: najprv z tabuliek a ak tabuľky neobsahujú
+    žiadne položky, z textu odsekov.
+    
+    Args:
+        input_file (str): Cesta k vstupnému Word dokumentu
+    
+    Returns:
+        ItemStore: Položky (popis, suma v centoch)
+    """
+    try:
+        # Načítanie Word dokumentu
+        print(f"Načítavam Word dokument: {input_file}")
+        
+        items = ItemStore(cents=True)
+        table_count = 0
+        
+        # Texty odsekov sa uchovávajú, iba kým tabuľky neposkytnú prvú položku,
+        # a iba ak môžu obsahovať položku (dvojbodka a číslica)
+        paragraph_texts = []
+        block_count = 0
+        
+        # Dokument sa číta a rozoberá naraz, preto je celé čítanie fázou parse
+        with stage("parse"):
+            for block in iter_document_blocks(input_file):
+                block_count += 1
+                if block[0] == TABLE_ROW:
+                    _, table_index, row_index, cells = block
+                    
                     # Preskočenie hlavičky tabuľky
                     if row_index == 0:
+                        table_count += 1
+                        print(f"Spracovávam tabuľku {table_index + 1}...")
                         continue
                     
-                    if len(row.cells) >= 2:
-                        description = row.cells[0].text.strip()
-                        amount_text = row.cells[1].text.strip()
-                        
-                        # Pokus o extrakciu čísla zo sumy
-                        amount = extract_amount(amount_text)
-                        
-                        if amount is not None:
-                            items.append((description, amount))
+                    item = extract_item_from_cells(cells[:2])
+                    if item is not None:
+                        items.append(item)
+                        paragraph_texts = None
+                
+                elif paragraph_texts is not None and has_paragraph_item_marks(block[1]):
+                    paragraph_texts.append(block[1])
+        add_rows("parse", block_count)
+        
+        if table_count > 0:
+            print(f"Dokument obsahuje {table_count} tabuliek.")
         
         # Ak neboli nájdené žiadne tabuľky alebo údaje v tabuľkách, 
         # pokúsime sa extrahovať údaje z textu
         if len(items) == 0:
             print("Neboli nájdené žiadne údaje v tabuľkách, pokúšam sa extrahovať údaje z textu...")
-            
-            # Hľadanie vzoru "popis: suma" alebo "popis suma €"
-            pattern = r'([^:]+):\s*([\-]?\d+[.,]?\d*)\s*€?'
-            
-            for paragraph in doc.paragraphs:
-                text = paragraph.text.strip()
-                if text:
-                    # Hľadanie vzoru v texte
-                    matches = re.findall(pattern, text)
-                    for match in matches:
-                        description = match[0].strip()
-                        amount = extract_amount(match[1])
-                        if amount is not None:
-                            items.append((description, amount))
+            with stage("parse"):
+                items = extract_items_from_paragraphs(paragraph_texts)
         
+        items.finish()
         print(f"Celkovo nájdených položiek: {len(items)}")
         return items
     
     except Exception as e:
         print(f"Chyba pri extrakcii údajov z Word dokumentu: {str(e)}")
-        return []
+        return ItemStore(cents=True)
+
+
+def extract_item_from_cells(cells):
+    """
+    Vytvorí položku z textov buniek riadku tabuľky.
+    
+    Predpokladáme, že prvý stĺpec je popis a druhý je suma.
+    
+    Args:
+        cells (list): Texty prvých dvoch buniek riadku
+    
+    Returns:
+        tuple: Položka (popis, suma v centoch) alebo None, ak riadok neobsahuje sumu
+    """
+    if len(cells) < 2:
+        return None
+    
+    description = cells[0].strip()
+    amount_text = cells[1].strip()
+    
+    # Pokus o extrakciu čísla zo sumy
+    amount = extract_amount(amount_text)
+    
+    if amount is None:
+        return None
+    return (description, amount)
+
+
+def iter_paragraph_texts(doc, count):
+    """
+    Postupne vráti texty odsekov dokumentu python-docx.
+    
+    Na rozdiel od doc.paragraphs sa nevytvorí zoznam objektov Paragraph
+    pre celý dokument; každý odsek sa vytvorí, až keď sa spracuje.
+    
+    Args:
+        doc (Document): Dokument python-docx
+        count (list): Jednoprvkový zoznam, do ktorého sa pripočíta počet odsekov
+    
+    Yields:
+        str: Text odseku
+    """
+    from docx.oxml.ns import qn
+    from docx.text.paragraph import Paragraph
+    
+    # Rovnaké odseky ako doc.paragraphs (priame potomky w:body)
+    for element in doc.element.body.iterchildren(qn("w:p")):
+        count[0] += 1
+        yield Paragraph(element, doc).text
+
+
+def extract_items_from_paragraphs(paragraph_texts):
+    """
+    Extrahuje položky z textu odsekov vo formáte "popis: suma".
+    
+    Args:
+        paragraph_texts (iterable): Texty odsekov
+    
+    Returns:
+        ItemStore: Položky (popis, suma v centoch)
+    """
+    items = ItemStore(cents=True)
+    
+    for paragraph_text in paragraph_texts:
+        text = paragraph_text.strip()
+        if text:
+            # Hľadanie vzoru "popis: suma" alebo "popis: suma €"
+            matches = find_paragraph_items(text)
+            for match in matches:
+                description = match[0].strip()
+                amount = extract_amount(match[1])
+                if amount is not None:
+                    items.add(description, amount)
+    
+    return items
+
+
+def extract_data_from_word_cached(input_file, cache, engine="docx"):
+    """
+    Extrahuje údaje z Word dokumentu s použitím vyrovnávacej pamäte.
+    
+    Ak sa obsah dokumentu od poslednej extrakcie nezmenil, položky sa
+    načítajú z vyrovnávacej pamäte bez otvorenia dokumentu.
+    
+    Args:
+        input_file (str): Cesta k vstupnému Word dokumentu
+        cache (ConversionCache): Vyrovnávacia pamäť položiek
+        engine (str): Spôsob načítania dokumentu pri zmenenom obsahu
+    
+    Returns:
+        ItemStore: Položky (popis, suma v centoch)
+    """
+    try:
+        with stage("load"):
+            key = cache.make_key(input_file, "word")
+            cached = cache.get(key)
+    except OSError as e:
+        print(f"Chyba pri extrakcii údajov z Word dokumentu: {str(e)}")
+        return ItemStore(cents=True)
+    
+    if cached is not None:
+        print(f"Dokument sa nezmenil, používam uložené položky: {input_file}")
+        items = ItemStore(cached["items"], cents=True)
+        items.finish()
+        print(f"Celkovo nájdených položiek: {len(items)}")
+        return items
+    
+    items = extract_data_from_word(input_file, engine=engine)
+    
+    # Prázdny výsledok môže znamenať aj chybu pri čítaní, preto sa neukladá
+    if len(items) > 0:
+        try:
+            cache.put(key, {"items": list(items)})
+        except OSError as e:
+            print(f"Upozornenie: Položky sa nepodarilo uložiť do vyrovnávacej pamäte: {str(e)}")
+    
+    return items
 
 
 def extract_amount(text):
     """
-    Extrahuje číselnú hodnotu zo zadaného textu.
+    Extrahuje sumu v centoch zo zadaného textu.
+    
+    Suma sa číta z textu priamo v centoch, bez prevodu cez float.
     
     Args:
         text (str): Text obsahujúci číselnú hodnotu
     
     Returns:
-        float: Extrahovaná číselná hodnota alebo None, ak sa nepodarilo extrahovať
+        int: Suma v centoch alebo None, ak sa nepodarilo extrahovať
     """
-    try:
-        # Odstránenie nečíselných znakov okrem mínus, bodky a čiarky
-        cleaned_text = re.sub(r'[^\d\-.,]', '', text)
-        
-        # Nahradenie čiarky bodkou
-        cleaned_text = cleaned_text.replace(',', '.')
-        
-        # Konverzia na číslo
-        return float(cleaned_text)
-    except (ValueError, TypeError):
-        return None
+    # Prvé číslo v texte vrátane oddeľovačov tisícov ("1 234,56 €")
+    return parse_amount_cents(text)
 
 
 def save_to_text_file(items, output_file, input_file_name):
@@ -120,7 +332,7 @@ def save_to_text_file(items, output_file, input_file_name):
     Uloží extrahované položky do textového súboru.
     
     Args:
-        items (list): Zoznam položiek vo formáte [(popis, suma)]
+        items (ItemStore): Položky (popis, suma v centoch)
         output_file (str): Cesta k výstupnému textovému súboru
         input_file_name (str): Názov vstupného súboru
     
@@ -137,25 +349,30 @@ def save_to_text_file(items, output_file, input_file_name):
             f.write("# Záporné sumy sú označené znamienkom mínus (-)\n")
             f.write("#\n")
             
-            # Zápis položiek
-            total_amount = 0
-            for description, amount in items:
-                total_amount += amount
-                
-                # Formátovanie sumy
-                amount_str = f"{amount:.2f}".replace('.', ',')
-                
-                # Zápis položky
-                f.write(f"{description} | {amount_str}\n")
+            # Presný súčet v centoch
+            with stage("amounts"):
+                total_cents = sum(items.amounts)
+            
+            # Položky sa formátujú a zapisujú po blokoch, takže texty všetkých
+            # riadkov nie sú v pamäti naraz
+            for start in range(0, len(items), LINES_PER_WRITE):
+                end = min(start + LINES_PER_WRITE, len(items))
+                with stage("amounts", end - start):
+                    amount_strs = [format_cents(cents) for cents in items.amounts[start:end]]
+                with stage("render", end - start):
+                    block = "".join([f"{description} | {amount_str}\n" for description, amount_str
+                                     in zip(items.descriptions[start:end], amount_strs)])
+                with stage("write", end - start):
+                    f.write(block)
             
             # Zápis súhrnu
             f.write("#\n")
-            f.write(f"# Celková suma: {total_amount:.2f}\n")
+            f.write(f"# Celková suma: {format_cents(total_cents, '.')}\n")
             f.write(f"# Počet položiek: {len(items)}\n")
         
         print(f"Konverzia dokončená. Výstupný súbor: {output_file}")
         print(f"Celkový počet položiek: {len(items)}")
-        print(f"Celková suma: {total_amount:.2f}")
+        print(f"Celková suma: {format_cents(total_cents, '.')}")
         
         return True
     
@@ -164,25 +381,102 @@ def save_to_text_file(items, output_file, input_file_name):
         return False
 
 
+def save_to_binary_file(items, binary_file):
+    """
+    Uloží extrahované položky do binárneho súboru .blkb.
+    
+    Args:
+        items (ItemStore): Položky (popis, suma v centoch)
+        binary_file (str): Cesta k výstupnému binárnemu súboru
+    
+    Returns:
+        bool: True, ak sa podarilo uložiť súbor, inak False
+    """
+    try:
+        count = write_blocky_binary(binary_file, items, cents=True)
+        print(f"Binárny súbor: {binary_file} ({count} položiek)")
+        return True
+    
+    except Exception as e:
+        print(f"Chyba pri zápise binárneho súboru: {str(e)}")
+        return False
+
+
+def convert_word_to_blocky(input_file, output_file, cache=None, engine="docx", binary_file=None, dedup=None):
+    """
+    Extrahuje položky z Word dokumentu a uloží ich pre aplikáciu Blocky.
+    
+    Args:
+        input_file (str): Cesta k vstupnému Word dokumentu
+        output_file (str): Cesta k výstupnému textovému súboru
+        cache (ConversionCache): Vyrovnávacia pamäť položiek alebo None
+        engine (str): Spôsob načítania dokumentu ("docx" alebo "xml")
+        binary_file (str): Cesta k binárnemu súboru .blkb alebo None
+        dedup (DedupIndex): Index duplicít alebo None
+    
+    Returns:
+        bool: True, ak konverzia prebehla úspešne, inak False
+    """
+    # Extrakcia údajov z Word dokumentu
+    items = extract_data_from_word(input_file, cache=cache, engine=engine)
+    
+    if len(items) == 0:
+        print("Neboli nájdené žiadne položky na import.")
+        return False
+    
+    # Vyrovnávacia pamäť obsahuje všetky položky, duplicity sa vynechajú až tu
+    if dedup is not None:
+        with stage("dedup", len(items)):
+            items = ItemStore(dedup.filter_items(items, cents=True), cents=True)
+            items.finish()
+    
+    # Uloženie do textového súboru
+    if not save_to_text_file(items, output_file, os.path.basename(input_file)):
+        return False
+    
+    # Uloženie do binárneho súboru
+    if binary_file:
+        return save_to_binary_file(items, binary_file)
+    
+    return True
+
+
 def print_usage():
     """Zobrazí návod na použitie"""
     print("Použitie:")
-    print("  python word_to_blocky.py input.docx output.txt")
+    print("  python word_to_blocky.py input.docx output.txt [prepínače]")
     print()
     print("Parametre:")
     print("  input.docx  - Vstupný Word dokument")
     print("  output.txt  - Výstupný textový súbor")
+    print()
+    print("Prepínače:")
+    print("  --engine=docx  - Načítanie dokumentu cez python-docx (predvolené)")
+    print("  --engine=xml   - Postupné čítanie XML bez python-docx (rýchlejšie)")
+    print("  --cache     - Použiť vyrovnávaciu pamäť pre nezmenené dokumenty")
+    print("  --cache-dir=cesta, --cache-size=MB, --refresh-cache, --clear-cache")
+    print("  --binary=cesta - Zapísať aj binárny súbor .blkb")
+    print("  --dedup[-index=cesta] - Vynechať už vytvorené položky (--dedup-report=cesta)")
+    print("  --metrics[=json|=subor.json] - Čas a pamäť jednotlivých fáz konverzie")
+    print("  --profile=cesta - Zapísať profil cProfile")
 
 
 def main():
     """Hlavná funkcia"""
     # Kontrola argumentov
-    if len(sys.argv) != 3:
+    arguments, options = parse_arguments(sys.argv[1:])
+    if len(arguments) != 2:
         print_usage()
         return
     
-    input_file = sys.argv[1]
-    output_file = sys.argv[2]
+    input_file = arguments[0]
+    output_file = arguments[1]
+    
+    engine = options.get("engine", "docx")
+    if engine not in ENGINES:
+        print(f"Chyba: Neznámy spôsob načítania '{engine}'")
+        print_usage()
+        return
     
     # Kontrola, či vstupný súbor existuje
     if not os.path.isfile(input_file):
@@ -193,15 +487,27 @@ def main():
     if not input_file.endswith(('.docx')):
         print(f"Upozornenie: Vstupný súbor '{input_file}' nemusí byť Word dokument")
     
-    # Extrakcia údajov z Word dokumentu
-    items = extract_data_from_word(input_file)
+    try:
+        cache = cache_from_options(options)
+    except CACHE_ERRORS as e:
+        print(f"Chyba: {str(e)}")
+        return
     
-    if len(items) == 0:
-        print("Neboli nájdené žiadne položky na import.")
+    try:
+        dedup = dedup_from_options(options, input_file)
+    except DEDUP_ERRORS as e:
+        print(f"Chyba: Index duplicít sa nepodarilo otvoriť: {str(e)}")
         return
     
-    # Uloženie do textového súboru
-    save_to_text_file(items, output_file, os.path.basename(input_file))
+    # Konverzia
+    success = run_measured(os.path.basename(input_file), options,
+                           convert_word_to_blocky, input_file, output_file, cache=cache, engine=engine,
+                           binary_file=options.get("binary"), dedup=dedup)
+    
+    # Položky sa do indexu uložia iba po úspešnej konverzii
+    if dedup is not None:
+        dedup.close(commit=bool(success))
+        dedup.print_report()
 
 
 if __name__ == "__main__":
@@ -9,7 +9,21 @@ v rovnakom formáte ako vo Word dokumente. Výsledok je možné použiť
 v aplikácii Blocky.
 
 Použitie:
-    python word_to_blocky_formatter.py input.docx output.txt
+    python word_to_blocky_formatter.py input.docx output.txt [--all-tables] [--incremental]
+
+Prepínače:
+    --all-tables  - Spracuje všetky tabuľky dokumentu (napr. jednu tabuľku
+                    na každé nákladové stredisko), každú s vlastným nadpisom,
+                    šírkou stĺpcov a celkovou sumou, v poradí ako v dokumente
+    --workers=N   - Počet procesov pre súbežné vytváranie tabuliek; bez
+                    prepínača sa procesy použijú iba pri veľkých dokumentoch
+    --incremental - Prírastkové vytvorenie výstupu: znova sa naformátujú iba
+                    zmenené riadky tabuľky, ostatné riadky, šírky stĺpcov
+                    a sumy sa použijú z posledného spustenia; stav sa ukladá
+                    do output.txt.state.json
+    --metrics     - Vypíše čas a pamäť jednotlivých fáz konverzie
+                    (--metrics=json alebo --metrics=subor.json pre JSON)
+    --profile=cesta - Zapíše profil cProfile (pozri blocky_metrics.py)
 
 Požiadavky:
     - Python 3.6+
@@ -21,14 +35,95 @@ Inštalácia požiadaviek:
 
 import sys
 import os
-import re
+import json
+from collections import Counter
+from itertools import accumulate
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
-from docx import Document
+
+from blocky_cli import parse_arguments
+from blocky_amounts import parse_amount_cents, format_cents
+from blocky_items import TableStore
+from blocky_metrics import stage, add_rows, run_measured
+
+
+# Počet riadkov tabuľky, nad ktorý sa výstup zapisuje priebežne po blokoch
+STREAMING_ROW_THRESHOLD = 50000
+
+# Počet riadkov zapísaných naraz pri priebežnom zápise
+LINES_PER_WRITE = 1000
+
+# Veľkosť vyrovnávacej pamäte výstupného súboru
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Počet riadkov všetkých tabuliek, od ktorého sa tabuľky bez prepínača
+# --workers vytvárajú v skupine procesov
+PARALLEL_ROW_THRESHOLD = 50000
+
+# Verzia súboru so stavom prírastkového vytvárania výstupu
+INCREMENTAL_STATE_VERSION = 1
+
+
+def new_table_data(title=""):
+    """Vráti prázdny slovník s údajmi a formátovaním tabuľky"""
+    return {
+        "headers": [],
+        "rows": TableStore(),
+        "title": title,
+        "has_borders": False,
+        "column_widths": [],
+        "has_header_formatting": False
+    }
+
+
+def extract_table_data(table, title=""):
+    """
+    Extrahuje údaje a formátovanie jednej tabuľky.
+    
+    Args:
+        table (docx.table.Table): Tabuľka z Word dokumentu
+        title (str): Nadpis tabuľky
+    
+    Returns:
+        dict: Slovník obsahujúci údaje a formátovanie tabuľky
+    """
+    table_data = new_table_data(title)
+    
+    # Zistenie, či tabuľka má ohraničenie
+    if hasattr(table, 'style') and table.style:
+        table_data["has_borders"] = "Table Grid" in table.style.name or "Grid" in table.style.name
+    
+    # Extrakcia hlavičky tabuľky
+    if len(table.rows) > 0:
+        header_cells = table.rows[0].cells
+        for cell in header_cells:
+            table_data["headers"].append(cell.text.strip())
+        
+        # Zistenie, či hlavička má špeciálne formátovanie
+        table_data["has_header_formatting"] = True  # Predpokladáme, že má
+        
+        # Extrakcia šírky stĺpcov (približne)
+        for cell in header_cells:
+            if hasattr(cell, 'width'):
+                table_data["column_widths"].append(cell.width)
+            else:
+                table_data["column_widths"].append(None)
+    
+    # Extrakcia riadkov tabuľky
+    for row_index, row in enumerate(table.rows):
+        if row_index == 0:  # Preskočenie hlavičky
+            continue
+        
+        # Riadky sa ukladajú do kompaktného úložiska, nie ako samostatné zoznamy
+        table_data["rows"].append(cell.text.strip() for cell in row.cells)
+    
+    table_data["rows"].finish()
+    return table_data
 
 
 def extract_table_format_from_word(input_file):
     """
-    Extrahuje údaje a formátovanie tabuľky z Word dokumentu.
+    Extrahuje údaje a formátovanie prvej tabuľky z Word dokumentu.
     
     Args:
         input_file (str): Cesta k vstupnému Word dokumentu
@@ -39,61 +134,27 @@ def extract_table_format_from_word(input_file):
     try:
         # Načítanie Word dokumentu
         print(f"Načítavam Word dokument: {input_file}")
-        doc = Document(input_file)
+        with stage("load"):
+            from docx import Document
+            doc = Document(input_file)
         
-        table_data = {
-            "headers": [],
-            "rows": [],
-            "title": "",
-            "has_borders": False,
-            "column_widths": [],
-            "has_header_formatting": False
-        }
+        table_data = new_table_data()
         
-        # Hľadanie nadpisu tabuľky
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip() and not table_data["title"]:
-                table_data["title"] = paragraph.text.strip()
-                break
+        with stage("parse"):
+            # Hľadanie nadpisu tabuľky
+            table_data["title"] = find_document_title(doc)
+            
+            tables = doc.tables
         
         # Pokus o extrakciu údajov z tabuliek
-        if len(doc.tables) > 0:
-            print(f"Dokument obsahuje {len(doc.tables)} tabuliek.")
+        if len(tables) > 0:
+            print(f"Dokument obsahuje {len(tables)} tabuliek.")
             
             # Berieme prvú tabuľku
-            table = doc.tables[0]
             print(f"Spracovávam tabuľku...")
-            
-            # Zistenie, či tabuľka má ohraničenie
-            if hasattr(table, 'style') and table.style:
-                table_data["has_borders"] = "Table Grid" in table.style.name or "Grid" in table.style.name
-            
-            # Extrakcia hlavičky tabuľky
-            if len(table.rows) > 0:
-                header_row = table.rows[0]
-                for cell in header_row.cells:
-                    table_data["headers"].append(cell.text.strip())
-                
-                # Zistenie, či hlavička má špeciálne formátovanie
-                table_data["has_header_formatting"] = True  # Predpokladáme, že má
-                
-                # Extrakcia šírky stĺpcov (približne)
-                for cell in header_row.cells:
-                    if hasattr(cell, 'width'):
-                        table_data["column_widths"].append(cell.width)
-                    else:
-                        table_data["column_widths"].append(None)
-            
-            # Extrakcia riadkov tabuľky
-            for row_index, row in enumerate(table.rows):
-                if row_index == 0:  # Preskočenie hlavičky
-                    continue
-                
-                row_data = []
-                for cell in row.cells:
-                    row_data.append(cell.text.strip())
-                
-                table_data["rows"].append(row_data)
+            with stage("parse"):
+                table_data = extract_table_data(tables[0], table_data["title"])
+            add_rows("parse", len(table_data["rows"]))
         
         print(f"Extrakcia dokončená. Nájdených {len(table_data['rows'])} riadkov.")
         return table_data
@@ -103,7 +164,596 @@ def extract_table_format_from_word(input_file):
         return None
 
 
-def create_formatted_table(table_data, output_file, input_file_name):
+def find_document_title(doc):
+    """
+    Nájde nadpis dokumentu: prvý neprázdny odsek.
+    
+    Args:
+        doc (docx.Document): Načítaný Word dokument
+    
+    Returns:
+        str: Nadpis alebo prázdny text, ak dokument neobsahuje žiadny text
+    """
+    for paragraph in doc.paragraphs:
+        if paragraph.text.strip():
+            return paragraph.text.strip()
+    return ""
+
+
+def find_table_titles(doc):
+    """
+    Nájde nadpis každej tabuľky v dokumente.
+    
+    Prvá tabuľka má rovnaký nadpis ako pri spracovaní iba prvej tabuľky
+    (find_document_title), takže dokument s jednou tabuľkou dá v oboch
+    režimoch rovnaký výstup. Nadpisom každej ďalšej tabuľky je posledný
+    neprázdny odsek medzi predchádzajúcou tabuľkou a touto tabuľkou.
+    Ak taký odsek neexistuje, použije sa "Tabuľka N".
+    
+    Args:
+        doc (docx.Document): Načítaný Word dokument
+    
+    Returns:
+        list: Nadpisy tabuliek v poradí, v akom sú v dokumente
+    """
+    from docx.oxml.ns import qn
+    from docx.text.paragraph import Paragraph
+    
+    titles = []
+    last_text = ""
+    
+    for element in doc.element.body.iterchildren():
+        if element.tag == qn('w:p'):
+            text = Paragraph(element, doc._body).text.strip()
+            if text:
+                last_text = text
+        elif element.tag == qn('w:tbl'):
+            titles.append(last_text or f"Tabuľka {len(titles) + 1}")
+            last_text = ""
+    
+    document_title = find_document_title(doc)
+    if titles and document_title:
+        titles[0] = document_title
+    return titles
+
+
+def extract_all_tables_from_word(input_file):
+    """
+    Extrahuje údaje a formátovanie všetkých tabuliek z Word dokumentu.
+    
+    Tabuľky sa čítajú postupne v poradí ako v dokumente. Čítanie cez
+    python-docx je čistý Python, súbežné vlákna by ho pre GIL nezrýchlili
+    a objekty python-docx nie je možné preniesť do iného procesu.
+    
+    Args:
+        input_file (str): Cesta k vstupnému Word dokumentu
+    
+    Returns:
+        list: Zoznam slovníkov s údajmi a formátovaním tabuliek alebo None pri chybe
+    """
+    try:
+        # Načítanie Word dokumentu
+        print(f"Načítavam Word dokument: {input_file}")
+        with stage("load"):
+            from docx import Document
+            doc = Document(input_file)
+        
+        with stage("parse"):
+            tables = doc.tables
+            titles = find_table_titles(doc)
+        print(f"Dokument obsahuje {len(tables)} tabuliek.")
+        
+        with stage("parse"):
+            tables_data = [extract_table_data(table, title) for table, title in zip(tables, titles)]
+        
+        row_count = sum(len(table_data["rows"]) for table_data in tables_data)
+        add_rows("parse", row_count)
+        print(f"Extrakcia dokončená. Nájdených {row_count} riadkov v {len(tables_data)} tabuľkách.")
+        return tables_data
+    
+    except Exception as e:
+        print(f"Chyba pri extrakcii údajov z Word dokumentu: {str(e)}")
+        return None
+
+
+def compute_column_widths(headers, rows):
+    """
+    Určí šírku stĺpcov jedným prechodom cez všetky riadky.
+    
+    Args:
+        headers (list): Texty hlavičky tabuľky
+        rows (iterable): Riadky tabuľky (zoznamy textov buniek)
+    
+    Returns:
+        list: Šírka každého stĺpca vrátane rezervy
+    """
+    # Maximálna dĺžka textu v každom stĺpci
+    widths = [len(header) for header in headers]
+    column_count = len(widths)
+    
+    for row in rows:
+        for index, cell in zip(range(column_count), row):
+            length = len(cell)
+            if length > widths[index]:
+                widths[index] = length
+    
+    # Pridanie rezervy
+    return [width + 2 for width in widths]
+
+
+def border_line(column_widths):
+    """Vráti vodorovné ohraničenie tabuľky"""
+    return "+" + "+".join("-" * width for width in column_widths) + "+\n"
+
+
+def row_formatter(column_widths):
+    """
+    Vytvorí funkciu, ktorá naformátuje riadok tabuľky podľa šírky stĺpcov.
+    
+    Šablóna riadku sa pripraví iba raz pre každý počet buniek, takže
+    formátovanie riadku je jedno volanie str.format.
+    
+    Args:
+        column_widths (list): Šírka stĺpcov vrátane rezervy
+    
+    Returns:
+        function: Funkcia, ktorá z riadku vytvorí riadok textu
+    """
+    templates = {}
+    column_count = len(column_widths)
+    
+    def format_row(row):
+        cell_count = min(len(row), column_count)
+        template = templates.get(cell_count)
+        if template is None:
+            template = "|" + "".join(" {:<%d} |" % (width - 2) for width in column_widths[:cell_count]) + "\n"
+            templates[cell_count] = template
+        return template.format(*row[:cell_count])
+    
+    return format_row
+
+
+def render_table_lines(table_data, column_widths, row_lines=None):
+    """
+    Postupne vytvorí riadky textu formátovanej tabuľky.
+    
+    Args:
+        table_data (dict): Slovník obsahujúci údaje a formátovanie tabuľky
+        column_widths (list): Šírka stĺpcov vrátane rezervy
+        row_lines (iterable): Už naformátované riadky tabuľky alebo None,
+                              ak sa majú naformátovať z table_data
+    
+    Yields:
+        str: Riadok textu vrátane znaku nového riadku
+    """
+    border = border_line(column_widths)
+    format_row = row_formatter(column_widths)
+    
+    # Vytvorenie horného ohraničenia tabuľky
+    if table_data["has_borders"]:
+        yield border
+    
+    # Vytvorenie hlavičky tabuľky
+    yield format_row(table_data["headers"])
+    
+    # Vytvorenie oddeľovača hlavičky
+    if table_data["has_borders"] or table_data["has_header_formatting"]:
+        yield border
+    
+    # Vytvorenie riadkov tabuľky
+    if row_lines is None:
+        row_lines = map(format_row, table_data["rows"])
+    yield from row_lines
+    
+    # Vytvorenie spodného ohraničenia tabuľky
+    if table_data["has_borders"]:
+        yield border
+
+
+def render_summary_lines(table_data):
+    """
+    Postupne vytvorí celkovú sumu a informácie pre import do aplikácie Blocky.
+    
+    Args:
+        table_data (dict): Slovník obsahujúci údaje a formátovanie tabuľky
+    
+    Yields:
+        str: Riadok textu vrátane znaku nového riadku
+    """
+    # Sumy z posledného stĺpca sa prečítajú pre každý riadok iba raz
+    # a použijú sa pre celkovú sumu aj pre informácie na import; sumy sa čítajú
+    # priamo v centoch, takže celková suma je presná
+    amounts = [parse_amount_cents(row[-1]) if len(row) > 0 else None for row in table_data["rows"]]
+    
+    # Výpočet celkovej sumy (ak je to relevantné)
+    total_cents = sum(cents for cents in amounts if cents is not None)
+    
+    hint_lines = (item_hint_line(row, amount) for row, amount in zip(table_data["rows"], amounts))
+    yield from render_total_lines(total_cents, hint_lines)
+
+
+def item_hint_line(row, amount):
+    """
+    Vytvorí riadok s informáciou pre import jedného riadku tabuľky.
+    
+    Args:
+        row (list): Texty buniek riadku
+        amount (int): Suma z posledného stĺpca v centoch alebo None
+    
+    Returns:
+        str: Riadok textu alebo None, ak riadok nie je položkou
+    """
+    # Predpokladáme, že prvý stĺpec je popis a posledný je suma
+    if len(row) >= 2 and amount is not None:
+        return f"# - Popis: {row[0]}, Suma: {format_cents(amount, '.')} €\n"
+    return None
+
+
+def render_total_lines(total_cents, hint_lines):
+    """
+    Postupne vytvorí celkovú sumu a informácie pre import z hotových riadkov.
+    
+    Args:
+        total_cents (int): Celková suma v centoch
+        hint_lines (iterable): Riadky z item_hint_line (None sa vynechajú)
+    
+    Yields:
+        str: Riadok textu vrátane znaku nového riadku
+    """
+    # Pridanie celkovej sumy pod tabuľku
+    yield "\n"
+    yield f"Celková suma: {format_cents(total_cents, '.')} €\n"
+    
+    # Pridanie informácií pre import do aplikácie Blocky
+    yield "\n"
+    yield "# Informácie pre import do aplikácie Blocky:\n"
+    yield "# Pre každý riadok tabuľky (okrem hlavičky) vytvorte položku v aplikácii:\n"
+    
+    for line in hint_lines:
+        if line is not None:
+            yield line
+
+
+def render_document_header_lines(input_file_name):
+    """
+    Vytvorí hlavičku výstupného súboru.
+    
+    Args:
+        input_file_name (str): Názov vstupného súboru
+    
+    Yields:
+        str: Riadok textu vrátane znaku nového riadku
+    """
+    yield f"# Tabuľka vytvorená z dokumentu: {input_file_name}\n"
+    yield f"# Vytvorené: {datetime.now().strftime('%d.%m.%Y %H:%M:%S')}\n"
+    yield "#\n\n"
+
+
+def render_title_lines(table_data):
+    """
+    Vytvorí nadpis tabuľky.
+    
+    Args:
+        table_data (dict): Slovník obsahujúci údaje a formátovanie tabuľky
+    
+    Yields:
+        str: Riadok textu vrátane znaku nového riadku
+    """
+    if table_data["title"]:
+        yield f"{table_data['title']}\n\n"
+
+
+def render_table_section_lines(table_data):
+    """
+    Postupne vytvorí nadpis, tabuľku, celkovú sumu a informácie pre import.
+    
+    Args:
+        table_data (dict): Slovník obsahujúci údaje a formátovanie tabuľky
+    
+    Yields:
+        str: Riadok textu vrátane znaku nového riadku
+    """
+    yield from render_title_lines(table_data)
+    
+    column_widths = compute_column_widths(table_data["headers"], table_data["rows"])
+    yield from render_table_lines(table_data, column_widths)
+    yield from render_summary_lines(table_data)
+
+
+def render_table_section(table_data):
+    """
+    Vytvorí text jednej tabuľky (pre spracovanie v inom procese).
+    
+    Args:
+        table_data (dict): Slovník obsahujúci údaje a formátovanie tabuľky
+    
+    Returns:
+        str: Text tabuľky s nadpisom, celkovou sumou a informáciami pre import
+    """
+    return "".join(render_table_section_lines(table_data))
+
+
+def incremental_state_path(output_file):
+    """Vráti cestu k súboru so stavom prírastkového vytvárania výstupu"""
+    return output_file + ".state.json"
+
+
+def load_incremental_state(input_file_name, output_file):
+    """
+    Načíta stav posledného prírastkového vytvárania výstupu.
+    
+    Stav sa použije, iba ak patrí k rovnakému vstupnému súboru.
+    
+    Args:
+        input_file_name (str): Názov vstupného súboru
+        output_file (str): Cesta k výstupnému textovému súboru
+    
+    Returns:
+        list: Stav každej tabuľky v poradí ako v dokumente alebo None
+    """
+    try:
+        with open(incremental_state_path(output_file), 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        
+        if state.get("version") != INCREMENTAL_STATE_VERSION:
+            return None
+        if state.get("source") != input_file_name:
+            return None
+        return state["tables"]
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def save_incremental_state(output_file, input_file_name, table_states):
+    """
+    Uloží stav prírastkového vytvárania výstupu vedľa výstupného súboru.
+    
+    Args:
+        output_file (str): Cesta k výstupnému textovému súboru
+        input_file_name (str): Názov vstupného súboru
+        table_states (list): Stav každej tabuľky
+    """
+    path = incremental_state_path(output_file)
+    temp_path = path + ".tmp"
+    with open(temp_path, 'w', encoding='utf-8') as f:
+        f.write(json.dumps({
+            "version": INCREMENTAL_STATE_VERSION,
+            "source": input_file_name,
+            "tables": table_states,
+        }, ensure_ascii=False))
+    os.replace(temp_path, path)
+
+
+def row_key(row):
+    """
+    Vráti kľúč riadku tabuľky z textov jeho buniek.
+    
+    Každá bunka je ukončená znakom NUL, ktorý sa v texte Word dokumentu
+    nemôže vyskytnúť, takže rôzne riadky (aj s rôznym počtom buniek) majú
+    vždy rôzny kľúč.
+    """
+    return "\0".join(row) + "\0" if row else ""
+
+
+def new_table_state(column_count):
+    """Vráti prázdny stav prírastkového vytvárania jednej tabuľky"""
+    return {
+        "column_widths": None,
+        "length_counts": [{} for _ in range(column_count)],
+        "row_keys": "",
+        "amounts": [],
+        "cell_lengths": [],
+        "row_lines": "",
+        "row_line_lengths": [],
+        "hint_lines": "",
+        "hint_line_lengths": [],
+        "total_cents": 0
+    }
+
+
+def line_offsets(lengths, start, end):
+    """Vráti polohu začiatku riadkov start až end v spojenom texte riadkov"""
+    return list(accumulate([sum(lengths[:start])] + lengths[start:end]))
+
+
+def render_table_section_incremental(table_data, state=None):
+    """
+    Vytvorí text jednej tabuľky, pričom znova naformátuje iba zmenené riadky.
+    
+    Stav tabuľky obsahuje pre každý riadok jeho kľúč (row_key),
+    naformátovaný riadok tabuľky, riadok s informáciou pre import, sumu
+    v centoch a dĺžky textov buniek; pre každý stĺpec aj počet buniek
+    každej dĺžky. Texty a čísla všetkých riadkov sú uložené spolu
+    (reťazce a ploché zoznamy), aby sa stav rýchlo načítal a uložil.
+    
+    Spoločný začiatok a koniec tabuľky s predchádzajúcim stavom sa použije
+    naraz ako jeden úsek textu. Zvyšné riadky sa s predchádzajúcimi porovnajú
+    podľa obsahu, takže presunuté riadky sa tiež nenaformátujú znova. Pre
+    pridané a odstránené riadky sa upravia počty dĺžok buniek a celková
+    suma; šírka stĺpca je najväčšia dĺžka s nenulovým počtom. Všetky riadky
+    tabuľky sa naformátujú znova, iba ak sa zmenila šírka niektorého
+    stĺpca. Výsledok je zhodný s render_table_section.
+    
+    Args:
+        table_data (dict): Slovník obsahujúci údaje a formátovanie tabuľky
+        state (dict): Stav tabuľky z posledného spustenia alebo None
+    
+    Returns:
+        tuple: (text tabuľky, nový stav tabuľky, počet pridaných a odstránených riadkov)
+    """
+    headers = table_data["headers"]
+    rows = table_data["rows"]
+    column_count = len(headers)
+    
+    if state is None or len(state["length_counts"]) != column_count:
+        state = new_table_state(column_count)
+    
+    # Kľúče počtov sú v JSON reťazce
+    length_counts = [{int(length): count for length, count in counts.items()}
+                     for counts in state["length_counts"]]
+    total_cents = state["total_cents"]
+    amounts = state["amounts"]
+    cell_lengths = state["cell_lengths"]
+    row_line_lengths = state["row_line_lengths"]
+    hint_line_lengths = state["hint_line_lengths"]
+    
+    # Kľúče riadkov sú v stave oddelené znakom \x01, ktorý sa v texte tiež nemôže vyskytnúť
+    previous_keys = state["row_keys"].split("\1") if amounts else []
+    keys = [row_key(row) for row in rows]
+    
+    # Spoločný začiatok a koniec s predchádzajúcou tabuľkou
+    start = 0
+    limit = min(len(keys), len(previous_keys))
+    while start < limit and keys[start] == previous_keys[start]:
+        start += 1
+    end = len(keys)
+    previous_end = len(previous_keys)
+    while end > start and previous_end > start and keys[end - 1] == previous_keys[previous_end - 1]:
+        end -= 1
+        previous_end -= 1
+    
+    # Riadky medzi nimi sa hľadajú medzi predchádzajúcimi riadkami podľa obsahu
+    row_offsets = line_offsets(row_line_lengths, start, previous_end)
+    hint_offsets = line_offsets(hint_line_lengths, start, previous_end)
+    remaining = Counter(previous_keys[start:previous_end])
+    first_index = {}
+    for index in range(previous_end - 1, start - 1, -1):
+        first_index[previous_keys[index]] = index
+    
+    middle = []
+    changed_rows = 0
+    for index in range(start, end):
+        key = keys[index]
+        if remaining.get(key, 0) > 0:
+            # Presunutý riadok
+            remaining[key] -= 1
+            previous_index = first_index[key]
+            offset = previous_index - start
+            middle.append((
+                state["row_lines"][row_offsets[offset]:row_offsets[offset + 1]],
+                state["hint_lines"][hint_offsets[offset]:hint_offsets[offset + 1]],
+                amounts[previous_index],
+                cell_lengths[previous_index * column_count:(previous_index + 1) * column_count]
+            ))
+            continue
+        
+        # Pridaný riadok
+        row = rows[index]
+        amount = parse_amount_cents(row[-1]) if len(row) > 0 else None
+        lengths = [len(cell) for cell in row[:column_count]]
+        for counts, length in zip(length_counts, lengths):
+            counts[length] = counts.get(length, 0) + 1
+        
+        # Chýbajúce bunky sa v stave ukladajú ako -1
+        if len(lengths) < column_count:
+            lengths.extend([-1] * (column_count - len(lengths)))
+        middle.append((None, item_hint_line(row, amount) or "", amount, lengths))
+        if amount is not None:
+            total_cents += amount
+        changed_rows += 1
+    
+    for key, count in remaining.items():
+        if count <= 0:
+            continue
+        
+        # Odstránený riadok
+        previous_index = first_index[key]
+        for counts, length in zip(length_counts, cell_lengths[previous_index * column_count:]):
+            if length >= 0:
+                counts[length] -= count
+                if counts[length] == 0:
+                    del counts[length]
+        if amounts[previous_index] is not None:
+            total_cents -= amounts[previous_index] * count
+        changed_rows += count
+    
+    column_widths = [max(len(header), max(counts, default=0)) + 2
+                     for header, counts in zip(headers, length_counts)]
+    format_row = row_formatter(column_widths)
+    
+    if column_widths == state["column_widths"]:
+        middle_lines = [line if line is not None else format_row(rows[index])
+                        for index, (line, _, _, _) in enumerate(middle, start)]
+        row_lines = (state["row_lines"][:row_offsets[0]] + "".join(middle_lines)
+                     + state["row_lines"][row_offsets[-1]:])
+        new_row_line_lengths = (row_line_lengths[:start] + [len(line) for line in middle_lines]
+                                + row_line_lengths[previous_end:])
+    else:
+        # Pri zmene šírky stĺpca sa naformátujú všetky riadky tabuľky
+        all_lines = [format_row(row) for row in rows]
+        row_lines = "".join(all_lines)
+        new_row_line_lengths = [len(line) for line in all_lines]
+    
+    hint_lines = (state["hint_lines"][:hint_offsets[0]] + "".join(entry[1] for entry in middle)
+                  + state["hint_lines"][hint_offsets[-1]:])
+    
+    new_cell_lengths = cell_lengths[:start * column_count]
+    for entry in middle:
+        new_cell_lengths.extend(entry[3])
+    new_cell_lengths.extend(cell_lengths[previous_end * column_count:])
+    
+    new_state = {
+        "column_widths": column_widths,
+        "length_counts": length_counts,
+        "row_keys": "\1".join(keys),
+        "amounts": amounts[:start] + [entry[2] for entry in middle] + amounts[previous_end:],
+        "cell_lengths": new_cell_lengths,
+        "row_lines": row_lines,
+        "row_line_lengths": new_row_line_lengths,
+        "hint_lines": hint_lines,
+        "hint_line_lengths": (hint_line_lengths[:start] + [len(entry[1]) for entry in middle]
+                              + hint_line_lengths[previous_end:]),
+        "total_cents": total_cents
+    }
+    
+    lines = []
+    lines.extend(render_title_lines(table_data))
+    lines.extend(render_table_lines(table_data, column_widths, [row_lines]))
+    lines.extend(render_total_lines(total_cents, [hint_lines]))
+    return "".join(lines), new_state, changed_rows
+
+
+def render_document_lines(table_data, input_file_name):
+    """
+    Postupne vytvorí celý výstupný súbor s formátovanou tabuľkou.
+    
+    Args:
+        table_data (dict): Slovník obsahujúci údaje a formátovanie tabuľky
+        input_file_name (str): Názov vstupného súboru
+    
+    Yields:
+        str: Riadok textu vrátane znaku nového riadku
+    """
+    # Hlavička dokumentu
+    yield from render_document_header_lines(input_file_name)
+    yield from render_table_section_lines(table_data)
+
+
+def write_lines(f, lines, stream):
+    """
+    Zapíše riadky textu do súboru.
+    
+    Args:
+        f (file): Otvorený výstupný súbor
+        lines (iterable): Riadky textu
+        stream (bool): Ak True, riadky sa zapisujú priebežne po blokoch
+                       a celý výstup sa nikdy nedrží v pamäti naraz
+    """
+    if not stream:
+        f.write("".join(lines))
+        return
+    
+    block = []
+    for line in lines:
+        block.append(line)
+        if len(block) >= LINES_PER_WRITE:
+            f.write("".join(block))
+            block.clear()
+    if block:
+        f.write("".join(block))
+
+
+def create_formatted_table(table_data, output_file, input_file_name, stream=None, incremental=False):
     """
     Vytvorí formátovanú tabuľku na základe extrahovaných údajov.
     
@@ -111,126 +761,241 @@ def create_formatted_table(table_data, output_file, input_file_name):
         table_data (dict): Slovník obsahujúci údaje a formátovanie tabuľky
         output_file (str): Cesta k výstupnému textovému súboru
         input_file_name (str): Názov vstupného súboru
+        stream (bool): Priebežný zápis po blokoch; None = podľa počtu riadkov
+        incremental (bool): Znova naformátovať iba zmenené riadky
+                            (pozri render_table_section_incremental)
     
     Returns:
         bool: True, ak sa podarilo vytvoriť tabuľku, inak False
     """
+    if incremental:
+        return create_formatted_tables_incremental([table_data], output_file, input_file_name)
+    
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            # Hlavička dokumentu
-            f.write(f"# Tabuľka vytvorená z dokumentu: {input_file_name}\n")
-            f.write(f"# Vytvorené: {datetime.now().strftime('%d.%m.%Y %H:%M:%S')}\n")
-            f.write("#\n\n")
-            
-            # Nadpis tabuľky
-            if table_data["title"]:
-                f.write(f"{table_data['title']}\n\n")
-            
-            # Určenie šírky stĺpcov
-            column_widths = []
-            for i, header in enumerate(table_data["headers"]):
-                # Nájdenie maximálnej dĺžky textu v stĺpci
-                max_width = len(header)
-                for row in table_data["rows"]:
-                    if i < len(row):
-                        max_width = max(max_width, len(row[i]))
-                
-                # Pridanie rezervy
-                column_widths.append(max_width + 2)
-            
-            # Vytvorenie horného ohraničenia tabuľky
-            if table_data["has_borders"]:
-                f.write("+" + "+".join("-" * width for width in column_widths) + "+\n")
-            
-            # Vytvorenie hlavičky tabuľky
-            header_row = "|"
-            for i, header in enumerate(table_data["headers"]):
-                width = column_widths[i]
-                header_row += f" {header.ljust(width - 2)} |"
-            f.write(header_row + "\n")
-            
-            # Vytvorenie oddeľovača hlavičky
-            if table_data["has_borders"] or table_data["has_header_formatting"]:
-                f.write("+" + "+".join("-" * width for width in column_widths) + "+\n")
-            
-            # Vytvorenie riadkov tabuľky
-            for row in table_data["rows"]:
-                row_text = "|"
-                for i, cell in enumerate(row):
-                    if i < len(column_widths):
-                        width = column_widths[i]
-                        row_text += f" {cell.ljust(width - 2)} |"
-                f.write(row_text + "\n")
+        if stream is None:
+            stream = len(table_data["rows"]) > STREAMING_ROW_THRESHOLD
+        
+        row_count = len(table_data["rows"])
+        with open(output_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            if stream:
+                # Riadky sa vytvárajú a zapisujú priebežne, fázy sa nedajú oddeliť
+                with stage("write", row_count):
+                    write_lines(f, render_document_lines(table_data, input_file_name), True)
+            else:
+                with stage("render", row_count):
+                    text = "".join(render_document_lines(table_data, input_file_name))
+                with stage("write", row_count):
+                    f.write(text)
+        
+        print(f"Tabuľka bola úspešne vytvorená. Výstupný súbor: {output_file}")
+        return True
+    
+    except Exception as e:
+        print(f"Chyba pri vytváraní tabuľky: {str(e)}")
+        return False
+
+
+def table_executor(tables_data, workers):
+    """
+    Vytvorí skupinu procesov na súbežné vytváranie tabuliek.
+    
+    Bez zadaného počtu procesov sa skupina vytvorí, iba ak majú tabuľky
+    spolu aspoň PARALLEL_ROW_THRESHOLD riadkov; pri menších dokumentoch
+    trvá spustenie procesov a prenos údajov dlhšie ako samotné vytvorenie.
+    
+    Args:
+        tables_data (list): Zoznam slovníkov s údajmi a formátovaním tabuliek
+        workers (int): Počet procesov (None = podľa veľkosti, 1 = bez procesov)
+    
+    Returns:
+        ProcessPoolExecutor: Skupina procesov alebo None pre vytvorenie v tomto procese
+    """
+    if workers == 1 or len(tables_data) <= 1:
+        return None
+    if workers is None and sum(len(table_data["rows"]) for table_data in tables_data) < PARALLEL_ROW_THRESHOLD:
+        return None
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+def create_formatted_tables(tables_data, output_file, input_file_name, workers=None):
+    """
+    Vytvorí formátované tabuľky pre všetky tabuľky dokumentu do jedného súboru.
+    
+    Každá tabuľka má vlastný nadpis, šírku stĺpcov a celkovú sumu. Veľké
+    dokumenty sa vytvárajú súbežne v skupine procesov (pozri table_executor).
+    Tabuľky sa zapisujú v poradí, v akom sú v dokumente.
+    
+    Args:
+        tables_data (list): Zoznam slovníkov s údajmi a formátovaním tabuliek
+        output_file (str): Cesta k výstupnému textovému súboru
+        input_file_name (str): Názov vstupného súboru
+        workers (int): Počet procesov (None = podľa veľkosti, 1 = bez procesov)
+    
+    Returns:
+        bool: True, ak sa podarilo vytvoriť tabuľky, inak False
+    """
+    try:
+        with open(output_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            write_lines(f, render_document_header_lines(input_file_name), False)
             
-            # Vytvorenie spodného ohraničenia tabuľky
-            if table_data["has_borders"]:
-                f.write("+" + "+".join("-" * width for width in column_widths) + "+\n")
+            executor = table_executor(tables_data, workers)
+            if executor is None:
+                sections = map(render_table_section, tables_data)
+            else:
+                sections = executor.map(render_table_section, tables_data)
             
-            # Výpočet celkovej sumy (ak je to relevantné)
+            # Tabuľky sa vytvárajú súbežne so zápisom, preto sú spolu vo fáze render
             try:
-                # Predpokladáme, že posledný stĺpec obsahuje sumy
-                total_sum = 0
-                for row in table_data["rows"]:
-                    if len(row) > 0:
-                        last_cell = row[-1]
-                        # Extrakcia čísla zo sumy
-                        amount_match = re.search(r'([\-]?\d+[.,]?\d*)', last_cell)
-                        if amount_match:
-                            amount_str = amount_match.group(1).replace(',', '.')
-                            total_sum += float(amount_str)
-                
-                # Pridanie celkovej sumy pod tabuľku
-                f.write("\n")
-                f.write(f"Celková suma: {total_sum:.2f} €\n")
-            except:
-                # Ak sa nepodarí vypočítať sumu, ignorujeme to
-                pass
-            
-            # Pridanie informácií pre import do aplikácie Blocky
-            f.write("\n")
-            f.write("# Informácie pre import do aplikácie Blocky:\n")
-            f.write("# Pre každý riadok tabuľky (okrem hlavičky) vytvorte položku v aplikácii:\n")
+                with stage("render", sum(len(table_data["rows"]) for table_data in tables_data)):
+                    for index, section in enumerate(sections):
+                        # Tabuľky sú oddelené prázdnym riadkom
+                        if index > 0:
+                            f.write("\n")
+                        f.write(section)
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+        
+        print(f"Vytvorených tabuliek: {len(tables_data)}. Výstupný súbor: {output_file}")
+        return True
+    
+    except Exception as e:
+        print(f"Chyba pri vytváraní tabuliek: {str(e)}")
+        return False
+
+
+def create_formatted_tables_incremental(tables_data, output_file, input_file_name, workers=None):
+    """
+    Vytvorí formátované tabuľky a znova naformátuje iba zmenené riadky.
+    
+    Stav každej tabuľky sa načíta zo súboru output.txt.state.json
+    a po zápise výstupu sa uloží nový stav. Tabuľky sa so stavom párujú
+    podľa poradia v dokumente. Výstup je zhodný s create_formatted_table
+    a create_formatted_tables.
+    
+    Args:
+        tables_data (list): Zoznam slovníkov s údajmi a formátovaním tabuliek
+        output_file (str): Cesta k výstupnému textovému súboru
+        input_file_name (str): Názov vstupného súboru
+        workers (int): Počet procesov (None = podľa veľkosti, 1 = bez procesov)
+    
+    Returns:
+        bool: True, ak sa podarilo vytvoriť tabuľky, inak False
+    """
+    try:
+        previous_states = load_incremental_state(input_file_name, output_file) or []
+        previous_states = previous_states[:len(tables_data)]
+        previous_states += [None] * (len(tables_data) - len(previous_states))
+        
+        executor = table_executor(tables_data, workers)
+        if executor is None:
+            sections = map(render_table_section_incremental, tables_data, previous_states)
+        else:
+            sections = executor.map(render_table_section_incremental, tables_data, previous_states)
+        
+        table_states = []
+        changed_rows = 0
+        row_count = sum(len(table_data["rows"]) for table_data in tables_data)
+        with open(output_file, 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+            write_lines(f, render_document_header_lines(input_file_name), False)
             
-            for row in table_data["rows"]:
-                if len(row) >= 2:  # Predpokladáme, že prvý stĺpec je popis a posledný je suma
-                    description = row[0]
-                    amount_cell = row[-1]
-                    
-                    # Extrakcia čísla zo sumy
-                    amount_match = re.search(r'([\-]?\d+[.,]?\d*)', amount_cell)
-                    if amount_match:
-                        amount_str = amount_match.group(1).replace(',', '.')
-                        amount = float(amount_str)
-                        
-                        f.write(f"# - Popis: {description}, Suma: {amount:.2f} €\n")
+            try:
+                with stage("render", row_count):
+                    for index, (section, table_state, table_changed_rows) in enumerate(sections):
+                        # Tabuľky sú oddelené prázdnym riadkom
+                        if index > 0:
+                            f.write("\n")
+                        f.write(section)
+                        table_states.append(table_state)
+                        changed_rows += table_changed_rows
+            finally:
+                if executor is not None:
+                    executor.shutdown()
         
-        print(f"Tabuľka bola úspešne vytvorená. Výstupný súbor: {output_file}")
+        with stage("write", row_count):
+            save_incremental_state(output_file, input_file_name, table_states)
+        
+        print(f"Zmenených riadkov od posledného spustenia: {changed_rows} z {row_count}")
+        print(f"Vytvorených tabuliek: {len(tables_data)}. Výstupný súbor: {output_file}")
         return True
     
     except Exception as e:
-        print(f"Chyba pri vytváraní tabuľky: {str(e)}")
+        print(f"Chyba pri vytváraní tabuliek: {str(e)}")
+        return False
+
+
+def format_word_tables(input_file, output_file, all_tables=False, workers=None, incremental=False):
+    """
+    Extrahuje tabuľky z Word dokumentu a vytvorí z nich formátovaný výstup.
+    
+    Args:
+        input_file (str): Cesta k vstupnému Word dokumentu
+        output_file (str): Cesta k výstupnému textovému súboru
+        all_tables (bool): Spracovať všetky tabuľky, nie iba prvú
+        workers (int): Počet procesov pre vytváranie tabuliek (None = podľa veľkosti)
+        incremental (bool): Znova naformátovať iba zmenené riadky tabuliek
+    
+    Returns:
+        bool: True, ak sa podarilo vytvoriť výstup, inak False
+    """
+    if all_tables:
+        # Extrakcia a vytvorenie všetkých tabuliek dokumentu
+        tables_data = extract_all_tables_from_word(input_file)
+        
+        if not tables_data:
+            print("Neboli nájdené žiadne tabuľky.")
+            return False
+        
+        if incremental:
+            return create_formatted_tables_incremental(tables_data, output_file, os.path.basename(input_file), workers)
+        return create_formatted_tables(tables_data, output_file, os.path.basename(input_file), workers)
+    
+    # Extrakcia údajov a formátovania tabuľky z Word dokumentu
+    table_data = extract_table_format_from_word(input_file)
+    
+    if not table_data:
+        print("Neboli nájdené žiadne údaje v tabuľke.")
         return False
+    
+    # Vytvorenie formátovanej tabuľky
+    return create_formatted_table(table_data, output_file, os.path.basename(input_file), incremental=incremental)
 
 
 def print_usage():
     """Zobrazí návod na použitie"""
     print("Použitie:")
-    print("  python word_to_blocky_formatter.py input.docx output.txt")
+    print("  python word_to_blocky_formatter.py input.docx output.txt [prepínače]")
     print()
     print("Parametre:")
     print("  input.docx  - Vstupný Word dokument")
     print("  output.txt  - Výstupný textový súbor")
+    print()
+    print("Prepínače:")
+    print("  --all-tables  - Spracovať všetky tabuľky dokumentu, nie iba prvú")
+    print("  --workers=N   - Počet procesov pre vytváranie tabuliek (predvolene podľa veľkosti)")
+    print("  --incremental - Znova naformátovať iba riadky zmenené od posledného spustenia")
+    print("  --metrics[=json|=subor.json] - Čas a pamäť jednotlivých fáz konverzie")
+    print("  --profile=cesta - Zapísať profil cProfile")
 
 
 def main():
     """Hlavná funkcia"""
     # Kontrola argumentov
-    if len(sys.argv) != 3:
+    arguments, options = parse_arguments(sys.argv[1:])
+    if len(arguments) != 2:
         print_usage()
         return
     
-    input_file = sys.argv[1]
-    output_file = sys.argv[2]
+    input_file = arguments[0]
+    output_file = arguments[1]
+    
+    try:
+        workers = int(options.get("workers", 0)) or None
+    except ValueError:
+        workers = -1
+    if workers is not None and workers < 1:
+        print("Chyba: Počet procesov musí byť kladné celé číslo (--workers=N)")
+        return
     
     # Kontrola, či vstupný súbor existuje
     if not os.path.isfile(input_file):
@@ -241,15 +1006,10 @@ def main():
     if not input_file.endswith(('.docx')):
         print(f"Upozornenie: Vstupný súbor '{input_file}' nemusí byť Word dokument")
     
-    # Extrakcia údajov a formátovania tabuľky z Word dokumentu
-    table_data = extract_table_format_from_word(input_file)
-    
-    if not table_data:
-        print("Neboli nájdené žiadne údaje v tabuľke.")
-        return
-    
-    # Vytvorenie formátovanej tabuľky
-    create_formatted_table(table_data, output_file, os.path.basename(input_file))
+    run_measured(os.path.basename(input_file), options,
+                 format_word_tables, input_file, output_file,
+                 all_tables=bool(options.get("all-tables")), workers=workers,
+                 incremental=bool(options.get("incremental")))
 
 
 if __name__ == "__main__":